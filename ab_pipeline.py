@@ -1,16 +1,66 @@
-from pipelines.ab_pipeline import ab_test_pipeline
+from pipelines.ab_pipeline import ab_test_pipeline, abn_test_pipeline
 import argparse
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
-    parser.add_argument("--flow_version_a", type=str, required=True)
-    parser.add_argument("--flow_version_b", type=str, required=True)
+    parser.add_argument("--flow_version_a", type=str, default=None)
+    parser.add_argument("--flow_version_b", type=str, default=None)
+    parser.add_argument(
+        "--flow_versions",
+        type=str,
+        nargs="+",
+        default=None,
+        help="A/B/n test of these flow versions (the first one is the control)",
+    )
+    parser.add_argument(
+        "--weights",
+        type=float,
+        nargs="+",
+        default=None,
+        help="Traffic weight of each flow version (equal by default)",
+    )
     parser.add_argument("--test_id", type=str, default="abtest_001")
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Score in batches and stop as soon as the sequential test decides",
+    )
+    parser.add_argument("--batch_size", type=int, default=1000)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument(
+        "--mde",
+        type=float,
+        default=0.01,
+        help="Minimum detectable accuracy difference, smaller ones stop for futility",
+    )
     args = parser.parse_args()
 
+    if args.flow_versions is None and None in (
+        args.flow_version_a,
+        args.flow_version_b,
+    ):
+        parser.error(
+            "--flow_version_a and --flow_version_b (or --flow_versions) are required"
+        )
+    if args.flow_versions is not None and args.sequential:
+        parser.error(
+            "--sequential is only supported for two flow versions, not --flow_versions"
+        )
+    if args.weights is not None and len(args.weights) != len(args.flow_versions or []):
+        parser.error("--weights needs one weight per flow version in --flow_versions")
+
 if __name__ == "__main__":
-    ab_test_pipeline(
-        flow_version_a=args.flow_version_a,
-        flow_version_b=args.flow_version_b,
-        test_id=args.test_id,
-    )
+    if args.flow_versions is not None:
+        abn_test_pipeline(
+            flow_versions=args.flow_versions, test_id=args.test_id, weights=args.weights
+        )
+    else:
+        ab_test_pipeline(
+            flow_version_a=args.flow_version_a,
+            flow_version_b=args.flow_version_b,
+            test_id=args.test_id,
+            sequential=args.sequential,
+            batch_size=args.batch_size,
+            alpha=args.alpha,
+            mde=args.mde,
+        )
@@ -0,0 +1,24 @@
+from pipelines.batch_inference_pipeline import batch_inference_pipeline
+import argparse
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--flow_version", type=str, required=True)
+    parser.add_argument("--split_name", type=str, default="current_set")
+    parser.add_argument(
+        "--output_path",
+        type=str,
+        default=None,
+        help="Parquet file of (ID, prediction), data/predictions/<flow_version>_<split>.parquet by default",
+    )
+    parser.add_argument("--chunk_size", type=int, default=100_000)
+    parser.add_argument("--n_workers", type=int, default=None)
+    args = parser.parse_args()
+
+    batch_inference_pipeline(
+        flow_version=args.flow_version,
+        split_name=args.split_name,
+        output_path=args.output_path,
+        chunk_size=args.chunk_size,
+        n_workers=args.n_workers,
+    )
@@ -1,20 +1,142 @@
+import argparse
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
+from scripts.data_io import (
+    save_split,
+    SplitWriter,
+    SATISFACTION_COLUMNS,
+    CATEGORICAL_COLUMNS,
+)
+from scripts.dataset_registry import register_splits
+from scripts.preprocessing import AirlinePreprocessor, PREPROCESSOR_FILE
+
+GOLDEN_FRACTION = 0.4
+GOLDEN_TEST_SIZE = 0.2
+
+STRAT_COLS = [
+    "Satisfaction",
+    "Customer Type",
+    "New Class",
+    "Type of Travel",
+    "Gender",
+]
+# "New Class" merges Economy Plus into Economy (see docs/Task_1.md)
+CLASS_MERGE = {"Economy Plus": "Economy"}
+STRAT_SOURCE_COLS = ["Class" if col == "New Class" else col for col in STRAT_COLS]
+
+# Edge cases that always go to the golden set. A rule matches a row when the comparison holds for
+# any (or all, with "how": "all") of its columns; a row is an edge case if any rule matches.
+EDGE_CASE_RULES = [
+    # Delays > 3 hours are legally relevant for compensation
+    {
+        "name": "high_delay",
+        "columns": ["Departure Delay", "Arrival Delay"],
+        "op": ">",
+        "value": 180,
+    },
+    {"name": "short_flight", "columns": ["Flight Distance"], "op": "<", "value": 100},
+    {"name": "long_flight", "columns": ["Flight Distance"], "op": ">", "value": 4000},
+    {
+        "name": "very_insatisfied",
+        "columns": SATISFACTION_COLUMNS,
+        "op": "<=",
+        "value": 2,
+        "how": "all",
+    },
+    # Here we have a problem with the data, as passengers under 18 shouldn't be taking a satisfaction survey
+    {"name": "too_young", "columns": ["Age"], "op": "<", "value": 18},
+    {"name": "too_old", "columns": ["Age"], "op": ">", "value": 80},
+]
+
+_OPS = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "==": np.equal,
+}
+
+
+def compile_edge_case_rules(rules: list[dict]):
+    """Compile edge case rules into one function returning the combined boolean mask of a DataFrame.
+
+    All columns used by the rules are converted to a single float matrix once, each rule is a
+    vectorized comparison on a slice of it, and the results are OR-ed into one mask.
+    """
+    columns = list(dict.fromkeys(col for rule in rules for col in rule["columns"]))
+    compiled = []
+    for rule in rules:
+        if rule["op"] not in _OPS:
+            raise ValueError(
+                f"Unknown operator in edge case rule {rule['name']}: {rule['op']}"
+            )
+        how = rule.get("how", "any")
+        if how not in ("any", "all"):
+            raise ValueError(f"Unknown 'how' in edge case rule {rule['name']}: {how}")
+        positions = [columns.index(col) for col in rule["columns"]]
+        compiled.append((positions, _OPS[rule["op"]], rule["value"], how))
+
+    def edge_case_mask(df: pd.DataFrame) -> np.ndarray:
+        values = df[columns].to_numpy(dtype=float)
+        mask = np.zeros(len(df), dtype=bool)
+        for positions, op, value, how in compiled:
+            # NaN never satisfies a comparison, same as pandas
+            hits = op(values[:, positions], value)
+            mask |= hits.any(axis=1) if how == "any" else hits.all(axis=1)
+        return mask
+
+    return edge_case_mask
+
+
+def strata_categories(df: pd.DataFrame) -> dict[str, list]:
+    """Sorted values of every stratification column."""
+    categories = {}
+    for col in STRAT_COLS:
+        values = df["Class"].replace(CLASS_MERGE) if col == "New Class" else df[col]
+        categories[col] = sorted(values.dropna().unique())
+    return categories
+
+
+def strata_codes(df: pd.DataFrame, categories: dict[str, list]) -> np.ndarray:
+    """Integer stratum of every row, combining the categorical codes of STRAT_COLS.
+
+    Codes are mixed-radix numbers over the given categories (missing values get their own code),
+    so they're stable across chunks encoded with the same categories and lie in [0, n_strata(...)).
+    """
+    codes = np.zeros(len(df), dtype=np.int64)
+    for col in STRAT_COLS:
+        values = df["Class"].replace(CLASS_MERGE) if col == "New Class" else df[col]
+        col_codes = pd.Categorical(values, categories=categories[col]).codes
+        codes = codes * (len(categories[col]) + 1) + (col_codes.astype(np.int64) + 1)
+    return codes
+
+
+def n_strata(categories: dict[str, list]) -> int:
+    return int(np.prod([len(categories[col]) + 1 for col in STRAT_COLS]))
 
 
 class AirlineDataManager:
-    def __init__(self, data_path: str, output_dir: str = "data/processed"):
+    def __init__(
+        self,
+        data_path: str,
+        output_dir: str = "data/processed",
+        chunksize: int | None = None,
+    ):
         self.data_path = Path(data_path)
         self.output_dir = Path(output_dir)
+        # When set, the raw export is streamed in chunks of this many rows instead of loaded at once
+        self.chunksize = chunksize
         self.df = None
         self.golden_set = None
         self.current_set = None
         self.golden_train = None
         self.golden_test = None
-        self._load_data()
+        self.preprocessor = None
+        self._edge_case_mask = compile_edge_case_rules(EDGE_CASE_RULES)
+        if self.chunksize is None:
+            self._load_data()
 
     def _load_data(self):
         self.df = pd.read_csv(self.data_path)
@@ -24,115 +146,57 @@ class AirlineDataManager:
         """Extract a representative golden set from the dataset."""
         df = self.df.copy()
 
-        satisfaction_cols = [
-            "Departure and Arrival Time Convenience",
-            "Ease of Online Booking",
-            "Check-in Service",
-            "Online Boarding",
-            "Gate Location",
-            "On-board Service",
-            "Seat Comfort",
-            "Leg Room Service",
-            "Cleanliness",
-            "Food and Drink",
-            "In-flight Service",
-            "In-flight Wifi Service",
-            "In-flight Entertainment",
-            "Baggage Handling",
-        ]
         # make sure all satisfaction columns are numeric --> make them float (to avoid confusion between str and int: evidently doesn't like it)
-        df[satisfaction_cols] = df[satisfaction_cols].astype(float)
-
-        very_insatisfied = df[df[satisfaction_cols].le(2).all(axis=1)]
+        df[SATISFACTION_COLUMNS] = df[SATISFACTION_COLUMNS].astype(float)
 
-        # Here we have a problem with the data, as passengers under 18 shouldn't be taking a satisfaction survey
-        extreme_age = df[(df["Age"] < 18) | (df["Age"] > 80)]
-
-        high_delay = df[(df["Departure Delay"] > 180) | (df["Arrival Delay"] > 180)]
-        extreme_distance = df[
-            (df["Flight Distance"] < 100) | (df["Flight Distance"] > 4000)
-        ]
-
-        # Combine all edge cases (no duplicates)
-        edge_cases = pd.concat(
-            [high_delay, extreme_distance, very_insatisfied, extreme_age]
-        ).drop_duplicates()
+        # All edge cases in a single mask (a row matching several rules is only taken once)
+        edge_mask = self._edge_case_mask(df)
+        edge_cases = df[edge_mask]
 
         # Remove edge cases from original to avoid duplicate sampling
-        df_remaining = df.drop(edge_cases.index)
+        df_remaining = df[~edge_mask]
 
         # === STRATIFIED SAMPLING FOR REPRESENTATIVE GOLDEN SET ===
 
         # We’ll sample a balanced stratified subset from remaining data
         # Note: this assumes ~40% of the original dataset size is a reasonable size for golden test set
-        strat_cols = [
-            "Satisfaction",
-            "Customer Type",
-            "New Class",
-            "Type of Travel",
-            "Gender",
-        ]
-
-        # To use sklearn’s train_test_split for stratification, combine these cols
-        df_remaining["New Class"] = df_remaining["Class"].replace(
-            {"Economy Plus": "Economy"}
-        )
-        df_remaining["strata"] = (
-            df_remaining[strat_cols].astype(str).agg("-".join, axis=1)
-        )
+
+        # To use sklearn’s train_test_split for stratification, combine these cols into integer strata
+        strata = strata_codes(df_remaining, strata_categories(df_remaining))
 
         # Choose size of golden set excluding edge cases
-        n_golden_regular = int(df.shape[0] * 0.4)
+        n_golden_regular = int(df.shape[0] * GOLDEN_FRACTION)
         golden_regular, rest = train_test_split(
             df_remaining,
-            stratify=df_remaining["strata"],
+            stratify=strata,
             test_size=(len(df_remaining) - n_golden_regular),
             random_state=42,
         )
 
-        # Remove the strata column
-        golden_regular = golden_regular.drop(columns=["strata", "New Class"])
-        rest = rest.drop(columns=["strata", "New Class"])
-
-        # Combine with edge cases to form final golden set
-        self.golden_set = pd.concat([golden_regular, edge_cases]).drop_duplicates()
+        # Combine with edge cases to form final golden set (disjoint by construction)
+        self.golden_set = pd.concat([golden_regular, edge_cases])
         self.current_set = rest
 
         print(
             f"✅ Golden set: {self.golden_set.shape}, Current set: {self.current_set.shape}"
         )
 
-    def preprocess(self, df: pd.DataFrame) -> pd.DataFrame:
+    def preprocess(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """Preprocess the dataset by handling missing values and encoding categorical variables."""
-        df = df.copy()
-
-        # Handling missing values on Arrival Delay
-        nan_df = df[df["Arrival Delay"].isna()]
-        if len(nan_df) > 0:
-            # Fill missing values with Departure Delay + some random noise
-            # to avoid overfitting (+- * 0.2)
-            alpha = np.random.uniform(0.9, 1.1, len(nan_df))
-            df.loc[df["Arrival Delay"].isna(), "Arrival Delay"] = (
-                df.loc[df["Arrival Delay"].isna(), "Departure Delay"] * alpha
-            ).astype(int)
-
-        df["Satisfaction"] = df["Satisfaction"].apply(
-            lambda x: 1 if x == "Satisfied" else 0
-        )
-        for col in ["Gender", "Customer Type", "Type of Travel", "Class"]:
-            df[col] = LabelEncoder().fit_transform(df[col])
-
-        return df
+        return self.preprocessor.transform(df, copy=copy)
 
     def preprocess_sets(self):
-        self.golden_set = self.preprocess(self.golden_set)
-        self.current_set = self.preprocess(self.current_set)
+        # Fit the encoding once on the golden set so that every dataset shares the same codes
+        self.preprocessor = AirlinePreprocessor().fit(self.golden_set)
+        # Both sets are fresh frames owned by the manager, no need to copy them again
+        self.golden_set = self.preprocess(self.golden_set, copy=False)
+        self.current_set = self.preprocess(self.current_set, copy=False)
         print("✅ Preprocessing complete for golden and current sets.")
 
     def split_golden_train_test(self):
         df = self.golden_set.copy()
         self.golden_train, self.golden_test = train_test_split(
-            df, test_size=0.2, random_state=42
+            df, test_size=GOLDEN_TEST_SIZE, random_state=42
         )
         print(
             f"✅ Golden train: {self.golden_train.shape}, Golden test: {self.golden_test.shape}"
@@ -140,13 +204,146 @@ class AirlineDataManager:
 
     def save_all(self):
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.golden_train.to_csv(self.output_dir / "golden_train.csv", index=False)
-        self.golden_test.to_csv(self.output_dir / "golden_test.csv", index=False)
-        self.golden_set.to_csv(self.output_dir / "golden_set.csv", index=False)
-        self.current_set.to_csv(self.output_dir / "current_set.csv", index=False)
+        save_split(self.golden_train, "golden_train", self.output_dir)
+        save_split(self.golden_test, "golden_test", self.output_dir)
+        save_split(self.golden_set, "golden_set", self.output_dir)
+        save_split(self.current_set, "current_set", self.output_dir)
+        self.preprocessor.save(self.output_dir / PREPROCESSOR_FILE)
+        register_splits(data_dir=self.output_dir)
+        print(f"✅ Saved all splits to {self.output_dir}")
+
+    # === STREAMING (OUT-OF-CORE) MODE ===
+
+    def _read_chunks(self):
+        for chunk in pd.read_csv(self.data_path, chunksize=self.chunksize):
+            chunk[SATISFACTION_COLUMNS] = chunk[SATISFACTION_COLUMNS].astype(float)
+            yield chunk
+
+    def _scan_strata(self) -> tuple[np.ndarray, dict[str, list], int, int]:
+        """First pass: count rows per stratum (edge cases excluded) and collect the categories."""
+        categories = {col: set() for col in CATEGORICAL_COLUMNS + STRAT_COLS}
+        combo_counts = []
+        n_rows, n_edge = 0, 0
+
+        for chunk in self._read_chunks():
+            edge_mask = self._edge_case_mask(chunk)
+            for col in CATEGORICAL_COLUMNS:
+                categories[col].update(chunk[col].dropna().unique())
+            for col, values in strata_categories(chunk).items():
+                categories[col].update(values)
+
+            # Strata codes need the final categories: keep the (small) counts per value combination
+            combo_counts.append(
+                chunk[~edge_mask]
+                .value_counts(subset=STRAT_SOURCE_COLS, dropna=False)
+                .reset_index()
+            )
+            n_rows += len(chunk)
+            n_edge += int(edge_mask.sum())
+
+        # Sorted like AirlinePreprocessor.fit, so codes match the in-memory mode
+        categories = {col: sorted(values) for col, values in categories.items()}
+
+        combos = pd.concat(combo_counts, ignore_index=True)
+        counts = np.bincount(
+            strata_codes(combos, categories),
+            weights=combos["count"],
+            minlength=n_strata(categories),
+        ).astype(np.int64)
+        return counts, categories, n_rows, n_edge
+
+    @staticmethod
+    def _allocate_quotas(counts: np.ndarray, n_samples: int) -> np.ndarray:
+        """Split n_samples across strata proportionally to their size (largest remainder)."""
+        # Every row is an edge case: there is nothing to sample from
+        if counts.sum() == 0:
+            return np.zeros_like(counts)
+        exact = counts * n_samples / counts.sum()
+        quotas = np.floor(exact).astype(np.int64)
+        remainder = n_samples - int(quotas.sum())
+        quotas[np.argsort(quotas - exact, kind="stable")[:remainder]] += 1
+        return quotas
+
+    def run_streaming(self):
+        """Build and save all splits from the raw export in bounded-memory chunks.
+
+        A first pass counts the non-edge rows per stratum. The second pass routes edge cases to the
+        golden set and draws, per stratum, a uniform sample of the allocated size without replacement:
+        the number of rows taken from each chunk is drawn from a hypergeometric distribution given the
+        quota and population left (a chunked form of selection/reservoir sampling). Golden rows are
+        split into train/test the same way, and every chunk is written out before the next is read.
+        """
+        counts, categories, n_rows, n_edge = self._scan_strata()
+        print(f"✅ Scanned {self.data_path} in chunks, rows: {n_rows}")
+
+        n_golden_regular = min(int(n_rows * GOLDEN_FRACTION), int(counts.sum()))
+        quota_left = self._allocate_quotas(counts, n_golden_regular)
+        population_left = counts.copy()
+
+        n_golden = n_edge + n_golden_regular
+        test_left = int(np.ceil(n_golden * GOLDEN_TEST_SIZE))
+        golden_left = n_golden
+
+        # Categories of the whole export, so every chunk is encoded with the same codes
+        self.preprocessor = AirlinePreprocessor(
+            {col: categories[col] for col in CATEGORICAL_COLUMNS}
+        )
+
+        rng = np.random.default_rng(42)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with (
+            SplitWriter("golden_train", self.output_dir) as train_writer,
+            SplitWriter("golden_test", self.output_dir) as test_writer,
+            SplitWriter("golden_set", self.output_dir) as golden_writer,
+            SplitWriter("current_set", self.output_dir) as current_writer,
+        ):
+            for chunk in self._read_chunks():
+                in_golden = self._edge_case_mask(chunk)
+
+                # Group the regular rows of the chunk by stratum with one sort of the integer codes
+                regular_pos = np.flatnonzero(~in_golden)
+                codes = strata_codes(chunk.iloc[regular_pos], categories)
+                order = np.argsort(codes, kind="stable")
+                present, starts = np.unique(codes[order], return_index=True)
+                for stratum, rows in zip(present, np.split(order, starts[1:])):
+                    quota, population = quota_left[stratum], population_left[stratum]
+                    k = rng.hypergeometric(quota, population - quota, len(rows))
+                    picked = rng.choice(rows, size=k, replace=False)
+                    in_golden[regular_pos[picked]] = True
+                    quota_left[stratum] -= k
+                    population_left[stratum] -= len(rows)
+
+                # The chunk is only read from here on, encode it in place
+                chunk = self.preprocess(chunk, copy=False)
+
+                # Shuffle golden rows like train_test_split does before drawing the test rows
+                golden = chunk[in_golden].sample(frac=1, random_state=rng)
+                k_test = rng.hypergeometric(
+                    test_left, golden_left - test_left, len(golden)
+                )
+                in_test = np.zeros(len(golden), dtype=bool)
+                in_test[rng.choice(len(golden), size=k_test, replace=False)] = True
+                test_left -= k_test
+                golden_left -= len(golden)
+
+                golden_writer.write(golden)
+                train_writer.write(golden[~in_test])
+                test_writer.write(golden[in_test])
+                current_writer.write(chunk[~in_golden])
+
+        self.preprocessor.save(self.output_dir / PREPROCESSOR_FILE)
+        register_splits(data_dir=self.output_dir)
+        print(
+            f"✅ Golden set: {golden_writer.rows}, Current set: {current_writer.rows}, "
+            f"Golden train: {train_writer.rows}, Golden test: {test_writer.rows}"
+        )
         print(f"✅ Saved all splits to {self.output_dir}")
 
     def run_all(self):
+        if self.chunksize is not None:
+            self.run_streaming()
+            return
+
         self.split_golden_and_current()
         self.preprocess_sets()
         self.split_golden_train_test()
@@ -154,5 +351,17 @@ class AirlineDataManager:
 
 
 if __name__ == "__main__":
-    manager = AirlineDataManager("data/airline_passenger_satisfaction.csv")
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--data_path", type=str, default="data/airline_passenger_satisfaction.csv"
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Stream the raw export in chunks of this many rows (out-of-core mode)",
+    )
+    args = parser.parse_args()
+
+    manager = AirlineDataManager(args.data_path, chunksize=args.chunksize)
     manager.run_all()
@@ -1,4 +1,54 @@
 from pipelines.monitoring_pipeline import monitoring_pipeline
+from steps.windowed_drift import check_window_args
+import argparse
 
 if __name__ == "__main__":
-    monitoring_pipeline()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--flow_version", type=str, required=True)
+    parser.add_argument(
+        "--window_size",
+        type=int,
+        default=None,
+        help="Also score drift on windows of this many rows",
+    )
+    parser.add_argument(
+        "--time_column",
+        type=str,
+        default=None,
+        help="Build time-based windows on this column instead (with --window_freq)",
+    )
+    parser.add_argument("--window_freq", type=str, default=None)
+    parser.add_argument(
+        "--timestamps_path",
+        type=str,
+        default=None,
+        help="CSV/Feather file with the ID and --time_column of every unseen row",
+    )
+    parser.add_argument("--max_workers", type=int, default=None)
+    parser.add_argument(
+        "--sample_size",
+        type=int,
+        default=None,
+        help="Approximate drift on a stratified sample of this many rows",
+    )
+    args = parser.parse_args()
+    if args.window_size is not None or args.time_column is not None:
+        try:
+            check_window_args(
+                args.window_size,
+                args.time_column,
+                args.window_freq,
+                args.timestamps_path,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+
+    monitoring_pipeline(
+        flow_version=args.flow_version,
+        window_size=args.window_size,
+        time_column=args.time_column,
+        window_freq=args.window_freq,
+        max_workers=args.max_workers,
+        sample_size=args.sample_size,
+        timestamps_path=args.timestamps_path,
+    )
@@ -1,17 +1,46 @@
 from zenml import pipeline
 from steps.load_unseen_data import load_unseen_data_step
-from steps.split_for_ab_test import split_for_ab_test
+from steps.split_for_ab_test import split_for_ab_test, split_for_abn_test
 from steps.predict_model_version import predict_with_model_versionid
-from steps.ab_test import ab_test_step
+from steps.predict_arms import predict_arms_step
+from steps.ab_test import ab_test_step, abn_test_step
+from steps.sequential_ab_test import sequential_ab_test_step
+from scripts.dataset_registry import split_fingerprint
 
 
 @pipeline
-def ab_test_pipeline(flow_version_a: str, flow_version_b: str, test_id: str):
-    """Pipeline for A/B testing of two model versions."""
-    test_df = load_unseen_data_step()
+def ab_test_pipeline(
+    flow_version_a: str,
+    flow_version_b: str,
+    test_id: str,
+    sequential: bool = False,
+    batch_size: int = 1000,
+    alpha: float = 0.05,
+    mde: float = 0.01,
+):
+    """Pipeline for A/B testing of two model versions.
+
+    In sequential mode the arms are scored batch by batch until the sequential test reaches a decision.
+    """
+    test_df = load_unseen_data_step(fingerprint=split_fingerprint("current_set"))
 
     X_a, X_b, y_a, y_b = split_for_ab_test(test_df)
 
+    if sequential:
+        sequential_ab_test_step(
+            X_a,
+            X_b,
+            y_a,
+            y_b,
+            flow_version_a=flow_version_a,
+            flow_version_b=flow_version_b,
+            test_id=test_id,
+            batch_size=batch_size,
+            alpha=alpha,
+            mde=mde,
+        )
+        return
+
     model_uri_a, preds_a = predict_with_model_versionid(X_a, flow_version_a)
     model_uri_b, preds_b = predict_with_model_versionid(X_b, flow_version_b)
 
@@ -24,3 +53,25 @@ def ab_test_pipeline(flow_version_a: str, flow_version_b: str, test_id: str):
         model_uri_b=model_uri_b,
         test_id=test_id,
     )
+
+
+@pipeline
+def abn_test_pipeline(
+    flow_versions: list[str], test_id: str, weights: list[float] | None = None
+):
+    """Pipeline for A/B/n testing of N model versions, with weighted hash routing of the traffic."""
+    weights = weights or [1.0] * len(flow_versions)
+    test_df = load_unseen_data_step(fingerprint=split_fingerprint("current_set"))
+
+    X, y, offsets = split_for_abn_test(test_df, weights)
+
+    model_uris, preds = predict_arms_step(X, offsets, flow_versions)
+
+    abn_test_step(
+        preds=preds,
+        labels=y,
+        offsets=offsets,
+        model_uris=model_uris,
+        weights=weights,
+        test_id=test_id,
+    )
@@ -0,0 +1,20 @@
+from zenml import pipeline
+from steps.batch_predict import batch_predict_step
+
+
+@pipeline
+def batch_inference_pipeline(
+    flow_version: str,
+    split_name: str = "current_set",
+    output_path: str | None = None,
+    chunk_size: int = 100_000,
+    n_workers: int | None = None,
+):
+    """Pipeline for chunked, multi-process scoring of a processed split with a trained flow version."""
+    batch_predict_step(
+        flow_version,
+        split_name=split_name,
+        output_path=output_path,
+        chunk_size=chunk_size,
+        n_workers=n_workers,
+    )
@@ -1,11 +1,49 @@
 from zenml import pipeline
-from steps.load_train_data import load_train_data_step
+from steps.load_reference_profile import load_reference_profile_step
 from steps.load_unseen_data import load_unseen_data_step
 from steps.drift_tests import drift_test_step
+from steps.windowed_drift import windowed_drift_step
+from scripts.dataset_registry import split_fingerprint
+from scripts.mlflow_utils import resolve_run_id
 
 
 @pipeline
-def monitoring_pipeline():
-    train_data, _, _, _ = load_train_data_step()
-    unseen_data = load_unseen_data_step()
-    drift_test_step(train_data, unseen_data)
+def monitoring_pipeline(
+    flow_version: str,
+    window_size: int | None = None,
+    time_column: str | None = None,
+    window_freq: str | None = None,
+    max_workers: int | None = None,
+    sample_size: int | None = None,
+    timestamps_path: str | None = None,
+):
+    """Pipeline for drift detection of the unseen data against a trained model's reference profile.
+
+    If a window size (or a time column, frequency and timestamps file) is given, drift is also
+    scored per window.
+    If a sample size is given, the whole-set drift test runs in approximate (sampled) mode.
+    """
+    # Resolved here so that the profile load (and the drift test) are cached per model run
+    reference_profile = load_reference_profile_step(run_id=resolve_run_id(flow_version))
+    unseen_data = load_unseen_data_step(fingerprint=split_fingerprint("current_set"))
+
+    if window_size is None and time_column is None:
+        drift_test_step(reference_profile, unseen_data, sample_size=sample_size)
+        return
+
+    # Log the per-window table first, the whole-set test fails the run on drift
+    windowed_drift_step(
+        reference_profile,
+        unseen_data,
+        window_size=window_size,
+        time_column=time_column,
+        window_freq=window_freq,
+        max_workers=max_workers,
+        timestamps_path=timestamps_path,
+    )
+    drift_test_step(
+        reference_profile,
+        unseen_data,
+        sample_size=sample_size,
+        after="windowed_drift_step",
+    )
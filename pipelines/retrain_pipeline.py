@@ -0,0 +1,24 @@
+from zenml import pipeline
+from steps.load_current_batch import load_current_batch_step
+from steps.incremental_retrain import incremental_retrain_step
+
+
+@pipeline
+def incremental_retrain_pipeline(
+    base_flow_version: str,
+    new_flow_version: str,
+    batch_path: str | None = None,
+    batch_start: int = 0,
+    batch_stop: int | None = None,
+    n_new_trees: int = 50,
+    max_estimators: int | None = None,
+):
+    """Pipeline for extending a trained model with a new batch of labelled current data."""
+    batch = load_current_batch_step(batch_path, start=batch_start, stop=batch_stop)
+    incremental_retrain_step(
+        batch,
+        base_flow_version=base_flow_version,
+        new_flow_version=new_flow_version,
+        n_new_trees=n_new_trees,
+        max_estimators=max_estimators,
+    )
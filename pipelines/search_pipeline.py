@@ -0,0 +1,30 @@
+from zenml import pipeline
+from steps.load_train_data import load_train_data_step
+from steps.train_model import TrainConfig
+from steps.successive_halving import successive_halving_step
+from scripts.dataset_registry import splits_fingerprint
+
+
+@pipeline
+def search_pipeline(
+    configs: list[TrainConfig],
+    search_id: str,
+    flow_version: str,
+    eta: int = 3,
+    min_fraction: float | None = None,
+):
+    """Pipeline for a successive-halving search, the winner is registered as a new flow version."""
+    X_train, X_test, y_train, y_test = load_train_data_step(
+        fingerprint=splits_fingerprint(["golden_train", "golden_test"])
+    )
+    successive_halving_step(
+        X_train=X_train,
+        X_test=X_test,
+        y_train=y_train,
+        y_test=y_test,
+        configs=configs,
+        search_id=search_id,
+        flow_version=flow_version,
+        eta=eta,
+        min_fraction=min_fraction,
+    )
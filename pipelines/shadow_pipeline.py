@@ -0,0 +1,21 @@
+from zenml import pipeline
+from steps.load_unseen_data import load_unseen_data_step
+from steps.shadow_scoring import shadow_scoring_step
+from scripts.dataset_registry import split_fingerprint
+
+
+@pipeline
+def shadow_pipeline(
+    champion_flow_version: str,
+    challenger_flow_version: str,
+    batch_size: int = 10_000,
+):
+    """Pipeline for shadow testing: the challenger scores all the traffic next to the served champion."""
+    test_df = load_unseen_data_step(fingerprint=split_fingerprint("current_set"))
+
+    shadow_scoring_step(
+        test_df,
+        champion_flow_version=champion_flow_version,
+        challenger_flow_version=challenger_flow_version,
+        batch_size=batch_size,
+    )
@@ -0,0 +1,24 @@
+from zenml import pipeline
+from steps.load_train_data import load_train_data_step
+from steps.train_model import TrainConfig
+from steps.train_sweep import train_sweep_step
+from scripts.dataset_registry import splits_fingerprint
+
+
+@pipeline
+def sweep_pipeline(
+    configs: list[TrainConfig], sweep_id: str, n_workers: int | None = None
+):
+    """Pipeline for training many candidate configs in parallel on data loaded once."""
+    X_train, X_test, y_train, y_test = load_train_data_step(
+        fingerprint=splits_fingerprint(["golden_train", "golden_test"])
+    )
+    train_sweep_step(
+        X_train=X_train,
+        X_test=X_test,
+        y_train=y_train,
+        y_test=y_test,
+        configs=configs,
+        sweep_id=sweep_id,
+        n_workers=n_workers,
+    )
@@ -1,22 +1,30 @@
 from zenml import pipeline
 from steps.data_validation import data_validation_step
 from steps.train_model import train_model_step, TrainConfig
+from steps.export_compiled_model import export_compiled_model_step
 from steps.robustness_test import robustness_test_step
 from steps.load_predeploy_data import load_predeploy_data_step
-from steps.load_train_data import load_train_data_step
+from steps.load_feature_matrix import load_feature_matrix_step
+from scripts.dataset_registry import splits_fingerprint
 
 
 @pipeline
 def airline_pipeline(config: TrainConfig):
-    """Pipeline for training a model on airline passenger satisfaction data."""
-    data_ref, data_cur = load_predeploy_data_step()
+    """Pipeline for training a model on airline passenger satisfaction data.
+
+    The loaders get the fingerprints of their splits, so loading and validating unchanged data are
+    cache hits.
+    """
+    data_ref, data_cur = load_predeploy_data_step(
+        fingerprint=splits_fingerprint(["golden_set", "current_set"])
+    )
     data_validation_step(data_ref=data_ref, data_cur=data_cur)
-    X_train, X_test, y_train, y_test = load_train_data_step()
+    # Train/test data are passed as memory-mapped float32 matrices, not as DataFrame artifacts
+    train_matrix, test_matrix = load_feature_matrix_step()
     trained_model = train_model_step(
-        X_train=X_train,
-        X_test=X_test,
-        y_train=y_train,
-        y_test=y_test,
+        train_matrix=train_matrix,
+        test_matrix=test_matrix,
         config=config,
     )
-    robustness_test_step(trained_model, X_train, X_test, y_train, y_test)
+    robustness_test_step(trained_model, train_matrix, test_matrix)
+    export_compiled_model_step(trained_model, test_matrix)
@@ -0,0 +1,33 @@
+from pipelines.retrain_pipeline import incremental_retrain_pipeline
+import argparse
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base_flow_version", type=str, required=True)
+    parser.add_argument("--new_flow_version", type=str, required=True)
+    parser.add_argument(
+        "--batch_path",
+        type=str,
+        default=None,
+        help="CSV or Feather file of labelled rows (rows of the current set by default)",
+    )
+    parser.add_argument("--batch_start", type=int, default=0)
+    parser.add_argument("--batch_stop", type=int, default=None)
+    parser.add_argument("--n_new_trees", type=int, default=50)
+    parser.add_argument(
+        "--max_estimators",
+        type=int,
+        default=None,
+        help="Drop the oldest trees beyond this size",
+    )
+    args = parser.parse_args()
+
+    incremental_retrain_pipeline(
+        base_flow_version=args.base_flow_version,
+        new_flow_version=args.new_flow_version,
+        batch_path=args.batch_path,
+        batch_start=args.batch_start,
+        batch_stop=args.batch_stop,
+        n_new_trees=args.n_new_trees,
+        max_estimators=args.max_estimators,
+    )
@@ -44,7 +44,7 @@ echo "🚀 Running training pipeline (version 2)..."
 python train_pipeline.py --flow-version "$flow2" --max_depth 10 --n_estimators 200
 
 echo "🔍 Running monitoring (drift detection) pipeline..."
-python monitor_pipeline.py
+python monitor_pipeline.py --flow_version="$flow2"
 
 echo "📈 Running A/B test..."
 test_id="${flow1}_${flow2}_$(date +%s)"
@@ -1,2 +1,2 @@
 python data_manager.py
-pytest scripts/task1.py -W ignore::pytest.PytestCollectionWarning
\ No newline at end of file
+python -m pytest scripts/task1.py -W ignore::pytest.PytestCollectionWarning
\ No newline at end of file
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+from scripts.data_io import ID_COLUMN, TARGET_COLUMN
+
+# Weighted traffic routing of the A/B/n test. Each row goes to an arm by a hash of its ID, so a
+# passenger always sees the same model for the same weights, whatever the order or batch of the rows.
+
+
+def route_by_hash(ids: pd.Series | np.ndarray, weights: list[float]) -> np.ndarray:
+    """Stable arm index of every ID, each arm getting its share of the traffic.
+
+    The hash of an ID is mapped to [0, 1) and looked up in the cumulative weights, so an ID always
+    goes to the same arm for the same weights.
+    """
+    weights = np.asarray(weights, dtype=float)
+    bounds = np.cumsum(weights / weights.sum())[:-1]
+    position = pd.util.hash_array(np.asarray(ids)) / np.float64(2**64)
+    return np.searchsorted(bounds, position, side="right")
+
+
+def group_by_arm(
+    df: pd.DataFrame, weights: list[float]
+) -> tuple[pd.DataFrame, pd.Series, list[int]]:
+    """Reorder the rows by arm with a single take, returns features, labels and arm offsets.
+
+    Arm i is the contiguous block offsets[i]:offsets[i + 1] of the features.
+    """
+    arms = route_by_hash(df[ID_COLUMN], weights)
+    order = np.argsort(arms, kind="stable")
+    offsets = np.searchsorted(arms[order], np.arange(len(weights) + 1)).tolist()
+
+    X = df.take(order)
+    X.pop(ID_COLUMN)
+    y = X.pop(TARGET_COLUMN)
+    return X, y, offsets
@@ -0,0 +1,86 @@
+import numpy as np
+
+# Bootstrap of the A/B metrics on confusion-matrix counts. Accuracy and F1 only depend on the
+# (tp, fp, fn, tn) counts, and resampling n rows with replacement draws these counts from a
+# multinomial with the observed cell shares. So all resamples of an arm are one
+# rng.multinomial call, whatever the number of rows.
+
+METRICS = ("accuracy", "f1_score")
+
+
+def confusion_counts(labels, preds) -> np.ndarray:
+    """(tp, fp, fn, tn) of binary labels and predictions."""
+    labels = np.asarray(labels).astype(bool)
+    preds = np.asarray(preds).astype(bool)
+    tp = np.sum(labels & preds)
+    fp = np.sum(~labels & preds)
+    fn = np.sum(labels & ~preds)
+    return np.array([tp, fp, fn, len(labels) - tp - fp - fn])
+
+
+def metrics_from_counts(counts: np.ndarray) -> dict[str, np.ndarray]:
+    """Accuracy and F1 of one or many (..., 4) confusion count vectors."""
+    tp, fp, fn, tn = np.moveaxis(np.asarray(counts, dtype=float), -1, 0)
+    f1_denominator = 2 * tp + fp + fn
+    return {
+        "accuracy": (tp + tn) / (tp + fp + fn + tn),
+        "f1_score": np.divide(
+            2 * tp,
+            f1_denominator,
+            out=np.zeros_like(f1_denominator),
+            where=f1_denominator > 0,
+        ),
+    }
+
+
+def bootstrap_ab_metrics(
+    labels_a,
+    preds_a,
+    labels_b,
+    preds_b,
+    n_resamples: int = 10_000,
+    confidence: float = 0.95,
+    random_state: int = 42,
+) -> dict:
+    """Percentile bootstrap CIs of each arm's metrics and of the A - B difference, with its p-value.
+
+    The p-value is two-sided: twice the share of resampled differences on the smaller side of 0
+    (with the usual +1 correction, so it is never below 2 / (n_resamples + 1)).
+    """
+    rng = np.random.default_rng(random_state)
+    quantiles = [(1 - confidence) / 2, (1 + confidence) / 2]
+
+    resampled = {}
+    for arm, labels, preds in (("A", labels_a, preds_a), ("B", labels_b, preds_b)):
+        counts = confusion_counts(labels, preds)
+        if counts.sum() == 0:
+            raise ValueError(f"Cannot bootstrap arm {arm}: it has no rows")
+        # The two arms are independent samples, each is resampled on its own
+        resampled[arm] = metrics_from_counts(
+            rng.multinomial(counts.sum(), counts / counts.sum(), size=n_resamples)
+        )
+
+    results = {}
+    for metric in METRICS:
+        a, b = resampled["A"][metric], resampled["B"][metric]
+        difference = a - b
+        p_value = (
+            2
+            * (min(np.sum(difference <= 0), np.sum(difference >= 0)) + 1)
+            / (n_resamples + 1)
+        )
+        results[metric] = {
+            "A": np.quantile(a, quantiles).tolist(),
+            "B": np.quantile(b, quantiles).tolist(),
+            "difference": {
+                "confidence_interval": np.quantile(difference, quantiles).tolist(),
+                "p_value": float(min(p_value, 1.0)),
+            },
+        }
+
+    return {
+        "method": "percentile bootstrap on confusion-matrix counts",
+        "n_resamples": n_resamples,
+        "confidence": confidence,
+        "metrics": results,
+    }
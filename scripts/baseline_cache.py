@@ -0,0 +1,53 @@
+import os
+import json
+import hashlib
+import joblib
+from pathlib import Path
+from mlflow.entities.model_registry import ModelVersion
+from scripts.mlflow_utils import latest_model_version
+
+# Content-addressed cache of the baseline's side of the robustness test. The baseline predictions
+# (clean and perturbed) only depend on the baseline model version, the test data and the perturbation
+# config, so they are stored under a key derived from all three and reused by every training run
+# that tests a new candidate against the same baseline, data and perturbations.
+
+BASELINE_MODEL_NAME = "LogisticRegression_baseline"
+BASELINE_CACHE_DIR = Path(__file__).resolve().parents[1] / "cache" / "baseline"
+
+
+def latest_baseline_version(name: str = BASELINE_MODEL_NAME) -> ModelVersion | None:
+    """Latest registered version of the baseline model, None if it was never registered."""
+    try:
+        return latest_model_version(name)
+    except ValueError:
+        return None
+
+
+class BaselineCache:
+    """Local cache entry of the baseline results for a (model version, data, perturbation config)."""
+
+    def __init__(
+        self,
+        model_version: ModelVersion,
+        fingerprint: str,
+        config: dict,
+        directory: str | Path = BASELINE_CACHE_DIR,
+    ):
+        key = (
+            f"{model_version.name}/{model_version.version}:{fingerprint}:"
+            + json.dumps(config, sort_keys=True)
+        )
+        self.key = hashlib.sha256(key.encode()).hexdigest()[:16]
+        self.path = Path(directory) / f"{self.key}.joblib"
+
+    def load(self) -> dict | None:
+        if not self.path.exists():
+            return None
+        return joblib.load(self.path)
+
+    def save(self, **entry):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Written next to the entry then renamed, concurrent runs never read a truncated file
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        joblib.dump(entry, tmp_path)
+        os.replace(tmp_path, self.path)
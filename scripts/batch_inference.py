@@ -0,0 +1,107 @@
+import os
+import time
+import multiprocessing
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from scripts.data_io import (
+    check_schema,
+    split_path,
+    FEATURE_COLUMNS,
+    ID_COLUMN,
+    PROCESSED_DIR,
+)
+
+# Chunked, multi-process batch scoring of a processed split. The model is loaded once in the parent
+# and inherited by the forked workers (copy-on-write, never pickled). Each worker memory-maps the
+# split and only materializes the rows of the chunk it scores; predictions are streamed to Parquet
+# in input order, so neither the input nor the predictions are ever fully held in memory.
+
+_worker_model = None
+_worker_table = None
+
+
+def _init_worker(path: str):
+    global _worker_table
+    # Zero-copy: the table is backed by the memory-mapped file
+    _worker_table = feather.read_table(
+        path, columns=[ID_COLUMN] + FEATURE_COLUMNS, memory_map=True
+    )
+
+
+def _score_chunk(bounds: tuple[int, int]) -> pa.Table:
+    start, stop = bounds
+    chunk = _worker_table.slice(start, stop - start).to_pandas()
+    predictions = _worker_model.predict(chunk[FEATURE_COLUMNS])
+    # Labels are stored as int8, the output keeps a fixed int64 prediction column
+    return pa.table(
+        {
+            ID_COLUMN: chunk[ID_COLUMN],
+            "prediction": np.asarray(predictions).astype(np.int64),
+        }
+    )
+
+
+def score_split(
+    model,
+    split_name: str = "current_set",
+    output_path: str | Path = "data/predictions/current_set.parquet",
+    chunk_size: int = 100_000,
+    n_workers: int | None = None,
+    data_dir: str | Path = PROCESSED_DIR,
+) -> dict:
+    """Score a processed split chunk by chunk in worker processes and stream (ID, prediction) to Parquet."""
+    global _worker_model
+    path = str(split_path(split_name, data_dir))
+    # Memory-mapped, only the schema and row count are read here
+    table = feather.read_table(
+        path, columns=[ID_COLUMN] + FEATURE_COLUMNS, memory_map=True
+    )
+    check_schema(table, path)
+    n_rows = table.num_rows
+    n_workers = n_workers or os.cpu_count()
+    bounds = [
+        (start, min(start + chunk_size, n_rows))
+        for start in range(0, n_rows, chunk_size)
+    ]
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Set before the pool forks, so every worker shares the parent's loaded model
+    _worker_model = model
+    start_time = time.perf_counter()
+    with (
+        ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(path,),
+        ) as executor,
+        pq.ParquetWriter(
+            output_path,
+            pa.schema([(ID_COLUMN, pa.int64()), ("prediction", pa.int64())]),
+        ) as writer,
+    ):
+        # Keep at most 2 chunks per worker in flight, results are written in input order
+        pending = deque()
+        for chunk_bounds in bounds:
+            pending.append(executor.submit(_score_chunk, chunk_bounds))
+            if len(pending) >= 2 * n_workers:
+                writer.write_table(pending.popleft().result())
+        while pending:
+            writer.write_table(pending.popleft().result())
+    elapsed = time.perf_counter() - start_time
+    _worker_model = None
+
+    return {
+        "rows": n_rows,
+        "chunks": len(bounds),
+        "seconds": elapsed,
+        "rows_per_sec": n_rows / elapsed if elapsed > 0 else float("inf"),
+        "output_path": str(output_path),
+    }
@@ -0,0 +1,97 @@
+import argparse
+import asyncio
+import json
+import time
+import numpy as np
+from scripts.data_io import load_split, FEATURE_COLUMNS, ID_COLUMN
+from scripts.scoring_service import build_service
+
+# Load generator for the scoring service: `concurrency` clients, each on its own connection, send
+# records of the unseen split one at a time and wait for the answer. Reports latency percentiles
+# and throughput. Starts the service in-process for --flow_version, or targets a running one.
+#
+# Usage (from the repository root):
+#   python -m scripts.benchmark_serving --flow_version <flow_version> --concurrency 1 16 64
+#   python -m scripts.benchmark_serving --port 8765 --concurrency 64
+
+
+async def client(host: str, port: int, records: list[bytes], latencies: list[float]):
+    reader, writer = await asyncio.open_connection(host, port)
+    for record in records:
+        start = time.perf_counter()
+        writer.write(record)
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_load(
+    host: str, port: int, records: list[bytes], concurrency: int
+) -> tuple[list[float], float]:
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            client(host, port, records[i::concurrency], latencies)
+            for i in range(concurrency)
+        )
+    )
+    return latencies, time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--flow_version",
+        type=str,
+        default=None,
+        help="Start the service in-process for this flow version",
+    )
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--max_batch_size", type=int, default=64)
+    parser.add_argument("--max_wait_ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    df = load_split("current_set", columns=[ID_COLUMN] + FEATURE_COLUMNS)
+    df = df.sample(n=min(args.requests, len(df)), random_state=42)
+    records = [(json.dumps(record) + "\n").encode() for record in df.to_dict("records")]
+
+    service = None
+    port = args.port
+    if args.flow_version is not None:
+        service = build_service(
+            args.flow_version, args.max_batch_size, args.max_wait_ms
+        )
+        port = await service.start(args.host, 0)
+
+    print(
+        f"{'clients':>8} | {'requests':>9} | {'req/s':>10} | {'p50 (ms)':>9} | {'p99 (ms)':>9} | {'batch':>6}"
+    )
+    for concurrency in args.concurrency:
+        if service is not None:
+            service.batcher.n_requests = service.batcher.n_batches = 0
+        latencies, elapsed = await run_load(args.host, port, records, concurrency)
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        mean_batch = (
+            service.batcher.n_requests / max(service.batcher.n_batches, 1)
+            if service is not None
+            else float("nan")
+        )
+        print(
+            f"{concurrency:>8} | {len(latencies):>9} | {len(latencies) / elapsed:>10,.0f} | "
+            f"{p50:>9.2f} | {p99:>9.2f} | {mean_batch:>6.1f}"
+        )
+
+    if service is not None:
+        await service.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
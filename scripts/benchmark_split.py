@@ -0,0 +1,94 @@
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from data_manager import (
+    AirlineDataManager,
+    EDGE_CASE_RULES,
+    STRAT_COLS,
+    SATISFACTION_COLUMNS,
+    strata_categories,
+    strata_codes,
+)
+
+# Benchmark of AirlineDataManager.split_golden_and_current against the number of rows.
+# Larger datasets are built by resampling the raw export with replacement (with new IDs).
+# For comparison, the "legacy" column times the two steps the rule engine replaced:
+# four filtered copies + concat/drop_duplicates for edge cases, and the row-wise string strata key.
+#
+# Usage (from the repository root):
+#   python -m scripts.benchmark_split --sizes 100000 1000000 5000000
+
+
+def legacy_edge_cases_and_strata(df: pd.DataFrame) -> float:
+    start = time.perf_counter()
+    very_insatisfied = df[df[SATISFACTION_COLUMNS].le(2).all(axis=1)]
+    extreme_age = df[(df["Age"] < 18) | (df["Age"] > 80)]
+    high_delay = df[(df["Departure Delay"] > 180) | (df["Arrival Delay"] > 180)]
+    extreme_distance = df[
+        (df["Flight Distance"] < 100) | (df["Flight Distance"] > 4000)
+    ]
+    edge_cases = pd.concat(
+        [high_delay, extreme_distance, very_insatisfied, extreme_age]
+    ).drop_duplicates()
+    df_remaining = df.drop(edge_cases.index)
+    df_remaining["New Class"] = df_remaining["Class"].replace(
+        {"Economy Plus": "Economy"}
+    )
+    df_remaining[STRAT_COLS].astype(str).agg("-".join, axis=1)
+    return time.perf_counter() - start
+
+
+def engine_edge_cases_and_strata(manager: AirlineDataManager, df: pd.DataFrame):
+    start = time.perf_counter()
+    edge_mask = manager._edge_case_mask(df)
+    df_remaining = df[~edge_mask]
+    strata_codes(df_remaining, strata_categories(df_remaining))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--data_path", type=str, default="data/airline_passenger_satisfaction.csv"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[129_880, 500_000, 1_000_000]
+    )
+    parser.add_argument(
+        "--skip_legacy",
+        action="store_true",
+        help="Don't time the legacy string join (slow on large sizes)",
+    )
+    args = parser.parse_args()
+
+    manager = AirlineDataManager(args.data_path)
+    raw = manager.df
+    rng = np.random.default_rng(42)
+
+    print(f"Edge case rules: {[rule['name'] for rule in EDGE_CASE_RULES]}")
+    print(
+        f"{'rows':>12} | {'split (s)':>10} | {'rows/s':>12} | {'engine (s)':>10} | {'legacy (s)':>10}"
+    )
+    for n_rows in args.sizes:
+        df = raw.iloc[rng.integers(0, len(raw), n_rows)].reset_index(drop=True)
+        df["ID"] = np.arange(1, n_rows + 1)
+        df[SATISFACTION_COLUMNS] = df[SATISFACTION_COLUMNS].astype(float)
+        manager.df = df
+
+        start = time.perf_counter()
+        manager.split_golden_and_current()
+        split_time = time.perf_counter() - start
+
+        engine_time = engine_edge_cases_and_strata(manager, df)
+        legacy_time = (
+            float("nan") if args.skip_legacy else legacy_edge_cases_and_strata(df)
+        )
+        print(
+            f"{n_rows:>12} | {split_time:>10.3f} | {n_rows / split_time:>12,.0f} | "
+            f"{engine_time:>10.3f} | {legacy_time:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import os
+import json
+import hashlib
+import joblib
+import pandas as pd
+from pathlib import Path
+from typing import Callable
+from sklearn.ensemble import RandomForestClassifier
+
+# Resumable forest training. Trees are grown in chunks with warm_start and the partial forest is
+# checkpointed after every chunk under a key derived from the model params and a fingerprint of the
+# training data. A rerun with the same params and data resumes from the last checkpoint. warm_start
+# draws the seeds of the new trees from the same random_state sequence, so a resumed forest is
+# identical to one trained in a single fit.
+
+CHECKPOINT_DIR = Path(__file__).resolve().parents[1] / "checkpoints"
+CHECKPOINT_CHUNK_SIZE = 25
+
+
+def data_fingerprint(*frames: pd.DataFrame | pd.Series) -> str:
+    """Content hash of the training data (values, column names and order)."""
+    digest = hashlib.sha256()
+    for frame in frames:
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy())
+        names = frame.columns if isinstance(frame, pd.DataFrame) else [frame.name]
+        digest.update(json.dumps([str(name) for name in names]).encode())
+    return digest.hexdigest()
+
+
+class ForestCheckpoint:
+    """Local checkpoint of a partially trained forest, plus any state needed to resume it."""
+
+    def __init__(
+        self, params: dict, fingerprint: str, directory: str | Path = CHECKPOINT_DIR
+    ):
+        key = json.dumps(params, sort_keys=True, default=str) + fingerprint
+        self.key = hashlib.sha256(key.encode()).hexdigest()[:16]
+        self.path = Path(directory) / f"{self.key}.joblib"
+        self._loaded = False
+        self._saved = None
+
+    def load(self) -> dict | None:
+        """Saved state, read from disk on the first call only."""
+        if not self._loaded:
+            self._saved = joblib.load(self.path) if self.path.exists() else None
+            self._loaded = True
+        return self._saved
+
+    def save(self, model: RandomForestClassifier, **state):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Written next to the checkpoint then renamed, a crash never leaves a truncated file
+        tmp_path = self.path.with_suffix(".tmp")
+        joblib.dump({"model": model, **state}, tmp_path)
+        os.replace(tmp_path, self.path)
+        self._saved, self._loaded = {"model": model, **state}, True
+
+    def clear(self):
+        self.path.unlink(missing_ok=True)
+        self._saved, self._loaded = None, True
+
+
+def fit_with_checkpoints(
+    model: RandomForestClassifier,
+    X: pd.DataFrame,
+    y: pd.Series,
+    checkpoint: ForestCheckpoint,
+    chunk_size: int = CHECKPOINT_CHUNK_SIZE,
+    after_chunk: Callable[[int], None] | None = None,
+    **state,
+) -> RandomForestClassifier:
+    """Grow the forest chunk_size trees at a time, resuming from and saving to the checkpoint.
+
+    after_chunk is called with the number of trees after every saved chunk.
+    """
+    n_estimators = model.n_estimators
+    saved = checkpoint.load()
+    if saved is not None:
+        model = saved["model"]
+        print(
+            f"Resuming from checkpoint {checkpoint.key} "
+            f"({len(model.estimators_)}/{n_estimators} trees)"
+        )
+
+    model.set_params(warm_start=True)
+    n_trees = len(getattr(model, "estimators_", []))
+    while n_trees < n_estimators:
+        n_trees = min(n_trees + chunk_size, n_estimators)
+        model.set_params(n_estimators=n_trees)
+        model.fit(X, y)
+        checkpoint.save(model, **state)
+        if after_chunk is not None:
+            after_chunk(n_trees)
+
+    # Back to the params of a forest trained in one go
+    return model.set_params(warm_start=False)
@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+import mlflow.pyfunc
+from pathlib import Path
+from sklearn.ensemble import RandomForestClassifier
+
+# Array-based predictor for a fitted RandomForestClassifier. All the trees are flattened into one set
+# of node arrays, leaves point to themselves, so walking max_depth levels for every (row, tree) pair
+# at once always ends on the right leaf. Features are cast to float32 and compared with the float64
+# thresholds like sklearn does, and leaf values are the normalized class frequencies averaged over
+# the trees in the same order, so predictions are identical to the original model.
+
+COMPILED_MODEL_ARTIFACT_PATH = "compiled_model"
+COMPILED_FOREST_FILE = "forest.npz"
+
+
+class CompiledForest:
+    """Flat NumPy representation of a random forest classifier."""
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        max_depth: int,
+        classes: np.ndarray,
+        feature_names: np.ndarray,
+    ):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.classes = classes
+        self.feature_names = feature_names
+
+    @classmethod
+    def from_sklearn(cls, model: RandomForestClassifier) -> "CompiledForest":
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            nodes = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(np.where(is_leaf, 0.0, tree.threshold))
+            # Node indices are made global, leaves loop on themselves
+            lefts.append(np.where(is_leaf, nodes, tree.children_left) + offset)
+            rights.append(np.where(is_leaf, nodes, tree.children_right) + offset)
+            value = tree.value[:, 0, :]
+            values.append(value / value.sum(axis=1, keepdims=True))
+            roots.append(offset)
+            offset += tree.node_count
+
+        return cls(
+            feature=np.concatenate(features).astype(np.int32),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts).astype(np.int32),
+            right=np.concatenate(rights).astype(np.int32),
+            value=np.concatenate(values),
+            roots=np.array(roots, dtype=np.int32),
+            max_depth=max(estimator.tree_.max_depth for estimator in model.estimators_),
+            classes=model.classes_,
+            feature_names=np.asarray(model.feature_names_in_, dtype=str),
+        )
+
+    def _features(self, X) -> np.ndarray:
+        if isinstance(X, pd.DataFrame):
+            X = X[list(self.feature_names)]
+        return np.asarray(X, dtype=np.float32)
+
+    def predict_proba(self, X) -> np.ndarray:
+        X = self._features(X)
+        rows = np.arange(len(X))[:, None]
+        # One node per (row, tree), all trees descend one level per iteration
+        node = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        # Summed tree by tree and divided at the end, in the same order as sklearn
+        return self.value[node.T].sum(axis=0) / len(self.roots)
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes[np.argmax(self.predict_proba(X), axis=1)]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            getattr(self, name).nbytes
+            for name in ("feature", "threshold", "left", "right", "value", "roots")
+        )
+
+    def save(self, path: str | Path) -> Path:
+        np.savez(
+            path,
+            feature=self.feature,
+            threshold=self.threshold,
+            left=self.left,
+            right=self.right,
+            value=self.value,
+            roots=self.roots,
+            max_depth=self.max_depth,
+            classes=self.classes,
+            feature_names=self.feature_names,
+        )
+        return Path(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "CompiledForest":
+        with np.load(path) as arrays:
+            return cls(
+                **{name: arrays[name] for name in arrays.files if name != "max_depth"},
+                max_depth=int(arrays["max_depth"]),
+            )
+
+
+class CompiledForestModel(mlflow.pyfunc.PythonModel):
+    """MLflow pyfunc flavor of a CompiledForest."""
+
+    def load_context(self, context):
+        self.forest = CompiledForest.load(context.artifacts["forest"])
+
+    def predict(self, context, model_input, params=None):
+        return self.forest.predict(model_input)
@@ -5,7 +5,7 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score
 
 
-def create_baseline(X_train, X_test, y_train, y_test):
+def create_baseline(X_train, X_test, y_train, y_test, signature_input=None):
 
     # Set tracking URI and experiment
     mlflow.set_tracking_uri("http://127.0.0.1:5000")
@@ -33,7 +33,9 @@ def create_baseline(X_train, X_test, y_train, y_test):
             sk_model=model,
             artifact_path="model",
             registered_model_name=f"{model.__class__.__name__}_baseline",
-            signature=infer_signature(X_train, y_train),
+            signature=infer_signature(
+                X_train if signature_input is None else signature_input, y_train
+            ),
         )
 
     mlflow.end_run(status=mlflow.entities.RunStatus.FINISHED)
@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+from pathlib import Path
+
+# Columnar storage for the processed splits (golden_train, golden_test, golden_set, current_set).
+# Splits are written as uncompressed Feather (Arrow IPC) files with an explicit schema, so loaders
+# can memory-map them and read only the columns they need instead of re-parsing CSV on every run.
+
+PROCESSED_DIR = Path(__file__).parent.parent / "data" / "processed"
+FILE_SUFFIX = ".feather"
+
+ID_COLUMN = "ID"
+TARGET_COLUMN = "Satisfaction"
+
+CATEGORICAL_COLUMNS = ["Gender", "Customer Type", "Type of Travel", "Class"]
+
+SATISFACTION_COLUMNS = [
+    "Departure and Arrival Time Convenience",
+    "Ease of Online Booking",
+    "Check-in Service",
+    "Online Boarding",
+    "Gate Location",
+    "On-board Service",
+    "Seat Comfort",
+    "Leg Room Service",
+    "Cleanliness",
+    "Food and Drink",
+    "In-flight Service",
+    "In-flight Wifi Service",
+    "In-flight Entertainment",
+    "Baggage Handling",
+]
+
+# Schema of the processed splits (after AirlineDataManager.preprocess), in column order. Compact
+# dtypes: ratings (0-5), categorical codes, age and label fit in int8, distances and delays in 32 bits.
+# Frames are cast to it on write (a value that doesn't fit fails the write instead of wrapping) and
+# loaders check it on read, so every consumer sees the same dtypes.
+PROCESSED_SCHEMA = pa.schema(
+    [
+        (ID_COLUMN, pa.int64()),
+        ("Gender", pa.int8()),
+        ("Age", pa.int8()),
+        ("Customer Type", pa.int8()),
+        ("Type of Travel", pa.int8()),
+        ("Class", pa.int8()),
+        ("Flight Distance", pa.int32()),
+        ("Departure Delay", pa.int32()),
+        ("Arrival Delay", pa.float32()),
+        *[(col, pa.int8()) for col in SATISFACTION_COLUMNS],
+        (TARGET_COLUMN, pa.int8()),
+    ]
+)
+
+FEATURE_COLUMNS = [
+    name for name in PROCESSED_SCHEMA.names if name not in (ID_COLUMN, TARGET_COLUMN)
+]
+
+
+def split_path(name: str, data_dir: str | Path = PROCESSED_DIR) -> Path:
+    """Return the on-disk path of a processed split."""
+    return Path(data_dir) / f"{name}{FILE_SUFFIX}"
+
+
+def _to_table(df: pd.DataFrame, schema: pa.Schema = PROCESSED_SCHEMA) -> pa.Table:
+    # Safe casts: non-integral or out of range values raise instead of being truncated
+    table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+    for field, column in zip(table.schema, table.columns):
+        # Missing values would turn an integer column back into float64 on read
+        if pa.types.is_integer(field.type) and column.null_count > 0:
+            raise ValueError(f"Missing values in integer column {field.name}")
+    return table
+
+
+def check_schema(table: pa.Table, path: str | Path):
+    """Raise if the columns of a table read from a split don't have the processed schema."""
+    expected = pa.schema([PROCESSED_SCHEMA.field(col) for col in table.column_names])
+    if not table.schema.equals(expected):
+        raise ValueError(
+            f"Schema mismatch in {path}: expected {expected}, found {table.schema}"
+        )
+
+
+def enforce_schema(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+    """Cast the processed columns of a DataFrame (those present) to the processed schema.
+
+    Frames that already have the processed dtypes are returned as they are (or copied).
+    """
+    schema = pa.schema(
+        [
+            PROCESSED_SCHEMA.field(col)
+            for col in df.columns
+            if col in PROCESSED_SCHEMA.names
+        ]
+    )
+    if all(
+        df[field.name].dtype == np.dtype(field.type.to_pandas_dtype())
+        for field in schema
+    ):
+        return df.copy() if copy else df
+    compact = _to_table(df[schema.names], schema).to_pandas()
+    if copy:
+        df = df.copy()
+    for col in schema.names:
+        df[col] = compact[col].to_numpy()
+    return df
+
+
+def save_split(
+    df: pd.DataFrame, name: str, data_dir: str | Path = PROCESSED_DIR
+) -> Path:
+    """Write a processed split as an uncompressed Feather file with the processed schema."""
+    path = split_path(name, data_dir)
+    # No compression: compressed buffers can't be memory-mapped, they must be decoded on read
+    feather.write_feather(_to_table(df), path, compression="uncompressed")
+    return path
+
+
+class SplitWriter:
+    """Append DataFrame chunks to a processed split file without holding the whole split in memory."""
+
+    def __init__(self, name: str, data_dir: str | Path = PROCESSED_DIR):
+        self.path = split_path(name, data_dir)
+        # Feather V2 is the Arrow IPC file format, so load_split can read the result as usual
+        self._writer = pa.ipc.new_file(self.path, PROCESSED_SCHEMA)
+        self.rows = 0
+
+    def write(self, df: pd.DataFrame):
+        if len(df) > 0:
+            self._writer.write_table(_to_table(df))
+            self.rows += len(df)
+
+    def close(self):
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_split(
+    name: str,
+    columns: list[str] | None = None,
+    data_dir: str | Path = PROCESSED_DIR,
+) -> pd.DataFrame:
+    """Memory-map a processed split and load the requested columns as a DataFrame."""
+    path = split_path(name, data_dir)
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    check_schema(table, path)
+    return table.to_pandas()
@@ -0,0 +1,94 @@
+import os
+import json
+import hashlib
+import pyarrow as pa
+from pathlib import Path
+from scripts.data_io import PROCESSED_DIR, split_path
+
+# Content-addressed registry of the processed splits. Every split is recorded with the SHA-256 of its
+# file, its schema and row count in registry.json next to the splits. The fingerprints are passed to
+# the load steps as parameters, so ZenML's step cache (and the validation and drift steps downstream
+# of a cached load) only misses when the data actually changed. Like git's index, a file is only
+# re-hashed when its size or modification time differ from the registered ones.
+
+REGISTRY_FILE = "registry.json"
+SPLIT_NAMES = ["golden_train", "golden_test", "golden_set", "current_set"]
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def _registry_path(data_dir: str | Path) -> Path:
+    return Path(data_dir) / REGISTRY_FILE
+
+
+def load_registry(data_dir: str | Path = PROCESSED_DIR) -> dict:
+    path = _registry_path(data_dir)
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save_registry(registry: dict, data_dir: str | Path):
+    path = _registry_path(data_dir)
+    # Written next to the registry then renamed, readers never see a truncated file
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(registry, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def describe_split(name: str, data_dir: str | Path = PROCESSED_DIR) -> dict:
+    """Registry entry of a split file: content hash, schema, row count and file stats."""
+    path = split_path(name, data_dir)
+    stat = path.stat()
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        schema = reader.schema
+        num_rows = sum(
+            reader.get_batch(i).num_rows for i in range(reader.num_record_batches)
+        )
+    return {
+        "sha256": _file_hash(path),
+        "schema": {field.name: str(field.type) for field in schema},
+        "num_rows": num_rows,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def register_splits(
+    names: list[str] = SPLIT_NAMES, data_dir: str | Path = PROCESSED_DIR
+) -> dict:
+    """Hash and record the given splits, returns the updated registry."""
+    registry = load_registry(data_dir)
+    for name in names:
+        registry[name] = describe_split(name, data_dir)
+    _save_registry(registry, data_dir)
+    return registry
+
+
+def split_fingerprint(name: str, data_dir: str | Path = PROCESSED_DIR) -> str:
+    """Content hash of a split, re-hashed (and re-registered) only if the file changed on disk."""
+    entry = load_registry(data_dir).get(name)
+    stat = split_path(name, data_dir).stat()
+    if (
+        entry is None
+        or entry["size"] != stat.st_size
+        or entry["mtime_ns"] != stat.st_mtime_ns
+    ):
+        entry = register_splits([name], data_dir)[name]
+    return entry["sha256"]
+
+
+def splits_fingerprint(names: list[str], data_dir: str | Path = PROCESSED_DIR) -> str:
+    """Combined fingerprint of several splits."""
+    fingerprints = [f"{name}:{split_fingerprint(name, data_dir)}" for name in names]
+    return hashlib.sha256("\n".join(fingerprints).encode()).hexdigest()
@@ -0,0 +1,103 @@
+import os
+import shutil
+import numpy as np
+import pandas as pd
+import pyarrow.feather as feather
+from pathlib import Path
+from scripts.data_io import (
+    check_schema,
+    split_path,
+    FEATURE_COLUMNS,
+    PROCESSED_DIR,
+    PROCESSED_SCHEMA,
+    TARGET_COLUMN,
+)
+
+# Feature matrices shared by the steps of a pipeline run. The features of a split are written once
+# (per split content) as a contiguous float32 .npy file, the dtype sklearn's trees work in, with the
+# target next to it. Steps exchange a small spec (path, columns and the processed dtypes) instead of
+# pickled DataFrames, and open the files memory-mapped: the DataFrame they get is a read-only view
+# of the file, which the forest consumes without any conversion. MLflow signatures and pyfunc
+# predictions use the processed dtypes recorded in the spec.
+
+FEATURE_MATRIX_DIR = Path(__file__).resolve().parents[1] / "cache" / "features"
+MATRIX_FILE = "X.npy"
+TARGET_FILE = "y.npy"
+
+
+def _pandas_dtype(col: str) -> str:
+    return np.dtype(PROCESSED_SCHEMA.field(col).type.to_pandas_dtype()).name
+
+
+def save_feature_matrix(
+    split_name: str,
+    fingerprint: str,
+    columns: list[str] = FEATURE_COLUMNS,
+    target: str = TARGET_COLUMN,
+    data_dir: str | Path = PROCESSED_DIR,
+    directory: str | Path = FEATURE_MATRIX_DIR,
+) -> dict:
+    """Write the feature matrix of a split (unless this content was already written), returns its spec."""
+    path = Path(directory) / f"{split_name}-{fingerprint[:16]}"
+    spec = {
+        "path": str(path),
+        "columns": list(columns),
+        "dtypes": {col: _pandas_dtype(col) for col in columns},
+        "target": target,
+    }
+    if (path / MATRIX_FILE).exists() and (path / TARGET_FILE).exists():
+        return spec
+    # Partially pruned, written again from the split
+    shutil.rmtree(path, ignore_errors=True)
+
+    table = feather.read_table(
+        split_path(split_name, data_dir), columns=columns + [target], memory_map=True
+    )
+    check_schema(table, split_path(split_name, data_dir))
+
+    # Written in a temporary directory then renamed, readers never see a partial matrix
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    try:
+        X = np.lib.format.open_memmap(
+            tmp_path / MATRIX_FILE,
+            mode="w+",
+            dtype=np.float32,
+            shape=(table.num_rows, len(columns)),
+        )
+        # Column by column from the memory-mapped split, no intermediate DataFrame
+        for j, col in enumerate(columns):
+            X[:, j] = table.column(col).to_numpy()
+        X.flush()
+        del X
+        np.save(tmp_path / TARGET_FILE, table.column(target).to_numpy())
+        os.replace(tmp_path, path)
+    except OSError:
+        # Written concurrently by another run, keep theirs
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not path.exists():
+            raise
+    return spec
+
+
+def open_feature_matrix(spec: dict) -> tuple[pd.DataFrame, pd.Series]:
+    """Memory-map a feature matrix, X is a read-only float32 view of the file (no copy)."""
+    path = Path(spec["path"])
+    X = np.load(path / MATRIX_FILE, mmap_mode="r")
+    y = np.load(path / TARGET_FILE, mmap_mode="r")
+    return (
+        pd.DataFrame(X, columns=spec["columns"], copy=False),
+        pd.Series(y, name=spec["target"], copy=False),
+    )
+
+
+def restore_dtypes(X: pd.DataFrame, spec: dict) -> pd.DataFrame:
+    """Copy of the features with the processed dtypes, as MLflow models check them against signatures."""
+    return X.astype(spec["dtypes"])
+
+
+def schema_frame(spec: dict) -> pd.DataFrame:
+    """Empty DataFrame with the processed dtypes, to infer model signatures from."""
+    return pd.DataFrame(
+        {col: pd.Series(dtype=dtype) for col, dtype in spec["dtypes"].items()}
+    )
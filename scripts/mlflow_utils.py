@@ -0,0 +1,160 @@
+import os
+import time
+import mlflow
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from mlflow.entities.model_registry import ModelVersion
+from mlflow.tracking import MlflowClient
+from scripts.preprocessing import (
+    AirlinePreprocessor,
+    PREPROCESSOR_FILE,
+    PREPROCESSOR_PATH,
+    PREPROCESSOR_ARTIFACT_PATH,
+)
+
+EXPERIMENT_NAME = "airline_satisfaction"
+
+# How long a flow_version -> run_id resolution is reused before asking the tracking server again
+RUN_ID_CACHE_TTL = float(os.environ.get("RUN_ID_CACHE_TTL", 300))
+# Upper bound on the (on-disk) size of the models kept loaded in memory
+MODEL_CACHE_MAX_BYTES = int(os.environ.get("MODEL_CACHE_MAX_BYTES", 2 * 1024**3))
+
+_run_ids: dict[str, tuple[str, float]] = {}
+_latest_versions: dict[str, tuple[ModelVersion, float]] = {}
+
+
+def resolve_run_id(flow_version_id: str, ttl: float | None = None) -> str:
+    """Return the run id of the latest training run of a specific flow version.
+
+    Resolutions are cached in-process for `ttl` seconds (RUN_ID_CACHE_TTL by default, 0 disables it).
+    """
+    ttl = RUN_ID_CACHE_TTL if ttl is None else ttl
+    cached = _run_ids.get(flow_version_id)
+    if cached is not None and time.monotonic() - cached[1] < ttl:
+        return cached[0]
+
+    runs = mlflow.search_runs(
+        experiment_names=[EXPERIMENT_NAME],
+        filter_string=f"tags.flow_version = '{flow_version_id}'",
+        order_by=["start_time desc"],
+    )
+
+    if runs.empty:
+        raise ValueError(f"No runs found for flow version: {flow_version_id}")
+
+    # Get the latest run for the specified flow version
+    run_id = runs.iloc[0].run_id
+    _run_ids[flow_version_id] = (run_id, time.monotonic())
+    return run_id
+
+
+def latest_model_version(name: str, ttl: float | None = None) -> ModelVersion:
+    """Latest version of a registered model, cached in-process like resolve_run_id."""
+    ttl = RUN_ID_CACHE_TTL if ttl is None else ttl
+    cached = _latest_versions.get(name)
+    if cached is not None and time.monotonic() - cached[1] < ttl:
+        return cached[0]
+
+    versions = MlflowClient().search_model_versions(
+        f"name='{name}'", order_by=["version_number DESC"], max_results=1
+    )
+    if not versions:
+        raise ValueError(f"No versions found for registered model: {name}")
+    _latest_versions[name] = (versions[0], time.monotonic())
+    return versions[0]
+
+
+@lru_cache(maxsize=128)
+def _model_version(name: str, version: str) -> ModelVersion:
+    # A given version of a registered model always points to the same run
+    return MlflowClient().get_model_version(name, version)
+
+
+def split_model_uri(model_uri: str) -> tuple[str | None, str]:
+    """(run_id, artifact path) of a runs:/ or models:/<name>/<version> URI.
+
+    Other URIs (models:/<model_id>, local paths) have no known run id: (None, model_uri).
+    """
+    if model_uri.startswith("runs:/"):
+        run_id, _, artifact_path = model_uri[len("runs:/") :].partition("/")
+        return run_id, artifact_path
+
+    # models:/<name>/<version|latest> from the registry (models:/<model_id> is already unique)
+    name, _, version = model_uri[len("models:/") :].partition("/")
+    if model_uri.startswith("models:/") and version:
+        if version == "latest":
+            model_version = latest_model_version(name)
+        else:
+            model_version = _model_version(name, version)
+        # The source is runs:/<run_id>/<path> or <artifact root>/<run_id>/artifacts/<path>
+        source = model_version.source
+        if source.startswith("runs:/"):
+            return split_model_uri(source)
+        return model_version.run_id, source.rpartition("/artifacts/")[2]
+
+    return None, model_uri
+
+
+def model_run_id(model_uri: str) -> str:
+    """Id of the MLflow run a model was logged in."""
+    run_id, _ = split_model_uri(model_uri)
+    if run_id is None:
+        raise ValueError(f"Cannot find the run of model {model_uri}")
+    return run_id
+
+
+class ModelCache:
+    """In-process LRU cache of loaded pyfunc models keyed by run id, bounded by the models' size."""
+
+    def __init__(self, max_bytes: int = MODEL_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._models = OrderedDict()
+
+    def load(self, model_uri: str):
+        key = split_model_uri(model_uri)
+        if key in self._models:
+            self._models.move_to_end(key)
+            return self._models[key][0]
+
+        local_path = mlflow.artifacts.download_artifacts(model_uri)
+        model = mlflow.pyfunc.load_model(local_path)
+        # The pickled size is a good estimate of the memory taken by the loaded model
+        size = sum(f.stat().st_size for f in Path(local_path).rglob("*") if f.is_file())
+
+        self._models[key] = (model, size)
+        self.total_bytes += size
+        # Evict least recently used models, but always keep the one just loaded
+        while self.total_bytes > self.max_bytes and len(self._models) > 1:
+            _, (_, evicted_size) = self._models.popitem(last=False)
+            self.total_bytes -= evicted_size
+        return model
+
+    def clear(self):
+        self._models.clear()
+        self.total_bytes = 0
+
+
+model_cache = ModelCache()
+
+
+def load_model(model_uri: str):
+    """Load a pyfunc model through the in-process model cache."""
+    return model_cache.load(model_uri)
+
+
+@lru_cache(maxsize=32)
+def load_run_preprocessor(run_id: str) -> AirlinePreprocessor:
+    """Load the preprocessor logged with a trained model (local one for older runs without it)."""
+    artifact_path = f"{PREPROCESSOR_ARTIFACT_PATH}/{PREPROCESSOR_FILE}"
+    logged = MlflowClient().list_artifacts(run_id, PREPROCESSOR_ARTIFACT_PATH)
+    if artifact_path not in [artifact.path for artifact in logged]:
+        print(
+            f"⚠️ No preprocessor logged in run {run_id}, using the local {PREPROCESSOR_PATH}"
+        )
+        return AirlinePreprocessor.load()
+    path = mlflow.artifacts.download_artifacts(
+        run_id=run_id, artifact_path=artifact_path
+    )
+    return AirlinePreprocessor.load(path)
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+from scripts.data_io import SATISFACTION_COLUMNS
+
+# Robustness sweep: every (scenario, severity) perturbed copy of the test set is built in one stacked
+# NumPy array of shape (n_scenarios * n_rows, n_features), so each model scores all the scenarios
+# with a single predict call. Severities are in [0, 1]:
+# - gaussian_noise: numeric features + N(0, (severity * std)^2), kept non-negative
+# - rating_flip: each rating in 1-5 is flipped (r -> 6 - r) with probability severity, 0 ("not
+#   applicable") is left as it is
+# - delay_inflation: delays multiplied by 1 + DELAY_INFLATION * severity
+# - missing_values: each feature is missing with probability severity / 2, then imputed like at
+#   serving time (missing Arrival Delay from Departure Delay, other columns with the median)
+
+NOISE_COLUMNS = ["Age", "Flight Distance", "Departure Delay", "Arrival Delay"]
+DELAY_COLUMNS = ["Departure Delay", "Arrival Delay"]
+DELAY_INFLATION = 4.0
+MIN_RATING = 1
+MAX_RATING = 5
+
+SCENARIOS = ["gaussian_noise", "rating_flip", "delay_inflation", "missing_values"]
+SEVERITIES = np.linspace(0.1, 1.0, 10)
+PERTURBATION_SEED = 42
+
+
+def perturbation_config(
+    scenarios: list[str] = SCENARIOS,
+    severities: np.ndarray = SEVERITIES,
+    random_state: int = PERTURBATION_SEED,
+) -> dict:
+    """Everything the perturbed batch depends on besides the data (used in cache keys)."""
+    return {
+        "scenarios": list(scenarios),
+        "severities": np.asarray(severities, dtype=float).tolist(),
+        "random_state": random_state,
+        "noise_columns": NOISE_COLUMNS,
+        "delay_columns": DELAY_COLUMNS,
+        "delay_inflation": DELAY_INFLATION,
+        "rating_range": [MIN_RATING, MAX_RATING],
+    }
+
+
+def build_perturbed_batch(
+    X: pd.DataFrame,
+    scenarios: list[str] = SCENARIOS,
+    severities: np.ndarray = SEVERITIES,
+    random_state: int = PERTURBATION_SEED,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Stack a perturbed copy of X per (scenario, severity).
+
+    Returns the stacked frame, with the dtypes of X so it matches the model signatures, and the
+    table of (scenario, severity) of each block of len(X) rows.
+    """
+    rng = np.random.default_rng(random_state)
+    columns = {col: i for i, col in enumerate(X.columns)}
+    clean = X.to_numpy(dtype=float)
+    n_rows = len(X)
+    grid = pd.DataFrame(
+        [(scenario, severity) for scenario in scenarios for severity in severities],
+        columns=["scenario", "severity"],
+    )
+    batch = np.tile(clean, (len(grid), 1)).reshape(len(grid), n_rows, -1)
+
+    for scenario, blocks in grid.groupby("scenario").groups.items():
+        blocks = np.asarray(blocks)
+        # Severity of every block, broadcast over rows (and features)
+        severity = grid["severity"].to_numpy()[blocks][:, None, None]
+        view = batch[blocks]
+
+        if scenario == "gaussian_noise":
+            idx = [columns[col] for col in NOISE_COLUMNS if col in columns]
+            std = clean[:, idx].std(axis=0)
+            noise = rng.normal(size=view[:, :, idx].shape) * severity * std
+            view[:, :, idx] = np.maximum(view[:, :, idx] + noise, 0)
+        elif scenario == "rating_flip":
+            idx = [columns[col] for col in SATISFACTION_COLUMNS if col in columns]
+            ratings = view[:, :, idx]
+            flip = (rng.random(ratings.shape) < severity) & (ratings >= MIN_RATING)
+            view[:, :, idx] = np.where(flip, MIN_RATING + MAX_RATING - ratings, ratings)
+        elif scenario == "delay_inflation":
+            idx = [columns[col] for col in DELAY_COLUMNS if col in columns]
+            view[:, :, idx] *= 1 + DELAY_INFLATION * severity
+        elif scenario == "missing_values":
+            missing = rng.random(view.shape) < severity / 2
+            view[missing] = np.nan
+            if "Arrival Delay" in columns and "Departure Delay" in columns:
+                arrival = view[:, :, columns["Arrival Delay"]]
+                departure = view[:, :, columns["Departure Delay"]]
+                np.copyto(arrival, departure, where=np.isnan(arrival))
+            view = np.where(np.isnan(view), np.nanmedian(clean, axis=0), view)
+        else:
+            raise ValueError(f"Unknown perturbation scenario: {scenario}")
+
+        batch[blocks] = view
+
+    # Back to the original dtypes: perturbed integer columns are rounded and kept within the range
+    # of their (compact) dtype
+    stacked = pd.DataFrame(batch.reshape(-1, clean.shape[1]), columns=X.columns)
+    for col, dtype in X.dtypes.items():
+        if pd.api.types.is_integer_dtype(dtype):
+            upper = np.iinfo(dtype).max
+            stacked[col] = stacked[col].round().clip(0, upper).astype(dtype)
+        else:
+            stacked[col] = stacked[col].astype(dtype)
+    return stacked, grid
+
+
+def degradation_curve(
+    predictions: np.ndarray, y: pd.Series | np.ndarray, grid: pd.DataFrame
+) -> pd.DataFrame:
+    """Accuracy and F1 of every (scenario, severity) block of stacked predictions."""
+    y = np.asarray(y).astype(bool)
+    predictions = np.asarray(predictions).reshape(len(grid), len(y)).astype(bool)
+    tp = (predictions & y).sum(axis=1)
+    fp = (predictions & ~y).sum(axis=1)
+    fn = (~predictions & y).sum(axis=1)
+    curve = grid.copy()
+    curve["accuracy"] = (predictions == y).mean(axis=1)
+    curve["f1_score"] = 2 * tp / np.maximum(2 * tp + fp + fn, 1)
+    return curve
@@ -0,0 +1,87 @@
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from scripts.data_io import (
+    enforce_schema,
+    PROCESSED_DIR,
+    CATEGORICAL_COLUMNS,
+    TARGET_COLUMN,
+)
+
+PREPROCESSOR_FILE = "preprocessor.json"
+PREPROCESSOR_PATH = PROCESSED_DIR / PREPROCESSOR_FILE
+# Where the preprocessor is logged in the MLflow run of every trained model
+PREPROCESSOR_ARTIFACT_PATH = "preprocessor"
+
+POSITIVE_LABEL = "Satisfied"
+
+
+class AirlinePreprocessor:
+    """Preprocessing fitted once on the golden set and reused for every other dataset.
+
+    Categorical columns are encoded with the codes a LabelEncoder fitted on the golden set would give
+    (index in the sorted categories), but as a vectorized category lookup. Columns that are already
+    numeric are left untouched and the result has the compact dtypes of PROCESSED_SCHEMA, so applying
+    it to processed data is a no-op (no cast, and no copy with copy=False).
+    """
+
+    def __init__(self, categories: dict[str, list] | None = None):
+        self.categories = categories
+
+    def fit(self, df: pd.DataFrame) -> "AirlinePreprocessor":
+        self.categories = {
+            col: sorted(df[col].dropna().unique().tolist())
+            for col in CATEGORICAL_COLUMNS
+        }
+        return self
+
+    def transform(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        """Preprocess the dataset by handling missing values and encoding categorical variables."""
+        if self.categories is None:
+            raise RuntimeError("AirlinePreprocessor must be fitted before transform")
+        if copy:
+            df = df.copy()
+
+        # Handling missing values on Arrival Delay
+        missing = df["Arrival Delay"].isna()
+        n_missing = int(missing.sum())
+        if n_missing > 0:
+            # Fill missing values with Departure Delay + some random noise
+            # to avoid overfitting (+- * 0.2)
+            alpha = np.random.uniform(0.9, 1.1, n_missing)
+            df.loc[missing, "Arrival Delay"] = (
+                df.loc[missing, "Departure Delay"] * alpha
+            ).astype(int)
+
+        # The label is absent when scoring new passengers
+        if TARGET_COLUMN in df and not pd.api.types.is_numeric_dtype(df[TARGET_COLUMN]):
+            df[TARGET_COLUMN] = (df[TARGET_COLUMN] == POSITIVE_LABEL).astype(int)
+
+        for col in CATEGORICAL_COLUMNS:
+            if pd.api.types.is_numeric_dtype(df[col]):
+                continue
+            codes = pd.Categorical(df[col], categories=self.categories[col]).codes
+            unknown = (codes == -1) & df[col].notna().to_numpy()
+            if unknown.any():
+                raise ValueError(
+                    f"Unknown categories in column {col}: {df.loc[unknown, col].unique()}"
+                )
+            df[col] = codes.astype(int)
+
+        # Compact dtypes of the processed splits, so served frames match the model signatures
+        return enforce_schema(df, copy=False)
+
+    def fit_transform(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        return self.fit(df).transform(df, copy=copy)
+
+    def save(self, path: str | Path = PREPROCESSOR_PATH) -> Path:
+        path = Path(path)
+        with open(path, "w") as f:
+            json.dump({"categories": self.categories}, f, indent=2)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path = PREPROCESSOR_PATH) -> "AirlinePreprocessor":
+        with open(path) as f:
+            return cls(categories=json.load(f)["categories"])
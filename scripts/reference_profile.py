@@ -0,0 +1,317 @@
+import numpy as np
+import pandas as pd
+from scipy.spatial.distance import jensenshannon
+
+# Compact reference profile of the training data, built once when a model is trained and logged with
+# it. Drift is computed against the profile with the same rules Evidently applies for a reference of
+# more than 1000 rows (see docs/Task_3.md), so monitoring never has to load the training data:
+# - numerical columns with > 5 unique values: Wasserstein distance normed by the reference std
+#   (computed from quantile sketches), drifted if > 0.1
+# - categorical columns or numerical with <= 5 unique values: Jensen-Shannon distance on the
+#   category frequencies, drifted if > 0.1
+
+PROFILE_ARTIFACT_FILE = "reference_profile.json"
+
+N_QUANTILES = 1000
+# Mid-points of N_QUANTILES equal-probability slices: the mean absolute difference of the quantile
+# functions on this grid approximates the Wasserstein-1 distance
+QUANTILE_LEVELS = (np.arange(N_QUANTILES) + 0.5) / N_QUANTILES
+N_BINS = 20
+
+CATEGORICAL_MAX_UNIQUE = 5
+DRIFT_THRESHOLD = 0.1
+# Default conditions of Evidently's TestShareOfDriftedColumns / TestNumberOfDriftedColumns
+MAX_SHARE_OF_DRIFTED_COLUMNS = 0.3
+
+# Zero frequencies are replaced by this value before computing Jensen-Shannon (as Evidently does)
+_EPSILON = 0.0001
+
+
+def _category_key(value) -> str:
+    # JSON keys are strings, normalise numbers so that 1 and 1.0 map to the same category
+    if isinstance(value, (int, float, np.number)):
+        return format(float(value), "g")
+    return str(value)
+
+
+def _frequencies(values: pd.Series) -> dict[str, float]:
+    counts = values.value_counts(normalize=True)
+    frequencies = {}
+    for value, share in counts.items():
+        key = _category_key(value)
+        frequencies[key] = frequencies.get(key, 0.0) + float(share)
+    return frequencies
+
+
+def _weighted_quantiles(
+    values: np.ndarray, weights: np.ndarray, levels: np.ndarray
+) -> np.ndarray:
+    # Same definition as method="inverted_cdf": the smallest value whose cumulative weight reaches
+    # the level
+    order = np.argsort(values, kind="stable")
+    cumulative = np.cumsum(weights[order])
+    idx = np.searchsorted(cumulative, levels * cumulative[-1], side="left")
+    return values[order][np.minimum(idx, len(values) - 1)]
+
+
+def _numerical_profile(values: np.ndarray, weights: np.ndarray | None = None) -> dict:
+    """Profile of a numerical column, rows weighted by weights (all 1 by default)."""
+    if weights is None:
+        quantiles = np.quantile(values, QUANTILE_LEVELS, method="inverted_cdf")
+        std = np.std(values)
+    else:
+        quantiles = _weighted_quantiles(values, weights, QUANTILE_LEVELS)
+        mean = np.average(values, weights=weights)
+        std = np.sqrt(np.average((values - mean) ** 2, weights=weights))
+    counts, bin_edges = np.histogram(values, bins=N_BINS, weights=weights)
+    return {
+        "type": "numerical",
+        "stattest": "wasserstein",
+        "std": float(std),
+        "quantiles": quantiles.tolist(),
+        "histogram": {
+            "bin_edges": bin_edges.tolist(),
+            "counts": np.rint(counts).astype(int).tolist(),
+        },
+    }
+
+
+def build_reference_profile(df: pd.DataFrame) -> dict:
+    """Summarise every column of the reference data as quantiles/histogram or category frequencies."""
+    columns = {}
+    for col in df.columns:
+        values = df[col].dropna()
+        n_unique = values.nunique()
+        if (
+            not pd.api.types.is_numeric_dtype(values)
+            or n_unique <= CATEGORICAL_MAX_UNIQUE
+        ):
+            columns[col] = {
+                "type": "categorical",
+                "stattest": "jensenshannon",
+                "frequencies": _frequencies(values),
+            }
+            continue
+
+        columns[col] = _numerical_profile(values.to_numpy(dtype=float))
+
+    return {"n_rows": len(df), "columns": columns}
+
+
+def merge_reference_profiles(profile: dict, df: pd.DataFrame) -> dict:
+    """Profile of the reference data of a profile plus the rows of df, without the original data.
+
+    The reference side of every column is turned back into weighted points (its quantiles, or its
+    categories weighted by their frequency, out of profile["n_rows"] rows) and profiled again with
+    the new values, so a profile can be extended batch after batch.
+    """
+    n_reference = profile["n_rows"]
+    columns = {}
+    for col in df.columns:
+        values = df[col].dropna()
+        reference = profile["columns"].get(col)
+        if reference is None:
+            columns[col] = build_reference_profile(df[[col]])["columns"][col]
+            continue
+
+        if reference["type"] == "categorical":
+            counts = pd.Series(reference["frequencies"], dtype=float) * n_reference
+            counts = counts.add(values.map(_category_key).value_counts(), fill_value=0)
+            if (
+                not pd.api.types.is_numeric_dtype(values)
+                or len(counts) <= CATEGORICAL_MAX_UNIQUE
+            ):
+                columns[col] = {
+                    "type": "categorical",
+                    "stattest": "jensenshannon",
+                    "frequencies": (counts / counts.sum()).to_dict(),
+                }
+                continue
+            reference_values = np.array(
+                [float(key) for key in reference["frequencies"]]
+            )
+            reference_weights = (
+                np.array(list(reference["frequencies"].values())) * n_reference
+            )
+        else:
+            reference_values = np.asarray(reference["quantiles"], dtype=float)
+            reference_weights = np.full(
+                len(reference_values), n_reference / len(reference_values)
+            )
+
+        columns[col] = _numerical_profile(
+            np.concatenate([reference_values, values.to_numpy(dtype=float)]),
+            np.concatenate([reference_weights, np.ones(len(values))]),
+        )
+
+    return {"n_rows": n_reference + len(df), "columns": columns}
+
+
+def column_drift_score(column_profile: dict, values: pd.Series) -> float:
+    """Drift score of the current values of a column against its reference profile."""
+    values = values.dropna()
+    if column_profile["type"] == "numerical":
+        current_quantiles = np.quantile(
+            values.to_numpy(dtype=float), QUANTILE_LEVELS, method="inverted_cdf"
+        )
+        distance = np.mean(
+            np.abs(np.asarray(column_profile["quantiles"]) - current_quantiles)
+        )
+        return float(distance / max(column_profile["std"], 0.001))
+
+    reference = column_profile["frequencies"]
+    current = _frequencies(values)
+    keys = sorted(set(reference) | set(current))
+    ref_percents = np.array([reference.get(key, 0.0) for key in keys])
+    cur_percents = np.array([current.get(key, 0.0) for key in keys])
+    ref_percents[ref_percents == 0] = _EPSILON
+    cur_percents[cur_percents == 0] = _EPSILON
+    return float(jensenshannon(ref_percents, cur_percents))
+
+
+def _bootstrap_scores(
+    column_profile: dict, values: pd.Series, n_bootstrap: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Drift scores of n_bootstrap resamples of the values, computed for all resamples at once."""
+    values = values.dropna()
+    n = len(values)
+    if column_profile["type"] == "numerical":
+        resamples = values.to_numpy(dtype=float)[rng.integers(0, n, (n_bootstrap, n))]
+        quantiles = np.quantile(
+            resamples, QUANTILE_LEVELS, axis=1, method="inverted_cdf"
+        )
+        reference = np.asarray(column_profile["quantiles"])[:, None]
+        distances = np.abs(reference - quantiles).mean(axis=0)
+        return distances / max(column_profile["std"], 0.001)
+
+    # Resampling rows with replacement = multinomial draw of the category counts
+    current = _frequencies(values)
+    keys = sorted(set(column_profile["frequencies"]) | set(current))
+    cur_freqs = np.array([current.get(key, 0.0) for key in keys])
+    ref_percents = np.array(
+        [column_profile["frequencies"].get(key, 0.0) for key in keys]
+    )
+    ref_percents[ref_percents == 0] = _EPSILON
+    cur_percents = rng.multinomial(n, cur_freqs / cur_freqs.sum(), size=n_bootstrap) / n
+    cur_percents[cur_percents == 0] = _EPSILON
+    return jensenshannon(ref_percents[None, :], cur_percents, axis=1)
+
+
+def stratified_sample(
+    df: pd.DataFrame,
+    sample_size: int,
+    stratify_by: list[str],
+    rng: np.random.Generator,
+    pool_factor: int = 10,
+) -> pd.DataFrame:
+    """Sample about sample_size rows keeping the proportions of the stratify_by groups.
+
+    Strata are formed on a uniform pool of pool_factor * sample_size rows rather than on the whole
+    frame, so the cost doesn't grow with the size of the data.
+    """
+    pool_size = min(len(df), pool_factor * sample_size)
+    pool = df.iloc[np.sort(rng.choice(len(df), size=pool_size, replace=False))]
+    return pool.groupby(stratify_by, group_keys=False, dropna=False).sample(
+        frac=sample_size / pool_size, random_state=rng
+    )
+
+
+def approximate_dataset_drift(
+    profile: dict,
+    current: pd.DataFrame,
+    sample_size: int,
+    stratify_by: list[str] | None = None,
+    n_bootstrap: int = 30,
+    z: float = 2.0,
+    random_state: int = 42,
+) -> dict:
+    """Drift of a stratified sample of the current data, with a bootstrap error per column.
+
+    The score of each column comes with its bootstrap standard error and a +/- z*se interval. If the
+    interval contains the drift threshold the sampled decision is borderline, and the score of that
+    column is recomputed on the full current data. Cost is bounded by the sample size otherwise.
+    """
+    if len(current) <= sample_size:
+        return dataset_drift(profile, current)
+
+    rng = np.random.default_rng(random_state)
+    stratify_by = [col for col in (stratify_by or []) if col in current.columns]
+    if stratify_by:
+        sample = stratified_sample(current, sample_size, stratify_by, rng)
+    else:
+        sample = current.sample(n=sample_size, random_state=rng)
+
+    features = {}
+    for col, column_profile in profile["columns"].items():
+        if col not in current.columns:
+            continue
+        score = column_drift_score(column_profile, sample[col])
+        error = float(
+            np.std(_bootstrap_scores(column_profile, sample[col], n_bootstrap, rng))
+        )
+        borderline = abs(score - DRIFT_THRESHOLD) <= z * error
+        if borderline:
+            score = column_drift_score(column_profile, current[col])
+        features[col] = {
+            "stattest": column_profile["stattest"],
+            "score": score,
+            "threshold": DRIFT_THRESHOLD,
+            "detected": score > DRIFT_THRESHOLD,
+            "standard_error": 0.0 if borderline else error,
+            "confidence_interval": (
+                [score, score] if borderline else [score - z * error, score + z * error]
+            ),
+            "exact": borderline,
+        }
+
+    drift = summarize_drift(features)
+    drift["sample_size"] = len(sample)
+    drift["n_exact_fallbacks"] = sum(f["exact"] for f in features.values())
+    return drift
+
+
+def dataset_drift(profile: dict, current: pd.DataFrame) -> dict:
+    """Per-column drift of the current data against a reference profile, plus dataset-level totals."""
+    features = {}
+    for col, column_profile in profile["columns"].items():
+        if col not in current.columns:
+            continue
+        score = column_drift_score(column_profile, current[col])
+        features[col] = {
+            "stattest": column_profile["stattest"],
+            "score": score,
+            "threshold": DRIFT_THRESHOLD,
+            "detected": score > DRIFT_THRESHOLD,
+        }
+    return summarize_drift(features)
+
+
+def summarize_drift(features: dict) -> dict:
+    """Add the number/share of drifted columns and the dataset-level test results."""
+    n_columns = len(features)
+    n_drifted = sum(result["detected"] for result in features.values())
+    share_drifted = n_drifted / n_columns if n_columns else 0.0
+    return {
+        "features": features,
+        "n_columns": n_columns,
+        "n_drifted": n_drifted,
+        "share_drifted": share_drifted,
+        "tests": [
+            {
+                "name": "Number of Drifted Features",
+                "status": "SUCCESS" if n_drifted < max(0, n_columns // 3) else "FAIL",
+                "description": f"The drift is detected for {n_drifted} out of {n_columns} features. "
+                f"The test threshold is lt={max(0, n_columns // 3)}.",
+            },
+            {
+                "name": "Share of Drifted Columns",
+                "status": (
+                    "SUCCESS"
+                    if share_drifted < MAX_SHARE_OF_DRIFTED_COLUMNS
+                    else "FAIL"
+                ),
+                "description": f"The drift is detected for {share_drifted:.3g} features. "
+                f"The test threshold is lt={MAX_SHARE_OF_DRIFTED_COLUMNS}.",
+            },
+        ],
+    }
@@ -0,0 +1,151 @@
+import asyncio
+import json
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from scripts.data_io import FEATURE_COLUMNS, ID_COLUMN
+from scripts.mlflow_utils import resolve_run_id, load_model, load_run_preprocessor
+from scripts.preprocessing import AirlinePreprocessor
+
+# Local asyncio scoring service. Clients send one passenger record per line as a JSON object (raw
+# or already encoded columns, ID optional) and get back one JSON line {"ID", "prediction"}.
+# Concurrent requests are grouped into micro-batches: a batch is closed when it reaches
+# max_batch_size or max_wait_ms after its first record, and requests arriving while a batch is
+# being scored are queued for the next one, so the batch size adapts to the load.
+
+
+class MicroBatcher:
+    """Group concurrent single-record predictions into batched model.predict calls."""
+
+    def __init__(
+        self,
+        model,
+        preprocessor: AirlinePreprocessor,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+    ):
+        self.model = model
+        self.preprocessor = preprocessor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.n_requests = 0
+        self.n_batches = 0
+        self._queue = None
+        self._task = None
+        # A single scoring thread: batches run one at a time, off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._batch_loop())
+
+    async def stop(self):
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._executor.shutdown()
+
+    async def predict(self, record: dict) -> int:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, future))
+        return await future
+
+    def _predict_batch(self, records: list[dict]) -> list:
+        """Predictions of the records, or the exception of each record that can't be scored."""
+        try:
+            df = pd.DataFrame.from_records(records, columns=FEATURE_COLUMNS)
+            df = self.preprocessor.transform(df, copy=False)
+            return self.model.predict(df).tolist()
+        except Exception as e:
+            if len(records) == 1:
+                return [e]
+        # Score the records one by one so a bad record only fails its own request
+        return [self._predict_batch([record])[0] for record in records]
+
+    async def _next_batch(self) -> list[tuple[dict, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            # Take everything already queued before waiting for more
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            records = [record for record, _ in batch]
+            results = await loop.run_in_executor(
+                self._executor, self._predict_batch, records
+            )
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+            self.n_requests += len(batch)
+            self.n_batches += 1
+
+
+class ScoringService:
+    """JSON-lines TCP server in front of a MicroBatcher."""
+
+    def __init__(self, batcher: MicroBatcher):
+        self.batcher = batcher
+        self._server = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> int:
+        """Start listening, returns the bound port (useful with port=0)."""
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                try:
+                    record = json.loads(line)
+                    prediction = await self.batcher.predict(record)
+                    response = {
+                        ID_COLUMN: record.get(ID_COLUMN),
+                        "prediction": prediction,
+                    }
+                except Exception as e:
+                    response = {"error": str(e)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionResetError:
+            pass
+        finally:
+            writer.close()
+
+
+def build_service(
+    flow_version_id: str, max_batch_size: int = 64, max_wait_ms: float = 2.0
+) -> ScoringService:
+    """Scoring service for the latest model of a flow version, resolved as predict_with_model_versionid does."""
+    run_id = resolve_run_id(flow_version_id)
+    model = load_model(f"runs:/{run_id}/model")
+    preprocessor = load_run_preprocessor(run_id)
+    return ScoringService(
+        MicroBatcher(model, preprocessor, max_batch_size, max_wait_ms)
+    )
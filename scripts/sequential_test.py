@@ -0,0 +1,107 @@
+import numpy as np
+
+# Sequential A/B test on accuracy (the per-row "prediction is correct" Bernoulli) with the mixture
+# SPRT (mSPRT) of Johari et al., "Always Valid Inference", on the normal approximation of the
+# difference of proportions. The mixture likelihood ratio over a N(0, tau^2) prior on the difference
+# gives an always-valid p-value and confidence interval: they can be looked at after every batch and
+# the test stopped at any time without inflating the type I error.
+# - H0 (no difference) is rejected when the always-valid p-value is <= alpha
+# - futility is declared when the always-valid CI is inside (-mde, mde): a difference of at least
+#   the minimum detectable effect is ruled out
+
+
+class SequentialABTest:
+    """Incremental mSPRT on the accuracy difference B - A, updated batch by batch."""
+
+    def __init__(
+        self,
+        alpha: float = 0.05,
+        mde: float = 0.01,
+        tau: float | None = None,
+        min_samples: int = 1000,
+    ):
+        self.alpha = alpha
+        self.mde = mde
+        # The prior is on the scale of the effects we care about
+        self.tau = mde if tau is None else tau
+        self.min_samples = min_samples
+        self.counts = {
+            arm: {"n": 0, "correct": 0, "tp": 0, "fp": 0, "fn": 0} for arm in "AB"
+        }
+        self.p_value = 1.0
+        self.ci = (-np.inf, np.inf)
+        self.decision = None
+        self.trail = []
+
+    def _accumulate(self, arm: str, y_true: np.ndarray, y_pred: np.ndarray):
+        counts = self.counts[arm]
+        counts["n"] += len(y_true)
+        counts["correct"] += int(np.sum(y_true == y_pred))
+        counts["tp"] += int(np.sum((y_true == 1) & (y_pred == 1)))
+        counts["fp"] += int(np.sum((y_true == 0) & (y_pred == 1)))
+        counts["fn"] += int(np.sum((y_true == 1) & (y_pred == 0)))
+
+    def accuracy(self, arm: str) -> float:
+        counts = self.counts[arm]
+        return counts["correct"] / counts["n"] if counts["n"] else 0.0
+
+    def f1(self, arm: str) -> float:
+        counts = self.counts[arm]
+        denominator = 2 * counts["tp"] + counts["fp"] + counts["fn"]
+        return 2 * counts["tp"] / denominator if denominator else 0.0
+
+    def update(
+        self,
+        y_true_a: np.ndarray,
+        y_pred_a: np.ndarray,
+        y_true_b: np.ndarray,
+        y_pred_b: np.ndarray,
+    ) -> dict:
+        """Add a batch of labels/predictions of both arms, returns the evidence record of this look."""
+        self._accumulate("A", np.asarray(y_true_a), np.asarray(y_pred_a))
+        self._accumulate("B", np.asarray(y_true_b), np.asarray(y_pred_b))
+
+        n_a, n_b = self.counts["A"]["n"], self.counts["B"]["n"]
+        acc_a, acc_b = self.accuracy("A"), self.accuracy("B")
+        diff = acc_b - acc_a
+        # Variance of the difference, floored so that perfect accuracy doesn't divide by zero
+        variance = max(acc_a * (1 - acc_a) / n_a + acc_b * (1 - acc_b) / n_b, 1e-12)
+        tau2 = self.tau**2
+
+        log_likelihood_ratio = 0.5 * np.log(variance / (variance + tau2)) + (
+            diff**2 * tau2 / (2 * variance * (variance + tau2))
+        )
+        half_width = np.sqrt(
+            variance
+            * (variance + tau2)
+            / tau2
+            * (np.log((variance + tau2) / variance) - 2 * np.log(self.alpha))
+        )
+        # Always-valid p-values and intervals can be carried over from the previous looks
+        self.p_value = min(self.p_value, float(np.exp(-log_likelihood_ratio)))
+        self.ci = (
+            max(self.ci[0], diff - half_width),
+            min(self.ci[1], diff + half_width),
+        )
+
+        if min(n_a, n_b) >= self.min_samples:
+            if self.p_value <= self.alpha:
+                self.decision = "B" if diff > 0 else "A"
+            elif -self.mde < self.ci[0] and self.ci[1] < self.mde:
+                self.decision = "futility"
+
+        record = {
+            "look": len(self.trail) + 1,
+            "n_A": n_a,
+            "n_B": n_b,
+            "accuracy_A": acc_a,
+            "accuracy_B": acc_b,
+            "difference": diff,
+            "log_likelihood_ratio": float(log_likelihood_ratio),
+            "p_value": self.p_value,
+            "ci_low": float(self.ci[0]),
+            "ci_high": float(self.ci[1]),
+            "decision": self.decision,
+        }
+        self.trail.append(record)
+        return record
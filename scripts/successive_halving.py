@@ -0,0 +1,78 @@
+import math
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+
+# Successive halving over RandomForest configs. All configs start on a small random subset of the
+# training rows with a proportionally small number of trees, only the best 1/eta of each rung move on
+# to eta times more rows and trees, and the last rung uses the full data and the configs' own
+# n_estimators. Candidates are scored on a validation split held out from the training set, so the
+# test set stays untouched for the final model.
+
+MIN_TREES = 10
+
+
+def rung_fractions(
+    n_configs: int, eta: int, min_fraction: float | None = None
+) -> list[float]:
+    """Share of the data (and of the trees) used at every rung, the last one being 1."""
+    n_rungs = int(math.log(n_configs, eta) + 1e-9) + 1
+    if min_fraction is not None:
+        n_rungs = min(n_rungs, int(math.log(1 / min_fraction, eta) + 1e-9) + 1)
+    return [eta ** (k - n_rungs + 1) for k in range(n_rungs)]
+
+
+def successive_halving(
+    X: pd.DataFrame,
+    y: pd.Series,
+    configs: list[dict],
+    eta: int = 3,
+    min_fraction: float | None = None,
+    validation_size: float = 0.2,
+    random_state: int = 42,
+) -> tuple[dict, pd.DataFrame]:
+    """Run the search, returns the best config and the validation results of every rung.
+
+    The cost of a fit is counted as rows x trees; the results include it next to the accuracy.
+    """
+    X_fit, X_val, y_fit, y_val = train_test_split(
+        X, y, test_size=validation_size, stratify=y, random_state=random_state
+    )
+    # Nested subsets: a rung's rows are a prefix of one random permutation
+    order = np.random.default_rng(random_state).permutation(len(X_fit))
+    X_fit, y_fit = X_fit.iloc[order], y_fit.iloc[order]
+
+    candidates = list(range(len(configs)))
+    results = []
+    for rung, fraction in enumerate(rung_fractions(len(configs), eta, min_fraction)):
+        n_rows = max(1, int(len(X_fit) * fraction))
+        scores = {}
+        for i in candidates:
+            n_estimators = max(MIN_TREES, round(configs[i]["n_estimators"] * fraction))
+            model = RandomForestClassifier(
+                max_depth=configs[i]["max_depth"],
+                n_estimators=min(n_estimators, configs[i]["n_estimators"]),
+                random_state=random_state,
+                n_jobs=-1,
+            )
+            model.fit(X_fit.iloc[:n_rows], y_fit.iloc[:n_rows])
+            scores[i] = accuracy_score(y_val, model.predict(X_val))
+            results.append(
+                {
+                    "rung": rung,
+                    "config": i,
+                    **configs[i],
+                    "fraction": fraction,
+                    "n_rows": n_rows,
+                    "rung_n_estimators": model.n_estimators,
+                    "cost": n_rows * model.n_estimators,
+                    "val_accuracy": scores[i],
+                }
+            )
+
+        n_keep = max(1, math.ceil(len(candidates) / eta))
+        candidates = sorted(candidates, key=lambda i: scores[i], reverse=True)[:n_keep]
+
+    return configs[candidates[0]], pd.DataFrame(results)
@@ -0,0 +1,155 @@
+import os
+import mlflow
+import numpy as np
+import pandas as pd
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from scripts.training import train_and_log_model
+
+# Parallel training of many candidate forests. The training data is copied once into shared memory
+# (one block per dtype, so the column types and the model signature are preserved) and every worker
+# process attaches to it instead of reloading or unpickling it. Workers log their candidate as a run
+# nested under the sweep's parent run via the mlflow.parentRunId tag.
+
+
+def share_frame(df: pd.DataFrame) -> tuple[dict, list[shared_memory.SharedMemory]]:
+    """Copy a DataFrame (or Series) into shared memory, returns a picklable spec to attach it."""
+    is_series = isinstance(df, pd.Series)
+    frame = df.to_frame() if is_series else df
+    blocks, shms = [], []
+    for dtype, columns in frame.columns.groupby(frame.dtypes).items():
+        values = frame[list(columns)].to_numpy(dtype=dtype)
+        shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+        blocks.append(
+            {
+                "name": shm.name,
+                "dtype": values.dtype.str,
+                "shape": values.shape,
+                "columns": list(columns),
+            }
+        )
+        shms.append(shm)
+    spec = {
+        "blocks": blocks,
+        "columns": list(frame.columns),
+        "index": frame.index.to_numpy(),
+        "series": is_series,
+    }
+    return spec, shms
+
+
+def attach_frame(spec: dict) -> tuple[pd.DataFrame, list[shared_memory.SharedMemory]]:
+    """Rebuild a DataFrame (or Series) shared with share_frame."""
+    columns, shms = {}, []
+    for block in spec["blocks"]:
+        shm = shared_memory.SharedMemory(name=block["name"])
+        values = np.ndarray(block["shape"], dtype=block["dtype"], buffer=shm.buf)
+        columns.update({col: values[:, i] for i, col in enumerate(block["columns"])})
+        shms.append(shm)
+    # copy=False keeps the columns as views of the shared buffers
+    frame = pd.DataFrame(
+        columns, index=spec["index"], columns=spec["columns"], copy=False
+    )
+    if spec["series"]:
+        return frame.iloc[:, 0], shms
+    return frame, shms
+
+
+def split_cores(n_candidates: int, n_workers: int | None = None) -> tuple[int, int]:
+    """Number of worker processes and n_jobs per forest, so that workers * n_jobs ~ cores.
+
+    Training independent forests in separate processes scales better than n_jobs within one forest,
+    so cores go to workers first and the remainder to n_jobs.
+    """
+    n_cores = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers or n_cores, n_candidates, n_cores))
+    return n_workers, max(1, n_cores // n_workers)
+
+
+_worker_data = None
+
+
+def _init_worker(specs: dict, tracking_uri: str, experiment_name: str):
+    global _worker_data
+    mlflow.set_tracking_uri(tracking_uri)
+    mlflow.set_experiment(experiment_name)
+    # Keep the shared memory handles alive for the lifetime of the worker
+    _worker_data = {name: attach_frame(spec) for name, spec in specs.items()}
+
+
+def _train_candidate(config: dict, parent_run_id: str, n_jobs: int) -> dict:
+    data = {name: frame for name, (frame, _) in _worker_data.items()}
+    with mlflow.start_run(
+        run_name=f"candidate_{config['flow_version']}",
+        tags={"mlflow.parentRunId": parent_run_id},
+    ) as run:
+        model_uri, metrics = train_and_log_model(
+            data["X_train"],
+            data["X_test"],
+            data["y_train"],
+            data["y_test"],
+            max_depth=config["max_depth"],
+            n_estimators=config["n_estimators"],
+            flow_version=config["flow_version"],
+            n_jobs=n_jobs,
+            register=False,
+        )
+    return {**config, **metrics, "run_id": run.info.run_id, "model_uri": model_uri}
+
+
+def run_sweep(
+    X_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    y_train: pd.Series,
+    y_test: pd.Series,
+    configs: list[dict],
+    parent_run_id: str,
+    n_workers: int | None = None,
+) -> pd.DataFrame:
+    """Train every config in a process pool, returns one row of metrics per candidate."""
+    n_workers, n_jobs = split_cores(len(configs), n_workers)
+    print(f"Training {len(configs)} candidates on {n_workers} workers x {n_jobs} jobs")
+
+    specs, shms = {}, []
+    try:
+        for name, frame in (
+            ("X_train", X_train),
+            ("X_test", X_test),
+            ("y_train", y_train),
+            ("y_test", y_test),
+        ):
+            specs[name], frame_shms = share_frame(frame)
+            shms.extend(frame_shms)
+
+        # spawn: MLflow clients hold threads and connections that aren't fork-safe
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                specs,
+                mlflow.get_tracking_uri(),
+                mlflow.get_experiment(
+                    mlflow.get_run(parent_run_id).info.experiment_id
+                ).name,
+            ),
+        ) as executor:
+            futures = [
+                executor.submit(_train_candidate, config, parent_run_id, n_jobs)
+                for config in configs
+            ]
+            # A failed candidate is reported, it doesn't stop the sweep
+            results = []
+            for config, future in zip(configs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append({**config, "error": str(e)})
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+
+    return pd.DataFrame(results)
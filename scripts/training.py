@@ -0,0 +1,139 @@
+import mlflow
+import pandas as pd
+from pathlib import Path
+from typing import Callable
+from mlflow.models import infer_signature
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score
+from scripts.checkpoint import ForestCheckpoint, fit_with_checkpoints
+from scripts.preprocessing import PREPROCESSOR_PATH, PREPROCESSOR_ARTIFACT_PATH
+from scripts.reference_profile import build_reference_profile, PROFILE_ARTIFACT_FILE
+
+
+def train_and_log_model(
+    X_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    y_train: pd.Series,
+    y_test: pd.Series,
+    max_depth: int,
+    n_estimators: int,
+    flow_version: str,
+    n_jobs: int | None = None,
+    register: bool = True,
+    checkpoint: ForestCheckpoint | None = None,
+    checkpoint_state: dict | None = None,
+    signature_input: pd.DataFrame | None = None,
+    after_chunk: Callable[[int], None] | None = None,
+) -> tuple[str, dict]:
+    """Train a RandomForest and log it with its metrics and artifacts in the active MLflow run.
+
+    With a checkpoint the trees are grown in chunks and training resumes from the last saved chunk
+    (checkpoint_state is saved along, after_chunk is called after every saved chunk). The signature is inferred from signature_input (X_train by
+    default). Returns the model URI and the train/test accuracy.
+    """
+    # Train model
+    model = RandomForestClassifier(
+        max_depth=max_depth,
+        n_estimators=n_estimators,
+        random_state=42,
+        n_jobs=n_jobs,
+    )
+    if checkpoint is None:
+        model.fit(X_train, y_train)
+    else:
+        model = fit_with_checkpoints(
+            model,
+            X_train,
+            y_train,
+            checkpoint,
+            after_chunk=after_chunk,
+            **(checkpoint_state or {}),
+        )
+
+    return log_trained_model(
+        model,
+        X_train,
+        X_test,
+        y_train,
+        y_test,
+        flow_version,
+        register=register,
+        signature_input=signature_input,
+    )
+
+
+def log_trained_model(
+    model: RandomForestClassifier,
+    X_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    y_train: pd.Series,
+    y_test: pd.Series,
+    flow_version: str,
+    register: bool = True,
+    preprocessor_path: str | Path = PREPROCESSOR_PATH,
+    signature_input: pd.DataFrame | None = None,
+    reference_profile: dict | None = None,
+) -> tuple[str, dict]:
+    """Evaluate a trained forest and log it with its metrics and artifacts in the active MLflow run.
+
+    The reference profile logged for drift monitoring is built from X_train unless one is given.
+    """
+    # Evaluate model
+    predictions = model.predict(X_train)
+    train_accuracy = accuracy_score(y_train, predictions)
+
+    predictions = model.predict(X_test)
+    accuracy = accuracy_score(y_test, predictions)
+
+    # Log model and metrics
+    mlflow.log_param("model_type", "RandomForest")
+    mlflow.log_params(model.get_params())
+    mlflow.log_metric("train_accuracy", train_accuracy)
+    mlflow.log_metric("test_accuracy", accuracy)
+    mlflow.set_tag("flow_version", flow_version)
+
+    # Log model with metadata
+    logged_model = mlflow.sklearn.log_model(
+        sk_model=model,
+        artifact_path="model",
+        registered_model_name=(
+            f"{model.__class__.__name__}_{flow_version}" if register else None
+        ),
+        signature=infer_signature(
+            X_train if signature_input is None else signature_input, y_train
+        ),
+    )
+
+    # Keep the preprocessing fitted on the golden set next to the model
+    mlflow.log_artifact(
+        str(preprocessor_path), artifact_path=PREPROCESSOR_ARTIFACT_PATH
+    )
+
+    # Reference profile of the data the model was trained on, used for drift monitoring
+    if reference_profile is None:
+        reference_profile = build_reference_profile(X_train)
+    mlflow.log_dict(reference_profile, PROFILE_ARTIFACT_FILE)
+
+    return logged_model.model_uri, {
+        "train_accuracy": train_accuracy,
+        "test_accuracy": accuracy,
+    }
+
+
+def extend_forest(
+    model: RandomForestClassifier,
+    X: pd.DataFrame,
+    y: pd.Series,
+    n_new_trees: int,
+    max_estimators: int | None = None,
+) -> RandomForestClassifier:
+    """Add n_new_trees fitted on (X, y) only to a trained forest, its existing trees are kept as they are.
+
+    With max_estimators, the oldest trees are dropped once the forest grows beyond it.
+    """
+    model.set_params(warm_start=True, n_estimators=len(model.estimators_) + n_new_trees)
+    model.fit(X, y)
+    if max_estimators is not None and len(model.estimators_) > max_estimators:
+        model.estimators_ = model.estimators_[-max_estimators:]
+        model.set_params(n_estimators=max_estimators)
+    return model.set_params(warm_start=False)
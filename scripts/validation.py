@@ -0,0 +1,250 @@
+import numpy as np
+import pandas as pd
+
+# Fused data validation: every statistic needed by the integrity and value range checks is computed
+# in a single vectorized pass per dataset (profile_dataset), then all checks are evaluated on the two
+# small profiles (run_checks). The checks and their default conditions mirror the Evidently tests used
+# in Task 1 (conditions relative to the reference dataset), so results are reported per check.
+
+# (column, min, max)
+VALUE_RANGES = [
+    ("Age", 18, 100),
+    ("Flight Distance", 50, 9500),
+    ("Departure Delay", 0, 2880),  # 2 days of delay
+    ("Arrival Delay", 0, 2880),
+    ("Departure and Arrival Time Convenience", 0, 5),
+    ("Ease of Online Booking", 0, 5),
+    ("Check-in Service", 0, 5),
+    ("Online Boarding", 0, 5),
+    ("Gate Location", 0, 5),
+    ("On-board Service", 0, 5),
+    ("Seat Comfort", 0, 5),
+    ("Leg Room Service", 0, 5),
+    ("Cleanliness", 0, 5),
+    ("Food and Drink", 0, 5),
+    ("In-flight Service", 0, 5),
+    ("In-flight Wifi Service", 0, 5),
+    ("In-flight Entertainment", 0, 5),
+    ("Baggage Handling", 0, 5),
+]
+
+# Relative tolerance of the checks compared against the reference (Evidently's default is 10%)
+TOLERANCE = 0.1
+
+
+def _combine_hashes(hashes: np.ndarray, axis: int, seed: int) -> np.ndarray:
+    """Combine element hashes along an axis into one uint64 key per row/column."""
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(1, 2**63, size=hashes.shape[axis], dtype=np.uint64) | 1
+    shape = [1, 1]
+    shape[axis] = -1
+    # uint64 arithmetic wraps around, which is what we want for hashing
+    return (hashes * weights.reshape(shape)).sum(axis=axis, dtype=np.uint64)
+
+
+def profile_dataset(
+    df: pd.DataFrame, value_ranges: list[tuple[str, float, float]] = VALUE_RANGES
+) -> dict:
+    """Compute every statistic used by the validation checks in one pass over the dataset."""
+    n_rows, n_columns = df.shape
+    columns = list(df.columns)
+    numeric = [pd.api.types.is_numeric_dtype(df[col]) for col in columns]
+
+    # One element-wise pass: missing values (NaN, +/-inf, empty strings) and value hashes
+    missing = np.empty((n_rows, n_columns), dtype=bool)
+    hashes = np.empty((n_rows, n_columns), dtype=np.uint64)
+    missing_kinds = set()
+    n_unique = np.empty(n_columns, dtype=np.int64)
+    for i, col in enumerate(columns):
+        values = df[col].to_numpy()
+        if numeric[i]:
+            values = values.astype(float, copy=False)
+            nan, posinf, neginf = (
+                np.isnan(values),
+                np.isposinf(values),
+                np.isneginf(values),
+            )
+            missing[:, i] = nan | posinf | neginf
+            present = values[~missing[:, i]]
+            n_unique[i] = (
+                0 if present.size == 0 else 1 + int(present.max() > present.min())
+            )
+            for kind, found in (("nan", nan), ("inf", posinf), ("-inf", neginf)):
+                if found.any():
+                    missing_kinds.add(kind)
+        else:
+            nan = pd.isna(values)
+            empty = values == ""
+            missing[:, i] = nan | empty
+            n_unique[i] = min(pd.unique(values[~missing[:, i]]).size, 2)
+            for kind, found in (("nan", nan), ("", empty)):
+                if np.any(found):
+                    missing_kinds.add(kind)
+        hashes[:, i] = pd.util.hash_array(values)
+
+    # Duplicated rows/columns from the same hashes (rows and columns are compared by their keys)
+    row_keys = _combine_hashes(hashes, axis=1, seed=0)
+    column_keys = _combine_hashes(hashes, axis=0, seed=1)
+
+    missing_per_row = missing.sum(axis=1)
+    missing_per_column = missing.sum(axis=0)
+
+    # All value ranges checked with a single broadcasted comparison
+    range_columns = [col for col, _, _ in value_ranges if col in df.columns]
+    bounds = {col: (left, right) for col, left, right in value_ranges}
+    out_of_range = {}
+    if range_columns:
+        block = df[range_columns].to_numpy(dtype=float)
+        left = np.array([bounds[col][0] for col in range_columns], dtype=float)
+        right = np.array([bounds[col][1] for col in range_columns], dtype=float)
+        outside = ((block < left) | (block > right)) & ~np.isnan(block)
+        out_of_range = dict(zip(range_columns, outside.sum(axis=0).tolist()))
+
+    return {
+        "n_rows": n_rows,
+        "n_columns": n_columns,
+        "n_missing": int(missing_per_column.sum()),
+        "n_columns_with_missing": int((missing_per_column > 0).sum()),
+        "n_rows_with_missing": int((missing_per_row > 0).sum()),
+        "n_different_missing": len(missing_kinds),
+        "n_constant_columns": int((n_unique == 1).sum()),
+        "n_empty_rows": int((missing_per_row == n_columns).sum()),
+        "n_empty_columns": int((missing_per_column == n_rows).sum()),
+        "n_duplicated_rows": int(n_rows - np.unique(row_keys).size),
+        "n_duplicated_columns": int(n_columns - np.unique(column_keys).size),
+        "dtypes": {col: str(df[col].dtype) for col in columns},
+        "out_of_range": out_of_range,
+        "value_ranges": {col: bounds[col] for col in range_columns},
+    }
+
+
+def _share(count: int, total: int) -> float:
+    return count / total if total else 0.0
+
+
+def _check(name: str, passed: bool, description: str) -> dict:
+    return {
+        "name": name,
+        "status": "SUCCESS" if passed else "FAIL",
+        "description": description,
+    }
+
+
+def _lte(name: str, what: str, cur: float, limit: float) -> dict:
+    return _check(
+        name,
+        cur <= limit,
+        f"The {what} is {cur:.4g}. The test threshold is lte={limit:.4g}.",
+    )
+
+
+def run_checks(ref: dict, cur: dict) -> list[dict]:
+    """Evaluate all integrity and value range checks from two dataset profiles."""
+    tol = 1 + TOLERANCE
+    results = [
+        _check(
+            "Number of Columns",
+            cur["n_columns"] == ref["n_columns"],
+            f"The number of columns is {cur['n_columns']}. The test threshold is eq={ref['n_columns']}.",
+        ),
+        _lte(
+            "Number of Missing Values",
+            "number of missing values",
+            cur["n_missing"],
+            ref["n_missing"] * tol,
+        ),
+        _lte(
+            "Share of Missing Values",
+            "share of missing values",
+            _share(cur["n_missing"], cur["n_rows"] * cur["n_columns"]),
+            _share(ref["n_missing"], ref["n_rows"] * ref["n_columns"]) * tol,
+        ),
+        _lte(
+            "Number of Columns with Missing Values",
+            "number of columns with missing values",
+            cur["n_columns_with_missing"],
+            ref["n_columns_with_missing"],
+        ),
+        _lte(
+            "Number of Rows with Missing Values",
+            "number of rows with missing values",
+            cur["n_rows_with_missing"],
+            ref["n_rows_with_missing"] * tol,
+        ),
+        _lte(
+            "Share of Columns with Missing Values",
+            "share of columns with missing values",
+            _share(cur["n_columns_with_missing"], cur["n_columns"]),
+            _share(ref["n_columns_with_missing"], ref["n_columns"]),
+        ),
+        _lte(
+            "Share of Rows with Missing Values",
+            "share of rows with missing values",
+            _share(cur["n_rows_with_missing"], cur["n_rows"]),
+            _share(ref["n_rows_with_missing"], ref["n_rows"]) * tol,
+        ),
+        _check(
+            "Number of Different Missing Values",
+            cur["n_different_missing"] == ref["n_different_missing"],
+            f"The number of differently encoded types of missing values is {cur['n_different_missing']}. "
+            f"The test threshold is eq={ref['n_different_missing']}.",
+        ),
+        _lte(
+            "Number of Constant Columns",
+            "number of constant columns",
+            cur["n_constant_columns"],
+            ref["n_constant_columns"],
+        ),
+        _lte(
+            "Number of Empty Rows",
+            "number of empty rows",
+            cur["n_empty_rows"],
+            ref["n_empty_rows"] * tol,
+        ),
+        _lte(
+            "Number of Empty Columns",
+            "number of empty columns",
+            cur["n_empty_columns"],
+            ref["n_empty_columns"],
+        ),
+        # Duplicated rows are compared after scaling the reference count to the current size
+        _lte(
+            "Number of Duplicated Rows",
+            "number of duplicated rows",
+            cur["n_duplicated_rows"],
+            _share(ref["n_duplicated_rows"], ref["n_rows"]) * cur["n_rows"] * tol,
+        ),
+        _lte(
+            "Number of Duplicated Columns",
+            "number of duplicated columns",
+            cur["n_duplicated_columns"],
+            ref["n_duplicated_columns"],
+        ),
+    ]
+
+    mismatched = {
+        col: (kind, cur["dtypes"].get(col))
+        for col, kind in ref["dtypes"].items()
+        if cur["dtypes"].get(col) != kind
+    }
+    results.append(
+        _check(
+            "Columns Type",
+            not mismatched,
+            f"The number of columns with a type mismatch is {len(mismatched)} out of {len(ref['dtypes'])}."
+            + (f" Mismatched (reference, current): {mismatched}" if mismatched else ""),
+        )
+    )
+
+    for col, n_outside in cur["out_of_range"].items():
+        left, right = cur["value_ranges"][col]
+        results.append(
+            _check(
+                f"Value Range: {col}",
+                n_outside == 0,
+                f"The number of values of column {col} out of the range [{left}, {right}] is {n_outside}. "
+                "The test threshold is eq=0.",
+            )
+        )
+
+    return results
@@ -0,0 +1,56 @@
+from pipelines.search_pipeline import search_pipeline
+from steps.train_model import TrainConfig
+import argparse
+import itertools
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--search_id", type=str, required=True)
+    parser.add_argument(
+        "--flow-version",
+        type=str,
+        required=True,
+        help="Flow version of the winning model",
+    )
+    parser.add_argument(
+        "--max_depth",
+        type=int,
+        nargs="+",
+        default=[4, 6, 8, 10, 12],
+        help="Grid values",
+    )
+    parser.add_argument(
+        "--n_estimators",
+        type=int,
+        nargs="+",
+        default=[50, 100, 200, 300],
+        help="Grid values (trees of the full-budget rung)",
+    )
+    parser.add_argument("--eta", type=int, default=3)
+    parser.add_argument(
+        "--min_fraction",
+        type=float,
+        default=None,
+        help="Smallest share of the data a rung trains on",
+    )
+    args = parser.parse_args()
+
+    configs = [
+        TrainConfig(
+            max_depth=max_depth,
+            n_estimators=n_estimators,
+            flow_version=args.flow_version,
+        )
+        for max_depth, n_estimators in itertools.product(
+            args.max_depth, args.n_estimators
+        )
+    ]
+    print(f"Running successive halving {args.search_id} over {len(configs)} configs")
+
+    search_pipeline(
+        configs=configs,
+        search_id=args.search_id,
+        flow_version=args.flow_version,
+        eta=args.eta,
+        min_fraction=args.min_fraction,
+    )
@@ -0,0 +1,27 @@
+from scripts.scoring_service import build_service
+import argparse
+import asyncio
+
+
+async def main(args):
+    service = build_service(args.flow_version, args.max_batch_size, args.max_wait_ms)
+    port = await service.start(args.host, args.port)
+    print(f"✅ Serving flow version {args.flow_version} on {args.host}:{port}")
+    await service.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--flow_version", type=str, required=True)
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max_batch_size", type=int, default=64)
+    parser.add_argument(
+        "--max_wait_ms",
+        type=float,
+        default=2.0,
+        help="How long a micro-batch waits for more requests after its first one",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args))
@@ -0,0 +1,15 @@
+from pipelines.shadow_pipeline import shadow_pipeline
+import argparse
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--champion_flow_version", type=str, required=True)
+    parser.add_argument("--challenger_flow_version", type=str, required=True)
+    parser.add_argument("--batch_size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    shadow_pipeline(
+        champion_flow_version=args.champion_flow_version,
+        challenger_flow_version=args.challenger_flow_version,
+        batch_size=args.batch_size,
+    )
@@ -1,11 +1,13 @@
 import os
 import json
+import string
 import mlflow
 import tempfile
 import numpy as np
 import pandas as pd
 from zenml import step
 from sklearn.metrics import accuracy_score, f1_score
+from scripts.ab_stats import bootstrap_ab_metrics
 
 
 @step
@@ -17,6 +19,7 @@ def ab_test_step(
     model_uri_a: str,
     model_uri_b: str,
     test_id: str,
+    n_resamples: int = 10_000,
 ):
     """Compares predictions from two model versions and logs the results."""
 
@@ -27,6 +30,11 @@ def ab_test_step(
     f1_a = f1_score(labels_a, preds_a)
     f1_b = f1_score(labels_b, preds_b)
 
+    # Uncertainty of the metrics and of the A - B differences
+    bootstrap = bootstrap_ab_metrics(
+        labels_a, preds_a, labels_b, preds_b, n_resamples=n_resamples
+    )
+
     # === Log into MLflow ===
     with mlflow.start_run(run_name=f"A/B Test: {test_id}") as parent_run:
         mlflow.set_tag("test_identifier", test_id)
@@ -43,6 +51,12 @@ def ab_test_step(
             mlflow.log_metric("accuracy", acc_b)
             mlflow.log_metric("f1_score", f1_b)
 
+        for metric, result in bootstrap["metrics"].items():
+            low, high = result["difference"]["confidence_interval"]
+            mlflow.log_metric(f"{metric}_diff_ci_low", low)
+            mlflow.log_metric(f"{metric}_diff_ci_high", high)
+            mlflow.log_metric(f"{metric}_diff_p_value", result["difference"]["p_value"])
+
         # Save and log summary
         summary = {
             "test_id": test_id,
@@ -52,6 +66,7 @@ def ab_test_step(
                 "accuracy": {"A": acc_a, "B": acc_b},
                 "f1_score": {"A": f1_a, "B": f1_b},
             },
+            "bootstrap": bootstrap,
         }
 
         tmp_path = os.path.join(
@@ -61,3 +76,89 @@ def ab_test_step(
             json.dump(summary, f, indent=2)
 
         mlflow.log_artifact(tmp_path)
+
+
+@step
+def abn_test_step(
+    preds: np.ndarray,
+    labels: pd.Series,
+    offsets: list[int],
+    model_uris: list[str],
+    weights: list[float],
+    test_id: str,
+    n_resamples: int = 10_000,
+):
+    """Compares predictions from N model versions (arm i is rows offsets[i]:offsets[i + 1]) and logs the results.
+
+    Arm A is the control, every other arm is compared to it with bootstrap CIs of the A - arm difference.
+    """
+
+    mlflow.set_experiment("airline_satisfaction")
+
+    labels = np.asarray(labels)
+    arms = {
+        string.ascii_uppercase[i]: (
+            labels[offsets[i] : offsets[i + 1]],
+            preds[offsets[i] : offsets[i + 1]],
+        )
+        for i in range(len(model_uris))
+    }
+    empty = [arm for arm, (y, _) in arms.items() if len(y) == 0]
+    if empty:
+        raise ValueError(
+            f"Arms {empty} received no rows, increase their weights or the amount of test data"
+        )
+    metrics = {
+        "accuracy": {arm: accuracy_score(y, p) for arm, (y, p) in arms.items()},
+        "f1_score": {arm: f1_score(y, p) for arm, (y, p) in arms.items()},
+    }
+    labels_control, preds_control = arms["A"]
+    bootstrap = {
+        arm: bootstrap_ab_metrics(
+            labels_control, preds_control, y, p, n_resamples=n_resamples
+        )
+        for arm, (y, p) in arms.items()
+        if arm != "A"
+    }
+
+    # === Log into MLflow ===
+    with mlflow.start_run(run_name=f"A/B/n Test: {test_id}"):
+        mlflow.set_tag("test_identifier", test_id)
+        mlflow.set_tag("ab_test", "true")
+        mlflow.log_param("n_arms", len(arms))
+
+        # One child run per arm
+        for (arm, (y, _)), model_uri, weight in zip(arms.items(), model_uris, weights):
+            with mlflow.start_run(nested=True, run_name=f"model_{arm}"):
+                mlflow.log_param("model_uri", model_uri)
+                mlflow.log_param("traffic_weight", weight)
+                mlflow.log_metric("n_rows", len(y))
+                mlflow.log_metric("accuracy", metrics["accuracy"][arm])
+                mlflow.log_metric("f1_score", metrics["f1_score"][arm])
+
+        for arm, comparison in bootstrap.items():
+            for metric, result in comparison["metrics"].items():
+                low, high = result["difference"]["confidence_interval"]
+                mlflow.log_metric(f"{metric}_diff_{arm}_ci_low", low)
+                mlflow.log_metric(f"{metric}_diff_{arm}_ci_high", high)
+                mlflow.log_metric(
+                    f"{metric}_diff_{arm}_p_value", result["difference"]["p_value"]
+                )
+
+        # Save and log summary
+        summary = {
+            "test_id": test_id,
+            "split_method": "hash(user_id) weighted",
+            "model_uri": dict(zip(arms, model_uris)),
+            "weights": dict(zip(arms, weights)),
+            "n_rows": {arm: len(y) for arm, (y, _) in arms.items()},
+            "metrics": metrics,
+            "bootstrap": bootstrap,
+        }
+
+        # Private directory, concurrent runs never overwrite each other's summary
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, f"ab_test_summary_{test_id}.json")
+            with open(tmp_path, "w") as f:
+                json.dump(summary, f, indent=2)
+            mlflow.log_artifact(tmp_path)
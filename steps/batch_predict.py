@@ -0,0 +1,48 @@
+import mlflow
+from zenml import step
+from scripts.batch_inference import score_split
+from scripts.mlflow_utils import EXPERIMENT_NAME, resolve_run_id, load_model
+
+
+@step(enable_cache=False)
+def batch_predict_step(
+    flow_version_id: str,
+    split_name: str = "current_set",
+    output_path: str | None = None,
+    chunk_size: int = 100_000,
+    n_workers: int | None = None,
+) -> str:
+    """Score a processed split in chunks with the latest model of a flow version, returns the predictions file."""
+
+    run_id = resolve_run_id(flow_version_id)
+    # Loaded once here, the worker processes share it
+    model = load_model(f"runs:/{run_id}/model")
+    output_path = (
+        output_path or f"data/predictions/{flow_version_id}_{split_name}.parquet"
+    )
+
+    stats = score_split(
+        model,
+        split_name=split_name,
+        output_path=output_path,
+        chunk_size=chunk_size,
+        n_workers=n_workers,
+    )
+    print(
+        f"✅ Scored {stats['rows']} rows in {stats['chunks']} chunks in {stats['seconds']:.1f}s "
+        f"({stats['rows_per_sec']:.0f} rows/s) -> {stats['output_path']}"
+    )
+
+    mlflow.set_experiment(EXPERIMENT_NAME)
+    with mlflow.start_run(run_name="batch_inference"):
+        mlflow.set_tag("flow_version", flow_version_id)
+        mlflow.set_tag("model_run_id", run_id)
+        mlflow.log_param("split_name", split_name)
+        mlflow.log_param("chunk_size", chunk_size)
+        mlflow.log_param("n_workers", n_workers)
+        mlflow.log_param("output_path", stats["output_path"])
+        mlflow.log_metric("rows", stats["rows"])
+        mlflow.log_metric("seconds", stats["seconds"])
+        mlflow.log_metric("rows_per_sec", stats["rows_per_sec"])
+
+    return stats["output_path"]
@@ -18,12 +18,42 @@ from evidently.tests import (
     TestColumnsType,
     TestValueRange,
 )
+from scripts.validation import VALUE_RANGES, profile_dataset, run_checks
 
 
 @step
-def data_validation_step(data_ref: pd.DataFrame, data_cur: pd.DataFrame):
-    """Validate data integrity and distribution. Returns the current dataset if all checks pass."""
+def data_validation_step(
+    data_ref: pd.DataFrame, data_cur: pd.DataFrame, backend: str = "fused"
+):
+    """Validate data integrity and distribution. Returns the current dataset if all checks pass.
 
+    The default "fused" backend profiles each dataset in a single vectorized pass and evaluates every
+    check on the profiles. backend="evidently" runs the equivalent Evidently test suites instead.
+    """
+    if backend == "fused":
+        _run_fused_checks(data_ref, data_cur)
+    elif backend == "evidently":
+        _run_evidently_checks(data_ref, data_cur)
+    else:
+        raise ValueError(f"Unknown data validation backend: {backend}")
+
+
+def _run_fused_checks(data_ref: pd.DataFrame, data_cur: pd.DataFrame):
+    results = run_checks(profile_dataset(data_ref), profile_dataset(data_cur))
+    for result in results:
+        print(f"{result['status']:>7} | {result['name']}")
+
+    for result in results:
+        if result["status"] != "SUCCESS":
+            kind = (
+                "Value range check"
+                if result["name"].startswith("Value Range")
+                else "Integrity test"
+            )
+            raise ValueError(f"{kind} failed: {result['description']}")
+
+
+def _run_evidently_checks(data_ref: pd.DataFrame, data_cur: pd.DataFrame):
     # --- SUBTASK 1: Integrity Tests ---
     integrity_tests = [
         TestNumberOfColumns(),
@@ -49,28 +79,7 @@ def data_validation_step(data_ref: pd.DataFrame, data_cur: pd.DataFrame):
             raise ValueError(f"Integrity test failed: {result['description']}")
 
     # --- SUBTASK 2: Value Distribution Tests ---
-    value_tests_config = [
-        ("Age", 18, 100),
-        ("Flight Distance", 50, 9500),
-        ("Departure Delay", 0, 2880),
-        ("Arrival Delay", 0, 2880),
-        ("Departure and Arrival Time Convenience", 0, 5),
-        ("Ease of Online Booking", 0, 5),
-        ("Check-in Service", 0, 5),
-        ("Online Boarding", 0, 5),
-        ("Gate Location", 0, 5),
-        ("On-board Service", 0, 5),
-        ("Seat Comfort", 0, 5),
-        ("Leg Room Service", 0, 5),
-        ("Cleanliness", 0, 5),
-        ("Food and Drink", 0, 5),
-        ("In-flight Service", 0, 5),
-        ("In-flight Wifi Service", 0, 5),
-        ("In-flight Entertainment", 0, 5),
-        ("Baggage Handling", 0, 5),
-    ]
-
-    for col, min_val, max_val in value_tests_config:
+    for col, min_val, max_val in VALUE_RANGES:
         value_test = TestSuite(
             tests=[TestValueRange(column_name=col, left=min_val, right=max_val)]
         )
@@ -1,32 +1,39 @@
 from zenml import step
 import pandas as pd
-from evidently.test_suite import TestSuite
-from evidently.tests import (
-    TestNumberOfDriftedColumns,
-    TestShareOfDriftedColumns,
-)
+from scripts.reference_profile import dataset_drift, approximate_dataset_drift
+
+# Sampled drift keeps the proportions of these segments
+STRATIFY_BY = ["Customer Type", "Type of Travel", "Class"]
 
 
 @step
-def drift_test_step(train_data: pd.DataFrame, unseen_data: pd.DataFrame):
-    """Run data drift tests on the unseen data against the training data."""
+def drift_test_step(
+    reference_profile: dict,
+    unseen_data: pd.DataFrame,
+    sample_size: int | None = None,
+):
+    """Run data drift tests on the unseen data against the reference profile of the training data.
+
+    With a sample_size, drift is computed on a stratified sample of the unseen data, with a bootstrap
+    error estimate per column and a full computation for the columns whose result is borderline.
+    """
 
     # Drop ID and Satisfaction columns if they are included in the drift tests
-    train_data = train_data.drop(columns=["ID", "Satisfaction"], errors="ignore")
     unseen_data = unseen_data.drop(columns=["ID", "Satisfaction"], errors="ignore")
 
-    data_drift_dataset_tests = TestSuite(
-        tests=[
-            TestNumberOfDriftedColumns(),
-            TestShareOfDriftedColumns(),
-        ]
-    )
+    if sample_size is None:
+        drift = dataset_drift(reference_profile, unseen_data)
+    else:
+        drift = approximate_dataset_drift(
+            reference_profile, unseen_data, sample_size, stratify_by=STRATIFY_BY
+        )
+        print(
+            f"Approximate drift on {drift.get('sample_size', len(unseen_data))} rows, "
+            f"{drift.get('n_exact_fallbacks', 0)} borderline columns recomputed on all rows"
+        )
 
-    data_drift_dataset_tests.run(reference_data=train_data, current_data=unseen_data)
-    for result in data_drift_dataset_tests.as_dict()["tests"]:
-        detected_drifts = {
-            k: v for k, v in result["parameters"]["features"].items() if v["detected"]
-        }
+    detected_drifts = {k: v for k, v in drift["features"].items() if v["detected"]}
+    for result in drift["tests"]:
         print(f"Detected drifts in {result['name']}:\n {detected_drifts}")
         if result["status"] != "SUCCESS":
             raise ValueError(f"Data drift test failed: {result['description']}")
@@ -0,0 +1,69 @@
+import os
+import time
+import tempfile
+import mlflow
+import numpy as np
+import pandas as pd
+from zenml import step
+from mlflow.models import infer_signature
+import scripts.compiled_forest as compiled_forest
+from scripts.feature_matrix import open_feature_matrix, schema_frame
+from scripts.mlflow_utils import model_run_id
+from scripts.compiled_forest import (
+    CompiledForest,
+    CompiledForestModel,
+    COMPILED_MODEL_ARTIFACT_PATH,
+    COMPILED_FOREST_FILE,
+)
+
+
+def _per_row_latency_ms(predict, X: pd.DataFrame, n_rows: int = 100) -> float:
+    rows = [X.iloc[[i]] for i in range(min(n_rows, len(X)))]
+    start = time.perf_counter()
+    for row in rows:
+        predict(row)
+    return (time.perf_counter() - start) / len(rows) * 1000
+
+
+@step(enable_cache=False)
+def export_compiled_model_step(model_uri: str, test_matrix: dict) -> str:
+    """Compile the trained forest into flat node arrays and log it as a pyfunc model in the same run."""
+    # Both models work in float32, they score the memory-mapped test matrix as it is
+    X_test, _ = open_feature_matrix(test_matrix)
+
+    model = mlflow.sklearn.load_model(model_uri)
+    forest = CompiledForest.from_sklearn(model)
+
+    # The compiled model must be a drop-in replacement
+    predictions = model.predict(X_test)
+    compiled_predictions = forest.predict(X_test)
+    n_mismatches = int(np.sum(predictions != compiled_predictions))
+    if n_mismatches:
+        raise RuntimeError(
+            f"Compiled forest differs from the trained model on {n_mismatches} rows"
+        )
+    print(f"✅ Compiled forest gives identical predictions on {len(X_test)} rows")
+
+    sklearn_latency = _per_row_latency_ms(model.predict, X_test)
+    compiled_latency = _per_row_latency_ms(forest.predict, X_test)
+    print(
+        f"Per-row latency: {sklearn_latency:.2f} ms (sklearn) -> {compiled_latency:.2f} ms (compiled), "
+        f"model arrays: {forest.nbytes / 1024**2:.1f} MiB"
+    )
+
+    run_id = model_run_id(model_uri)
+    with mlflow.start_run(run_id=run_id), tempfile.TemporaryDirectory() as tmp_dir:
+        forest_path = forest.save(os.path.join(tmp_dir, COMPILED_FOREST_FILE))
+        mlflow.pyfunc.log_model(
+            artifact_path=COMPILED_MODEL_ARTIFACT_PATH,
+            python_model=CompiledForestModel(),
+            artifacts={"forest": str(forest_path)},
+            # The scripts package is shipped with the model so it loads outside the repo
+            code_paths=[os.path.dirname(compiled_forest.__file__)],
+            signature=infer_signature(schema_frame(test_matrix), compiled_predictions),
+        )
+        mlflow.log_metric("sklearn_row_latency_ms", sklearn_latency)
+        mlflow.log_metric("compiled_row_latency_ms", compiled_latency)
+        mlflow.log_metric("compiled_model_bytes", forest.nbytes)
+
+    return f"runs:/{run_id}/{COMPILED_MODEL_ARTIFACT_PATH}"
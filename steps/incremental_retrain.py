@@ -0,0 +1,82 @@
+import os
+import tempfile
+import mlflow
+import pandas as pd
+from zenml import step
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+from scripts.data_io import FEATURE_COLUMNS, TARGET_COLUMN
+from scripts.mlflow_utils import EXPERIMENT_NAME, resolve_run_id, load_run_preprocessor
+from scripts.preprocessing import PREPROCESSOR_FILE
+from scripts.reference_profile import PROFILE_ARTIFACT_FILE, merge_reference_profiles
+from scripts.training import extend_forest, log_trained_model
+
+
+@step(enable_cache=False)
+def incremental_retrain_step(
+    batch: pd.DataFrame,
+    base_flow_version: str,
+    new_flow_version: str,
+    n_new_trees: int = 50,
+    max_estimators: int | None = None,
+    test_size: float = 0.2,
+) -> str:
+    """Extend the model of a flow version with trees fitted on a new batch, registered as a new flow version.
+
+    The existing trees are kept, so the cost only depends on the size of the batch, not on the history.
+    The reference profile of the base model is extended with the new batch, so drift is still
+    measured against all the data the trees were fitted on.
+    """
+
+    base_run_id = resolve_run_id(base_flow_version)
+    model = mlflow.sklearn.load_model(f"runs:/{base_run_id}/model")
+    preprocessor = load_run_preprocessor(base_run_id)
+
+    # Same encoding as the base model, raw batches are accepted
+    batch = preprocessor.transform(batch[FEATURE_COLUMNS + [TARGET_COLUMN]])
+    X, y = batch[FEATURE_COLUMNS], batch[TARGET_COLUMN]
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, stratify=y, random_state=42
+    )
+    base_accuracy = accuracy_score(y_test, model.predict(X_test))
+    n_base_trees = len(model.estimators_)
+
+    model = extend_forest(model, X_train, y_train, n_new_trees, max_estimators)
+    reference_profile = merge_reference_profiles(
+        mlflow.artifacts.load_dict(f"runs:/{base_run_id}/{PROFILE_ARTIFACT_FILE}"),
+        X_train,
+    )
+
+    mlflow.set_experiment(EXPERIMENT_NAME)
+    with mlflow.start_run(run_name="incremental_retrain"):
+        mlflow.set_tag("retrain", "incremental")
+        mlflow.set_tag("base_flow_version", base_flow_version)
+        mlflow.set_tag("base_run_id", base_run_id)
+        mlflow.log_param("n_new_trees", n_new_trees)
+        mlflow.log_param("n_base_trees", n_base_trees)
+        mlflow.log_param("batch_rows", len(batch))
+        mlflow.log_metric("base_test_accuracy", base_accuracy)
+
+        # The preprocessing of the base model stays with every model derived from it
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            preprocessor_path = preprocessor.save(
+                os.path.join(tmp_dir, PREPROCESSOR_FILE)
+            )
+            model_uri, metrics = log_trained_model(
+                model,
+                X_train,
+                X_test,
+                y_train,
+                y_test,
+                new_flow_version,
+                preprocessor_path=preprocessor_path,
+                reference_profile=reference_profile,
+            )
+
+    print(
+        f"✅ {new_flow_version}: {n_base_trees} trees of {base_flow_version} + {n_new_trees} new "
+        f"(kept {len(model.estimators_)}), accuracy on the new batch "
+        f"{base_accuracy:.4f} -> {metrics['test_accuracy']:.4f}"
+    )
+
+    return model_uri
@@ -0,0 +1,16 @@
+from zenml import step
+import pandas as pd
+from scripts.data_io import load_split
+
+
+@step(enable_cache=False)
+def load_current_batch_step(
+    batch_path: str | None = None, start: int = 0, stop: int | None = None
+) -> pd.DataFrame:
+    """Load a new batch of labelled current data, from a file or as rows start:stop of the current set."""
+    if batch_path is None:
+        return load_split("current_set").iloc[start:stop]
+    # Raw batches are encoded (and cast to the compact dtypes) by the run preprocessor downstream
+    if batch_path.endswith(".feather"):
+        return pd.read_feather(batch_path)
+    return pd.read_csv(batch_path)
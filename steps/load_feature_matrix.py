@@ -0,0 +1,18 @@
+from zenml import step
+from scripts.dataset_registry import split_fingerprint
+from scripts.feature_matrix import save_feature_matrix
+
+
+@step(enable_cache=False)
+def load_feature_matrix_step() -> tuple[dict, dict]:
+    """Write the golden train/test feature matrices (once per data version) and return their specs.
+
+    Downstream steps open the matrices memory-mapped with scripts.feature_matrix.open_feature_matrix.
+    Not cached: the specs point at local files, which are rewritten if they were deleted. Unchanged
+    splits are not rewritten, their matrices are keyed by the split fingerprints.
+    """
+    train_matrix = save_feature_matrix(
+        "golden_train", split_fingerprint("golden_train")
+    )
+    test_matrix = save_feature_matrix("golden_test", split_fingerprint("golden_test"))
+    return train_matrix, test_matrix
@@ -1,13 +1,17 @@
 from zenml import step
 import pandas as pd
-from pathlib import Path
+from scripts.data_io import load_split
 
 
 @step
-def load_predeploy_data_step() -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Load the pre-deployment datasets for data validation."""
-    path = Path(__file__).parent.parent / "data" / "processed"
-    golden_set = pd.read_csv(path / "golden_set.csv")
-    current_set = pd.read_csv(path / "current_set.csv")
+def load_predeploy_data_step(
+    fingerprint: str | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Load the pre-deployment datasets for data validation.
+
+    The fingerprint of the splits (see scripts.dataset_registry) is only part of the cache key.
+    """
+    golden_set = load_split("golden_set")
+    current_set = load_split("current_set")
 
     return golden_set, current_set
@@ -0,0 +1,12 @@
+import mlflow
+from zenml import step
+from scripts.reference_profile import PROFILE_ARTIFACT_FILE
+
+
+@step
+def load_reference_profile_step(run_id: str) -> dict:
+    """Load the reference profile logged with a trained model.
+
+    Cached: the artifacts of a run never change, so the run id is a complete cache key.
+    """
+    return mlflow.artifacts.load_dict(f"runs:/{run_id}/{PROFILE_ARTIFACT_FILE}")
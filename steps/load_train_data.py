@@ -1,18 +1,25 @@
 from zenml import step
 import pandas as pd
-from pathlib import Path
+from scripts.data_io import load_split, FEATURE_COLUMNS, TARGET_COLUMN
 
 
 @step
-def load_train_data_step() -> tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
-    """Load the pre-deployment datasets for data validation."""
-    path = Path(__file__).parent.parent / "data" / "processed"
-    train_df = pd.read_csv(path / "golden_train.csv")
-    X_train = train_df.drop(columns=["ID", "Satisfaction"])
-    y_train = train_df["Satisfaction"]
+def load_train_data_step(
+    fingerprint: str | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
+    """Load the pre-deployment datasets for data validation.
 
-    test_df = pd.read_csv(path / "golden_test.csv")
-    X_test = test_df.drop(columns=["ID", "Satisfaction"])
-    y_test = test_df["Satisfaction"]
+    The fingerprint of the splits (see scripts.dataset_registry) is only part of the cache key.
+    """
+    # Only project the columns the model uses (ID is never read from disk)
+    columns = FEATURE_COLUMNS + [TARGET_COLUMN]
+
+    train_df = load_split("golden_train", columns=columns)
+    X_train = train_df.drop(columns=[TARGET_COLUMN])
+    y_train = train_df[TARGET_COLUMN]
+
+    test_df = load_split("golden_test", columns=columns)
+    X_test = test_df.drop(columns=[TARGET_COLUMN])
+    y_test = test_df[TARGET_COLUMN]
 
     return X_train, X_test, y_train, y_test
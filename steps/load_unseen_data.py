@@ -1,12 +1,14 @@
 from zenml import step
 import pandas as pd
-from pathlib import Path
+from scripts.data_io import load_split
 
 
 @step
-def load_unseen_data_step() -> pd.DataFrame:
-    """Load the pre-deployment datasets for data validation."""
-    path = Path(__file__).parent.parent / "data" / "processed"
-    test_df = pd.read_csv(path / "current_set.csv")
+def load_unseen_data_step(fingerprint: str | None = None) -> pd.DataFrame:
+    """Load the pre-deployment datasets for data validation.
+
+    The fingerprint of the split (see scripts.dataset_registry) is only part of the cache key.
+    """
+    test_df = load_split("current_set")
 
     return test_df
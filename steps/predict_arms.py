@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from zenml import step
+from scripts.mlflow_utils import resolve_run_id, load_model, load_run_preprocessor
+
+
+@step
+def predict_arms_step(
+    X: pd.DataFrame, offsets: list[int], flow_versions: list[str]
+) -> tuple[list[str], np.ndarray]:
+    """Score every arm's block of rows with its flow version, all arms concurrently."""
+
+    run_ids = [resolve_run_id(flow_version) for flow_version in flow_versions]
+    model_uris = [f"runs:/{run_id}/model" for run_id in run_ids]
+    models = [load_model(model_uri) for model_uri in model_uris]
+    preprocessors = [load_run_preprocessor(run_id) for run_id in run_ids]
+
+    # Arms are contiguous blocks of X, each encoded by its own run preprocessor like
+    # predict_with_model_versionid does. X is this step's own copy, so the row slice of every arm
+    # is encoded in place (on processed data this is a no-op, the slice stays a view of X).
+    # Tree ensembles predict without holding the GIL, so threads are enough to score the arms in
+    # parallel.
+    def predict_arm(i: int) -> np.ndarray:
+        if offsets[i] == offsets[i + 1]:
+            return np.empty(0, dtype=np.int64)
+        block = preprocessors[i].transform(
+            X.iloc[offsets[i] : offsets[i + 1]], copy=False
+        )
+        return models[i].predict(block)
+
+    with ThreadPoolExecutor(max_workers=len(models)) as executor:
+        predictions = list(executor.map(predict_arm, range(len(models))))
+
+    return model_uris, np.concatenate(predictions)
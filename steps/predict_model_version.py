@@ -1,7 +1,7 @@
-import mlflow
 import numpy as np
 import pandas as pd
 from zenml import step
+from scripts.mlflow_utils import resolve_run_id, load_model, load_run_preprocessor
 
 
 @step
@@ -10,18 +10,14 @@ def predict_with_model_versionid(
 ) -> tuple[str, np.ndarray]:
     """Returns model artifact URI for the latest run of a specific flow version."""
 
-    runs = mlflow.search_runs(
-        experiment_names=["airline_satisfaction"],
-        filter_string=f"tags.flow_version = '{flow_version_id}'",
-        order_by=["start_time desc"],
-    )
+    run_id = resolve_run_id(flow_version_id)
+    model_uri = f"runs:/{run_id}/model"
 
-    if runs.empty:
-        raise ValueError(f"No runs found for flow version: {flow_version_id}")
+    model = load_model(model_uri)
 
-    # Get the latest run for the specified flow version
-    latest_run = runs.iloc[0]
-    model_uri = f"runs:/{latest_run.run_id}/model"
+    # Same encoding as the training data; already processed columns are left as they are.
+    # The step owns its input artifact, so it can be transformed in place.
+    preprocessor = load_run_preprocessor(run_id)
+    test_df = preprocessor.transform(test_df, copy=False)
 
-    model = mlflow.pyfunc.load_model(model_uri)
     return model_uri, model.predict(test_df)
@@ -1,5 +1,7 @@
-from zenml import step
+import os
+import tempfile
 import mlflow
+from zenml import step
 import pandas as pd
 from evidently.test_suite import TestSuite
 from evidently.tests import (
@@ -13,39 +15,107 @@ from evidently.tests import (
 )
 
 
+from scripts.baseline_cache import BaselineCache, latest_baseline_version
+from scripts.checkpoint import data_fingerprint
 from scripts.create_baseline import create_baseline
+from scripts.feature_matrix import open_feature_matrix, restore_dtypes, schema_frame
+from scripts.mlflow_utils import load_model, model_run_id
+from scripts.perturbations import (
+    build_perturbed_batch,
+    degradation_curve,
+    perturbation_config,
+)
+
+
+def log_degradation_curve(model_uri: str, curve: pd.DataFrame):
+    """Log the accuracy per severity of every scenario in the run of the tested model."""
+    with mlflow.start_run(run_id=model_run_id(model_uri)):
+        for scenario, scenario_curve in curve.groupby("scenario"):
+            for step, row in enumerate(scenario_curve.itertuples()):
+                mlflow.log_metric(
+                    f"robustness_{scenario}_accuracy", row.accuracy, step=step
+                )
+                mlflow.log_metric(
+                    f"robustness_{scenario}_baseline_accuracy",
+                    row.baseline_accuracy,
+                    step=step,
+                )
+        # Private directory, concurrent runs never overwrite each other's curve
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, "degradation_curve.csv")
+            curve.to_csv(tmp_path, index=False)
+            mlflow.log_artifact(tmp_path)
+
+    worst = curve.loc[curve.groupby("scenario")["severity"].idxmax()]
+    print(
+        "Accuracy at the highest severity:\n"
+        + worst[["scenario", "severity", "accuracy", "baseline_accuracy"]].to_string(
+            index=False
+        )
+    )
 
 
 @step(enable_cache=False)
 def robustness_test_step(
     model_uri: str,
-    X_train: pd.DataFrame,
-    X_test: pd.DataFrame,
-    y_train: pd.Series,
-    y_test: pd.Series,
+    train_matrix: dict,
+    test_matrix: dict,
 ):
-    """Test the robustness of the model by checking its performance on a perturbed dataset."""
+    """Test the robustness of the model by checking its performance on a perturbed dataset.
+
+    The baseline predictions are cached per (baseline version, test data, perturbation config), so
+    only the candidate model is scored when the baseline, the data and the perturbations are
+    unchanged.
+    """
+    X_train, y_train = open_feature_matrix(train_matrix)
+    X_test_matrix, y_test = open_feature_matrix(test_matrix)
+    # MLflow models check their input against the signature, logged with the processed dtypes
+    X_test = restore_dtypes(X_test_matrix, test_matrix)
 
     # Load the model
-    model = mlflow.pyfunc.load_model(model_uri)
+    model = load_model(model_uri)
 
-    # Load the baseline model
-    try:
-        baseline_model = mlflow.pyfunc.load_model(
-            "models:/LogisticRegression_baseline/latest"
+    # Resolve the baseline model version, create a baseline model if it doesn't exist
+    baseline_version = latest_baseline_version()
+    if baseline_version is None:
+        create_baseline(
+            X_train,
+            X_test_matrix,
+            y_train,
+            y_test,
+            signature_input=schema_frame(train_matrix),
         )
-    except Exception as e:
-        # Create a baseline model if it doesn't exist
-        baseline_uri = create_baseline(X_train, X_test, y_train, y_test)
-        baseline_model = mlflow.pyfunc.load_model(baseline_uri)
+        baseline_version = latest_baseline_version()
 
-    # Predict using the current model and the baseline model
+    # Perturbation sweep: all scenarios and severities scored with one predict call per model
+    config = perturbation_config()
+    stacked, grid = build_perturbed_batch(
+        X_test, config["scenarios"], config["severities"], config["random_state"]
+    )
+    cache = BaselineCache(baseline_version, data_fingerprint(X_test, y_test), config)
+    cached = cache.load()
+
+    # Predict using the current model and the baseline model (unless cached)
     y_pred_current = model.predict(X_test)
-    y_pred_baseline = baseline_model.predict(X_test)
+    if cached is None:
+        baseline_model = load_model(
+            f"models:/{baseline_version.name}/{baseline_version.version}"
+        )
+        y_pred_baseline = baseline_model.predict(X_test)
+        y_pred_baseline_perturbed = baseline_model.predict(stacked)
+    else:
+        print(f"Using cached baseline results {cache.key}")
+        y_pred_baseline = cached["predictions"]
+        y_pred_baseline_perturbed = cached["perturbed_predictions"]
+
+    curve = degradation_curve(model.predict(stacked), y_test, grid)
+    baseline_curve = degradation_curve(y_pred_baseline_perturbed, y_test, grid)
+    curve["baseline_accuracy"] = baseline_curve["accuracy"]
+    curve["baseline_f1_score"] = baseline_curve["f1_score"]
+    log_degradation_curve(model_uri, curve)
 
     # Create a DataFrame to hold the predictions
     data_cur = pd.DataFrame({"target": y_test, "prediction": y_pred_current})
-    data_ref = pd.DataFrame({"target": y_test, "prediction": y_pred_baseline})
 
     classification_tests_suite = TestSuite(
         tests=[
@@ -62,10 +132,23 @@ def robustness_test_step(
         ]
     )
 
+    # The baseline predictions are the reference, cached or not
+    data_ref = pd.DataFrame({"target": y_test, "prediction": y_pred_baseline})
     classification_tests_suite.run(reference_data=data_ref, current_data=data_cur)
-    for result in classification_tests_suite.as_dict()["tests"]:
+    results = classification_tests_suite.as_dict()["tests"]
+    # The reference metrics are the baseline scores the tests compare against
+    reference_metrics = [
+        result["parameters"]["condition"]["eq"]["value"] for result in results
+    ]
+    if cached is None:
+        cache.save(
+            predictions=y_pred_baseline,
+            perturbed_predictions=y_pred_baseline_perturbed,
+        )
+
+    for result, reference_metric in zip(results, reference_metrics):
         # Custom threshold: only fail if accuracy drops by more than 10%
-        ref_score = result["parameters"]["condition"]["eq"]["value"] * 0.9
+        ref_score = reference_metric * 0.9
         cur_score = result["parameters"]["value"]
         if cur_score < ref_score:
             raise ValueError(
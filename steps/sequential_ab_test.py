@@ -0,0 +1,120 @@
+import os
+import json
+import mlflow
+import tempfile
+import pandas as pd
+from zenml import step
+from scripts.mlflow_utils import resolve_run_id, load_model, load_run_preprocessor
+from scripts.sequential_test import SequentialABTest
+
+
+@step(enable_cache=False)
+def sequential_ab_test_step(
+    X_a: pd.DataFrame,
+    X_b: pd.DataFrame,
+    y_a: pd.Series,
+    y_b: pd.Series,
+    flow_version_a: str,
+    flow_version_b: str,
+    test_id: str,
+    batch_size: int = 1000,
+    alpha: float = 0.05,
+    mde: float = 0.01,
+) -> dict:
+    """Scores both arms batch by batch and stops as soon as the sequential test reaches a decision."""
+    if len(X_a) == 0 or len(X_b) == 0:
+        raise ValueError(
+            f"Sequential A/B test needs data in both arms, got {len(X_a)} (A) and {len(X_b)} (B) rows"
+        )
+
+    mlflow.set_experiment("airline_satisfaction")
+
+    models, model_uris, X = {}, {}, {}
+    for arm, flow_version, X_arm in (
+        ("A", flow_version_a, X_a),
+        ("B", flow_version_b, X_b),
+    ):
+        run_id = resolve_run_id(flow_version)
+        model_uris[arm] = f"runs:/{run_id}/model"
+        models[arm] = load_model(model_uris[arm])
+        X[arm] = load_run_preprocessor(run_id).transform(X_arm)
+
+    test = SequentialABTest(alpha=alpha, mde=mde, min_samples=batch_size)
+    n_batches = -(-max(len(X_a), len(X_b)) // batch_size)
+
+    with mlflow.start_run(run_name=f"Sequential A/B Test: {test_id}"):
+        mlflow.set_tag("test_identifier", test_id)
+        mlflow.set_tag("ab_test", "sequential")
+        mlflow.log_params(
+            {"batch_size": batch_size, "alpha": alpha, "mde": mde, "tau": test.tau}
+        )
+
+        # The split is shuffled, so every batch is a random sample of each arm
+        for i in range(n_batches):
+            batch = slice(i * batch_size, (i + 1) * batch_size)
+            record = test.update(
+                y_a.iloc[batch].to_numpy(),
+                models["A"].predict(X["A"].iloc[batch]),
+                y_b.iloc[batch].to_numpy(),
+                models["B"].predict(X["B"].iloc[batch]),
+            )
+            mlflow.log_metrics(
+                {
+                    key: record[key]
+                    for key in ("accuracy_A", "accuracy_B", "difference", "p_value")
+                },
+                step=record["look"],
+            )
+            if test.decision is not None:
+                break
+
+        decision = test.decision or "inconclusive"
+        n_scored = test.counts["A"]["n"] + test.counts["B"]["n"]
+        fraction_scored = n_scored / (len(X_a) + len(X_b))
+        print(
+            f"Sequential A/B test {test_id}: {decision} after {record['look']}/{n_batches} batches "
+            f"({fraction_scored:.1%} of the data scored), p={test.p_value:.4g}, "
+            f"CI=[{test.ci[0]:.4f}, {test.ci[1]:.4f}]"
+        )
+
+        for arm in "AB":
+            with mlflow.start_run(nested=True, run_name=f"model_{arm}"):
+                mlflow.log_param("model_uri", model_uris[arm])
+                mlflow.log_metric("accuracy", test.accuracy(arm))
+                mlflow.log_metric("f1_score", test.f1(arm))
+                mlflow.log_metric("n_scored", test.counts[arm]["n"])
+
+        mlflow.set_tag("decision", decision)
+        mlflow.log_metric("stopping_look", record["look"])
+        mlflow.log_metric("fraction_scored", fraction_scored)
+
+        summary = {
+            "test_id": test_id,
+            "split_method": "user_id % 2",
+            "model_uri": model_uris,
+            "decision": decision,
+            "stopping_look": record["look"],
+            "n_batches": n_batches,
+            "n_scored": {arm: test.counts[arm]["n"] for arm in "AB"},
+            "fraction_scored": fraction_scored,
+            "p_value": test.p_value,
+            "confidence_interval": list(test.ci),
+            "metrics": {
+                "accuracy": {arm: test.accuracy(arm) for arm in "AB"},
+                "f1_score": {arm: test.f1(arm) for arm in "AB"},
+            },
+        }
+
+        # Private directory, concurrent runs never overwrite each other's files
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Evidence trail: the test statistics at every look
+            trail_path = os.path.join(tmp_dir, f"sequential_ab_trail_{test_id}.csv")
+            pd.DataFrame(test.trail).to_csv(trail_path, index=False)
+            mlflow.log_artifact(trail_path)
+
+            summary_path = os.path.join(tmp_dir, f"ab_test_summary_{test_id}.json")
+            with open(summary_path, "w") as f:
+                json.dump(summary, f, indent=2)
+            mlflow.log_artifact(summary_path)
+
+    return summary
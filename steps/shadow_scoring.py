@@ -0,0 +1,147 @@
+import os
+import time
+import tempfile
+import mlflow
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from zenml import step
+from scripts.data_io import FEATURE_COLUMNS
+from scripts.mlflow_utils import (
+    EXPERIMENT_NAME,
+    resolve_run_id,
+    load_model,
+    load_run_preprocessor,
+)
+
+SEGMENT_COLUMNS = ["Customer Type", "Type of Travel", "Class"]
+
+
+def _timed_predict(model, X: pd.DataFrame) -> tuple[np.ndarray, float]:
+    start = time.perf_counter()
+    predictions = model.predict(X)
+    return predictions, time.perf_counter() - start
+
+
+@step(enable_cache=False)
+def shadow_scoring_step(
+    test_df: pd.DataFrame,
+    champion_flow_version: str,
+    challenger_flow_version: str,
+    batch_size: int = 10_000,
+    segment_columns: list[str] = SEGMENT_COLUMNS,
+) -> tuple[str, np.ndarray]:
+    """Score every row with the champion and, in its shadow, the challenger.
+
+    Only the champion predictions are returned (served). Disagreement, per-segment disagreement and
+    per-model latency are aggregated batch by batch and logged to MLflow. Each model scores the
+    data encoded by its own run preprocessor, transformed once if both use the same encoding.
+    """
+    if len(test_df) == 0:
+        raise ValueError("Shadow scoring needs at least one row")
+
+    uris, models, preprocessors = {}, {}, {}
+    for role, flow_version in (
+        ("champion", champion_flow_version),
+        ("challenger", challenger_flow_version),
+    ):
+        run_id = resolve_run_id(flow_version)
+        uris[role] = f"runs:/{run_id}/model"
+        models[role] = load_model(uris[role])
+        preprocessors[role] = load_run_preprocessor(run_id)
+
+    # Both models score one shared encoded buffer when their preprocessors match. Otherwise the
+    # challenger encodes its own copy first, before the champion encodes the step's input in place
+    features = {}
+    if preprocessors["challenger"].categories != preprocessors["champion"].categories:
+        features["challenger"] = preprocessors["challenger"].transform(test_df)[
+            FEATURE_COLUMNS
+        ]
+    encoded = preprocessors["champion"].transform(test_df, copy=False)
+    features["champion"] = encoded[FEATURE_COLUMNS]
+    features.setdefault("challenger", features["champion"])
+    # Segments are reported with the champion's encoding
+    segment_values = encoded[segment_columns]
+    n_rows = len(encoded)
+
+    served = np.empty(n_rows, dtype=np.int64)
+    n_disagree = 0
+    segments = None
+    latencies = {"champion": [], "challenger": []}
+
+    mlflow.set_experiment(EXPERIMENT_NAME)
+    start = time.perf_counter()
+    with (
+        mlflow.start_run(
+            run_name=f"Shadow Test: {champion_flow_version} vs {challenger_flow_version}"
+        ),
+        ThreadPoolExecutor(max_workers=2) as executor,
+    ):
+        mlflow.set_tag("shadow_test", "true")
+        mlflow.log_param("champion_model_uri", uris["champion"])
+        mlflow.log_param("challenger_model_uri", uris["challenger"])
+        mlflow.log_param("batch_size", batch_size)
+
+        for batch_start in range(0, n_rows, batch_size):
+            # Both models score the same rows, at the same time
+            batch = slice(batch_start, batch_start + batch_size)
+            champion = executor.submit(
+                _timed_predict, models["champion"], features["champion"].iloc[batch]
+            )
+            challenger = executor.submit(
+                _timed_predict, models["challenger"], features["challenger"].iloc[batch]
+            )
+            (champion_preds, champion_time), (challenger_preds, challenger_time) = (
+                champion.result(),
+                challenger.result(),
+            )
+            served[batch] = champion_preds
+            latencies["champion"].append(champion_time)
+            latencies["challenger"].append(challenger_time)
+
+            disagree = champion_preds != challenger_preds
+            n_disagree += int(disagree.sum())
+            counts = (
+                pd.DataFrame({"n_rows": 1, "n_disagree": disagree})
+                .set_index(pd.MultiIndex.from_frame(segment_values.iloc[batch]))
+                .groupby(level=segment_columns)
+                .sum()
+            )
+            segments = (
+                counts if segments is None else segments.add(counts, fill_value=0)
+            )
+
+            n_scored = batch_start + len(champion_preds)
+            mlflow.log_metric(
+                "running_disagreement_rate", n_disagree / n_scored, step=n_scored
+            )
+
+        wall_time = time.perf_counter() - start
+        disagreement_rate = n_disagree / n_rows
+        segments["disagreement_rate"] = segments["n_disagree"] / segments["n_rows"]
+        segments = segments.reset_index()
+
+        mlflow.log_metric("disagreement_rate", disagreement_rate)
+        mlflow.log_metric("n_rows", n_rows)
+        mlflow.log_metric("wall_time_s", wall_time)
+        for role, times in latencies.items():
+            mlflow.log_metric(f"{role}_total_s", sum(times))
+            mlflow.log_metric(f"{role}_ms_per_1k_rows", sum(times) / n_rows * 1e6)
+            mlflow.log_metric(f"{role}_batch_p99_s", float(np.percentile(times, 99)))
+        # Extra wall-clock time compared to serving the champion alone
+        mlflow.log_metric("shadow_overhead_s", wall_time - sum(latencies["champion"]))
+
+        # Private directory, concurrent runs never overwrite each other's table
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, "shadow_segments.csv")
+            segments.to_csv(tmp_path, index=False)
+            mlflow.log_artifact(tmp_path)
+
+    print(
+        f"Shadow test: challenger disagrees on {disagreement_rate:.2%} of {n_rows} rows, "
+        f"wall time {wall_time:.2f}s (champion alone {sum(latencies['champion']):.2f}s)"
+    )
+    worst = segments.sort_values("disagreement_rate", ascending=False).head(3)
+    print(f"Segments with the highest disagreement:\n{worst.to_string(index=False)}")
+
+    return uris["champion"], served
@@ -1,6 +1,7 @@
 from zenml import step
 import pandas as pd
 from sklearn.utils import shuffle
+from scripts.ab_routing import group_by_arm
 
 
 @step
@@ -20,3 +21,14 @@ def split_for_ab_test(
     y_b = b_df["Satisfaction"]
 
     return X_a, X_b, y_a, y_b
+
+
+@step
+def split_for_abn_test(
+    test_df: pd.DataFrame, weights: list[float]
+) -> tuple[pd.DataFrame, pd.Series, list[int]]:
+    """Route rows to len(weights) arms by a hash of their ID.
+
+    The rows are reordered once, arm i is the block offsets[i]:offsets[i + 1] of X.
+    """
+    return group_by_arm(test_df, weights)
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import mlflow
+import pandas as pd
+from zenml import step
+from steps.train_model import TrainConfig
+from scripts.mlflow_utils import EXPERIMENT_NAME
+from scripts.successive_halving import successive_halving
+from scripts.training import train_and_log_model
+
+
+@step(enable_cache=False)
+def successive_halving_step(
+    X_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    y_train: pd.Series,
+    y_test: pd.Series,
+    configs: list[TrainConfig],
+    search_id: str,
+    flow_version: str,
+    eta: int = 3,
+    min_fraction: float | None = None,
+) -> str:
+    """Budgeted search over the configs, the winner is retrained on the full train set and registered."""
+
+    candidates = [
+        {"max_depth": config.max_depth, "n_estimators": config.n_estimators}
+        for config in configs
+    ]
+
+    mlflow.set_experiment(EXPERIMENT_NAME)
+    with mlflow.start_run(run_name=f"successive_halving_{search_id}"):
+        mlflow.set_tag("search_id", search_id)
+        mlflow.log_params(
+            {"n_candidates": len(candidates), "eta": eta, "min_fraction": min_fraction}
+        )
+
+        best, results = successive_halving(
+            X_train, y_train, candidates, eta=eta, min_fraction=min_fraction
+        )
+
+        # Compute of the search relative to training every config on all the rows
+        search_cost = results["cost"].sum()
+        exhaustive_cost = len(X_train) * sum(c["n_estimators"] for c in candidates)
+        for rung, rung_results in results.groupby("rung"):
+            mlflow.log_metric(
+                "best_val_accuracy", rung_results["val_accuracy"].max(), step=rung
+            )
+            mlflow.log_metric("n_candidates", len(rung_results), step=rung)
+        mlflow.log_metric("relative_cost", search_cost / exhaustive_cost)
+        mlflow.log_params({f"best_{key}": value for key, value in best.items()})
+
+        # Private directory, concurrent runs never overwrite each other's table
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, f"halving_{search_id}.csv")
+            results.to_csv(tmp_path, index=False)
+            mlflow.log_artifact(tmp_path)
+
+        print(
+            f"✅ Best config {best} after {results['rung'].nunique()} rungs, "
+            f"{search_cost / exhaustive_cost:.1%} of the exhaustive grid's compute"
+        )
+
+        # The winner on the full golden train set, evaluated on the test set and registered
+        with mlflow.start_run(run_name="train_model", nested=True):
+            model_uri, metrics = train_and_log_model(
+                X_train, X_test, y_train, y_test, **best, flow_version=flow_version
+            )
+        mlflow.log_metric("test_accuracy", metrics["test_accuracy"])
+
+    return model_uri
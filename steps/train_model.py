@@ -2,11 +2,10 @@ import random
 from pydantic import BaseModel
 import mlflow.entities
 from zenml import step
-import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import accuracy_score
 import mlflow
-from mlflow.models import infer_signature
+from scripts.training import train_and_log_model
+from scripts.checkpoint import ForestCheckpoint, data_fingerprint
+from scripts.feature_matrix import open_feature_matrix, schema_frame
 
 
 class TrainConfig(BaseModel):
@@ -17,10 +16,8 @@ class TrainConfig(BaseModel):
 
 @step(enable_cache=False)
 def train_model_step(
-    X_train: pd.DataFrame,
-    X_test: pd.DataFrame,
-    y_train: pd.Series,
-    y_test: pd.Series,
+    train_matrix: dict,
+    test_matrix: dict,
     config: TrainConfig,
 ) -> str:
     """ "
@@ -28,7 +25,10 @@ def train_model_step(
 
     Simulates failure scenarios for robustness:
     - Aborts if dataset is too small (<1000 records)
-    - Simulated random crash (20% chance)
+    - Simulated random crash (5% chance) after the first checkpointed chunk
+
+    Trees are grown in chunks and checkpointed, a rerun with the same config and data resumes
+    the interrupted training instead of starting over.
 
     Includes clean-up logic on failure to:
     - Remove partially written model files
@@ -36,12 +36,27 @@ def train_model_step(
     - Log actionable error messages
 
     Trained model is logged to MLflow and saved locally.
+
+    The train/test feature matrices are memory-mapped, the forest is fitted on them without copies.
     """
+    X_train, y_train = open_feature_matrix(train_matrix)
+    X_test, y_test = open_feature_matrix(test_matrix)
+
+    # Partial forests of this config and data are checkpointed, a rerun resumes from them
+    checkpoint = ForestCheckpoint(
+        {"max_depth": config.max_depth, "n_estimators": config.n_estimators},
+        data_fingerprint(X_train, y_train),
+    )
+    resumed = checkpoint.load()
 
     # Simulate different training sizes
     # Randomly select a size for the training set
     # This is just for demonstration; in practice, you would use the actual dataset size
-    train_size = random.randrange(0, len(X_train))
+    # (a resumed training keeps the size of the interrupted one)
+    if resumed is not None:
+        train_size = resumed["train_size"]
+    else:
+        train_size = random.randrange(0, len(X_train))
     X_train = X_train[:train_size]
     y_train = y_train[:train_size]
 
@@ -59,44 +74,35 @@ def train_model_step(
                     "Training aborted: dataset size is too small (< 1000 records)"
                 )
 
-            # Simulate random crash
-            if random.random() < 0.05:
-                raise RuntimeError("Simulated random crash during training")
-
-            # Train model
-            model = RandomForestClassifier(
+            # Simulate random crash, once the first chunk of trees is checkpointed so that a
+            # rerun exercises the resume path
+            crash = random.random() < 0.05
+
+            def simulate_crash(n_trees: int):
+                if crash and n_trees < config.n_estimators:
+                    raise RuntimeError(
+                        f"Simulated random crash during training ({n_trees} trees checkpointed)"
+                    )
+
+            model_uri, _ = train_and_log_model(
+                X_train,
+                X_test,
+                y_train,
+                y_test,
                 max_depth=config.max_depth,
                 n_estimators=config.n_estimators,
-                random_state=42,
-            )
-            model.fit(X_train, y_train)
-
-            # Evaluate model
-            predictions = model.predict(X_train)
-            train_accuracy = accuracy_score(y_train, predictions)
-
-            predictions = model.predict(X_test)
-            accuracy = accuracy_score(y_test, predictions)
-
-            # Log model and metrics
-            mlflow.log_param("model_type", "RandomForest")
-            mlflow.log_params(model.get_params())
-            mlflow.log_metric("train_accuracy", train_accuracy)
-            mlflow.log_metric("test_accuracy", accuracy)
-            mlflow.set_tag("flow_version", config.flow_version)
-
-            # Log model with metadata
-            logged_model = mlflow.sklearn.log_model(
-                sk_model=model,
-                artifact_path="model",
-                registered_model_name=f"{model.__class__.__name__}_{config.flow_version}",
-                signature=infer_signature(X_train, y_train),
+                flow_version=config.flow_version,
+                checkpoint=checkpoint,
+                checkpoint_state={"train_size": train_size},
+                signature_input=schema_frame(train_matrix),
+                after_chunk=simulate_crash,
             )
 
         mlflow.end_run(status=mlflow.entities.RunStatus.FINISHED)
+        checkpoint.clear()
 
         # Return the URI of the logged model
-        return logged_model.model_uri
+        return model_uri
 
     except Exception as e:
         mlflow.end_run(status=mlflow.entities.RunStatus.FAILED)
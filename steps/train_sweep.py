@@ -0,0 +1,72 @@
+import os
+import tempfile
+import mlflow
+import pandas as pd
+from zenml import step
+from steps.train_model import TrainConfig
+from scripts.mlflow_utils import EXPERIMENT_NAME
+from scripts.sweep import run_sweep
+
+
+@step(enable_cache=False)
+def train_sweep_step(
+    X_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    y_train: pd.Series,
+    y_test: pd.Series,
+    configs: list[TrainConfig],
+    sweep_id: str,
+    n_workers: int | None = None,
+) -> str:
+    """Train all candidate configs in parallel as nested runs of one sweep run, returns the best model URI."""
+
+    mlflow.set_experiment(EXPERIMENT_NAME)
+    with mlflow.start_run(run_name=f"sweep_{sweep_id}") as parent_run:
+        mlflow.set_tag("sweep_id", sweep_id)
+        mlflow.log_param("n_candidates", len(configs))
+
+        results = run_sweep(
+            X_train,
+            X_test,
+            y_train,
+            y_test,
+            [config.model_dump() for config in configs],
+            parent_run.info.run_id,
+            n_workers=n_workers,
+        )
+
+        # Private directory, concurrent runs never overwrite each other's table
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, f"sweep_{sweep_id}.csv")
+            results.to_csv(tmp_path, index=False)
+            mlflow.log_artifact(tmp_path)
+
+        if "error" in results:
+            failed = results[results["error"].notna()]
+            print(
+                f"⚠️ {len(failed)} candidates failed:\n{failed.to_string(index=False)}"
+            )
+            results = results[results["error"].isna()]
+        if results.empty:
+            raise RuntimeError(
+                f"All {len(configs)} candidates of sweep {sweep_id} failed"
+            )
+
+        best = results.loc[results["test_accuracy"].idxmax()]
+        mlflow.set_tag("best_flow_version", best["flow_version"])
+        mlflow.log_metric("best_test_accuracy", best["test_accuracy"])
+
+    print(
+        results.sort_values("test_accuracy", ascending=False)[
+            [
+                "flow_version",
+                "max_depth",
+                "n_estimators",
+                "train_accuracy",
+                "test_accuracy",
+            ]
+        ].to_string(index=False)
+    )
+    print(f"✅ Best candidate: {best['flow_version']} ({best['model_uri']})")
+
+    return best["model_uri"]
@@ -0,0 +1,173 @@
+import os
+import tempfile
+import mlflow
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from pandas.tseries.frequencies import to_offset
+from zenml import step
+from scripts.data_io import ID_COLUMN, TARGET_COLUMN
+from scripts.mlflow_utils import EXPERIMENT_NAME
+from scripts.reference_profile import dataset_drift
+
+# The reference profile is sent once to every worker process instead of with every window
+_worker_profile = None
+
+
+def _init_worker(reference_profile: dict):
+    global _worker_profile
+    _worker_profile = reference_profile
+
+
+def _window_drift(window: pd.DataFrame) -> dict:
+    return dataset_drift(_worker_profile, window)
+
+
+def check_window_args(
+    window_size: int | None,
+    time_column: str | None,
+    window_freq: str | None,
+    timestamps_path: str | None,
+):
+    """Raise if the windowing arguments don't describe either count or time-based windows."""
+    if time_column is None:
+        if window_freq is not None or timestamps_path is not None:
+            raise ValueError("window_freq and timestamps_path need a time_column")
+        if window_size is None or window_size <= 0:
+            raise ValueError("Count-based windows need a positive window_size")
+        return
+    if window_freq is None:
+        raise ValueError(f"Time-based windows on {time_column} need a window_freq")
+    to_offset(window_freq)
+    if timestamps_path is None:
+        raise ValueError(
+            f"The processed splits have no {time_column} column, time-based windows need "
+            f"a timestamps_path with {ID_COLUMN} and {time_column}"
+        )
+
+
+def attach_time_column(
+    df: pd.DataFrame, time_column: str, timestamps_path: str
+) -> pd.DataFrame:
+    """Join the time column of a CSV/Feather file of (ID, time) onto the data by ID."""
+    columns = [ID_COLUMN, time_column]
+    if timestamps_path.endswith(".feather"):
+        times = pd.read_feather(timestamps_path, columns=columns)
+    else:
+        times = pd.read_csv(timestamps_path, usecols=columns)
+    times[time_column] = pd.to_datetime(times[time_column])
+
+    df = df.merge(times, on=ID_COLUMN, how="left", validate="one_to_one")
+    n_missing = int(df[time_column].isna().sum())
+    if n_missing:
+        raise ValueError(f"{n_missing} rows have no {time_column} in {timestamps_path}")
+    return df
+
+
+def split_windows(
+    df: pd.DataFrame,
+    window_size: int | None = None,
+    time_column: str | None = None,
+    window_freq: str | None = None,
+) -> list[tuple[str, str, pd.DataFrame]]:
+    """Split the data into (start, end, window) tuples, by time if a time column is given, else by count.
+
+    Count-based windows follow the passenger ID order, the closest thing to arrival order we have.
+    """
+    if time_column is not None:
+        grouped = df.groupby(pd.Grouper(key=time_column, freq=window_freq))
+        return [
+            (str(start), str(start + to_offset(window_freq)), w)
+            for start, w in grouped
+            if len(w) > 0
+        ]
+
+    df = df.sort_values(ID_COLUMN)
+    return [
+        (str(w[ID_COLUMN].iloc[0]), str(w[ID_COLUMN].iloc[-1]), w)
+        for w in (
+            df.iloc[start : start + window_size]
+            for start in range(0, len(df), window_size)
+        )
+    ]
+
+
+@step(enable_cache=False)
+def windowed_drift_step(
+    reference_profile: dict,
+    unseen_data: pd.DataFrame,
+    window_size: int | None = 5000,
+    time_column: str | None = None,
+    window_freq: str | None = None,
+    max_workers: int | None = None,
+    timestamps_path: str | None = None,
+) -> pd.DataFrame:
+    """Score drift for every window of the unseen data in parallel and log a per-window, per-feature table.
+
+    Time-based windows need a time_column, a window_freq and a timestamps_path file of (ID, time),
+    as the processed splits have no time column.
+    """
+    check_window_args(window_size, time_column, window_freq, timestamps_path)
+    if time_column is not None:
+        unseen_data = attach_time_column(unseen_data, time_column, timestamps_path)
+
+    windows = split_windows(unseen_data, window_size, time_column, window_freq)
+    features = [
+        w.drop(columns=[ID_COLUMN, TARGET_COLUMN, time_column], errors="ignore")
+        for _, _, w in windows
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(reference_profile,),
+    ) as executor:
+        results = list(executor.map(_window_drift, features))
+
+    rows = []
+    for i, ((start, end, window), drift) in enumerate(zip(windows, results)):
+        dataset_drifted = any(t["status"] != "SUCCESS" for t in drift["tests"])
+        for feature, result in drift["features"].items():
+            rows.append(
+                {
+                    "window": i,
+                    "start": start,
+                    "end": end,
+                    "n_rows": len(window),
+                    "feature": feature,
+                    "stattest": result["stattest"],
+                    "score": result["score"],
+                    "threshold": result["threshold"],
+                    "detected": result["detected"],
+                    "share_drifted": drift["share_drifted"],
+                    "dataset_drift": dataset_drifted,
+                }
+            )
+    table = pd.DataFrame(rows)
+
+    drifted_windows = sorted(table.loc[table["dataset_drift"], "window"].unique())
+    if drifted_windows:
+        first = table[table["window"] == drifted_windows[0]].iloc[0]
+        print(
+            f"Dataset drift detected in {len(drifted_windows)}/{len(windows)} windows, "
+            f"starting at window {first['window']} ({first['start']} - {first['end']})"
+        )
+    else:
+        print(f"No dataset drift detected in {len(windows)} windows")
+
+    mlflow.set_experiment(EXPERIMENT_NAME)
+    with mlflow.start_run(run_name="windowed_drift_monitoring"):
+        mlflow.set_tag("drift_monitoring", "windowed")
+        mlflow.log_param("n_windows", len(windows))
+        mlflow.log_param("window_size", window_size)
+        mlflow.log_param("time_column", time_column)
+        mlflow.log_param("window_freq", window_freq)
+        mlflow.log_param("timestamps_path", timestamps_path)
+        mlflow.log_metric("n_drifted_windows", len(drifted_windows))
+
+        # Private directory, concurrent runs never overwrite each other's table
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, "windowed_drift.csv")
+            table.to_csv(tmp_path, index=False)
+            mlflow.log_artifact(tmp_path)
+
+    return table
@@ -0,0 +1,43 @@
+from pipelines.sweep_pipeline import sweep_pipeline
+from steps.train_model import TrainConfig
+import argparse
+import itertools
+import json
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sweep_id", type=str, required=True)
+    parser.add_argument(
+        "--max_depth", type=int, nargs="+", default=[5, 10], help="Grid values"
+    )
+    parser.add_argument(
+        "--n_estimators", type=int, nargs="+", default=[100, 200], help="Grid values"
+    )
+    parser.add_argument(
+        "--configs",
+        type=str,
+        default=None,
+        help="JSON file with a list of configs ({max_depth, n_estimators}) instead of the grid",
+    )
+    parser.add_argument("--n_workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.configs is not None:
+        with open(args.configs) as f:
+            candidates = json.load(f)
+    else:
+        candidates = [
+            {"max_depth": max_depth, "n_estimators": n_estimators}
+            for max_depth, n_estimators in itertools.product(
+                args.max_depth, args.n_estimators
+            )
+        ]
+
+    # Every candidate is its own flow version, so it can be used by the other pipelines
+    configs = [
+        TrainConfig(**candidate, flow_version=f"{args.sweep_id}_c{i}")
+        for i, candidate in enumerate(candidates)
+    ]
+    print(f"Running sweep {args.sweep_id} with {len(configs)} candidates")
+
+    sweep_pipeline(configs=configs, sweep_id=args.sweep_id, n_workers=args.n_workers)
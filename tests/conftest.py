@@ -0,0 +1,49 @@
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+
+# The modules are imported from the repository root, like the pipeline scripts do
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scripts.data_io import SATISFACTION_COLUMNS  # noqa: E402
+
+
+def make_raw_data(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """Synthetic export with the columns and value ranges of the raw airline CSV."""
+    rng = np.random.default_rng(seed)
+    arrival_delay = rng.integers(0, 200, n_rows).astype(float)
+    arrival_delay[rng.random(n_rows) < 0.01] = np.nan
+    df = pd.DataFrame(
+        {
+            "ID": np.arange(1, n_rows + 1),
+            "Gender": rng.choice(["Female", "Male"], n_rows),
+            "Age": rng.integers(7, 86, n_rows),
+            "Customer Type": rng.choice(["First-time", "Returning"], n_rows),
+            "Type of Travel": rng.choice(["Business", "Personal"], n_rows),
+            "Class": rng.choice(["Business", "Economy", "Economy Plus"], n_rows),
+            "Flight Distance": rng.integers(30, 5000, n_rows),
+            "Departure Delay": rng.integers(0, 200, n_rows),
+            "Arrival Delay": arrival_delay,
+        }
+    )
+    for col in SATISFACTION_COLUMNS:
+        df[col] = rng.integers(0, 6, n_rows)
+    df["Satisfaction"] = rng.choice(["Satisfied", "Neutral or Dissatisfied"], n_rows)
+    return df
+
+
+def make_arm(n: int, accuracy: float, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Labels and predictions with the given share of correct predictions."""
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(0, 2, n)
+    wrong = rng.random(n) >= accuracy
+    return labels, np.where(wrong, 1 - labels, labels)
+
+
+@pytest.fixture
+def raw_csv(tmp_path) -> Path:
+    path = tmp_path / "airline_passenger_satisfaction.csv"
+    make_raw_data(5000).to_csv(path, index=False)
+    return path
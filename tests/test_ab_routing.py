@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scripts.ab_routing import group_by_arm, route_by_hash
+from scripts.data_io import ID_COLUMN, TARGET_COLUMN
+
+
+@pytest.mark.parametrize("weights", [[1, 1], [0.5, 0.25, 0.25], [0.7, 0.2, 0.1]])
+def test_route_by_hash_follows_the_weights(weights):
+    arms = route_by_hash(np.arange(100_000), weights)
+    shares = np.bincount(arms, minlength=len(weights)) / len(arms)
+    np.testing.assert_allclose(shares, np.array(weights) / sum(weights), atol=0.01)
+
+
+def test_route_by_hash_is_stable():
+    ids = np.arange(10_000)
+    arms = route_by_hash(ids, [0.5, 0.25, 0.25])
+    # Same arm whatever the order or the batch the IDs come in
+    shuffled = np.random.default_rng(0).permutation(ids)
+    np.testing.assert_array_equal(
+        route_by_hash(shuffled, [0.5, 0.25, 0.25]), arms[shuffled]
+    )
+    np.testing.assert_array_equal(
+        route_by_hash(ids[:100], [0.5, 0.25, 0.25]), arms[:100]
+    )
+    # Scaling the weights doesn't move anyone
+    np.testing.assert_array_equal(route_by_hash(ids, [2, 1, 1]), arms)
+
+
+def test_group_by_arm_offsets():
+    weights = [0.5, 0.3, 0.2]
+    df = pd.DataFrame(
+        {ID_COLUMN: np.arange(5000), "Age": np.arange(5000) % 80, TARGET_COLUMN: 1}
+    )
+    X, y, offsets = group_by_arm(df, weights)
+    arms = route_by_hash(df[ID_COLUMN], weights)
+
+    assert offsets[0] == 0 and offsets[-1] == len(df)
+    assert np.diff(offsets).tolist() == np.bincount(arms).tolist()
+    assert list(X.columns) == ["Age"]
+    assert y.index.equals(X.index)
+    # Every block holds exactly the rows of its arm, in their original order
+    for i in range(len(weights)):
+        block = X.iloc[offsets[i] : offsets[i + 1]]
+        expected = df.index[arms == i]
+        assert block.index.equals(expected)
+
+
+def test_group_by_arm_empty_arm():
+    df = pd.DataFrame({ID_COLUMN: np.arange(100), TARGET_COLUMN: 0})
+    _, _, offsets = group_by_arm(df, [1, 0])
+    assert offsets == [0, 100, 100]
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from conftest import make_arm
+from scripts.ab_stats import bootstrap_ab_metrics, confusion_counts, metrics_from_counts
+
+
+def test_metrics_from_counts():
+    counts = confusion_counts([1, 1, 0, 0, 1], [1, 0, 0, 1, 1])
+    np.testing.assert_array_equal(counts, [2, 1, 1, 1])
+    metrics = metrics_from_counts(counts)
+    assert metrics["accuracy"] == pytest.approx(3 / 5)
+    assert metrics["f1_score"] == pytest.approx(4 / 6)
+
+
+def test_bootstrap_detects_a_clear_difference():
+    results = bootstrap_ab_metrics(*make_arm(2000, 0.9, 0), *make_arm(2000, 0.7, 1))
+    accuracy = results["metrics"]["accuracy"]
+    low, high = accuracy["difference"]["confidence_interval"]
+
+    assert 0 < low < 0.2 < high
+    assert accuracy["difference"]["p_value"] < 0.01
+    assert accuracy["A"][0] > accuracy["B"][1]
+
+
+def test_bootstrap_identical_arms_are_not_different():
+    labels, preds = make_arm(2000, 0.8, 0)
+    results = bootstrap_ab_metrics(labels, preds, labels, preds, n_resamples=2000)
+    for metric in results["metrics"].values():
+        low, high = metric["difference"]["confidence_interval"]
+        assert low < 0 < high
+        assert metric["difference"]["p_value"] > 0.05
+
+
+def test_bootstrap_rejects_an_empty_arm():
+    labels, preds = make_arm(100, 0.8, 0)
+    with pytest.raises(ValueError, match="arm B"):
+        bootstrap_ab_metrics(labels, preds, [], [])
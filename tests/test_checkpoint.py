@@ -0,0 +1,70 @@
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+from scripts.checkpoint import ForestCheckpoint, data_fingerprint, fit_with_checkpoints
+
+PARAMS = {"n_estimators": 60, "max_depth": 6, "random_state": 42}
+
+
+class Crash(Exception):
+    pass
+
+
+@pytest.fixture
+def data():
+    X, y = make_classification(n_samples=500, n_features=8, random_state=0)
+    return pd.DataFrame(X, columns=[f"f{i}" for i in range(8)]), pd.Series(y, name="y")
+
+
+def crash_at(n_crash: int):
+    def after_chunk(n_trees: int):
+        if n_trees == n_crash:
+            raise Crash(f"crashed after {n_trees} trees")
+
+    return after_chunk
+
+
+def test_resumed_fit_matches_single_fit(data, tmp_path):
+    X, y = data
+    fingerprint = data_fingerprint(X, y)
+    single = RandomForestClassifier(**PARAMS).fit(X, y)
+
+    checkpoint = ForestCheckpoint(PARAMS, fingerprint, tmp_path)
+    with pytest.raises(Crash):
+        fit_with_checkpoints(
+            RandomForestClassifier(**PARAMS),
+            X,
+            y,
+            checkpoint,
+            chunk_size=25,
+            after_chunk=crash_at(25),
+        )
+    # The partial forest is on disk
+    assert len(joblib.load(checkpoint.path)["model"].estimators_) == 25
+
+    # A new run with the same params and data picks up the saved partial forest
+    resumed = fit_with_checkpoints(
+        RandomForestClassifier(**PARAMS),
+        X,
+        y,
+        ForestCheckpoint(PARAMS, fingerprint, tmp_path),
+        chunk_size=25,
+    )
+    assert len(resumed.estimators_) == PARAMS["n_estimators"]
+    assert not resumed.warm_start
+    np.testing.assert_array_equal(resumed.predict_proba(X), single.predict_proba(X))
+
+
+def test_checkpoint_key_depends_on_params_and_data(data, tmp_path):
+    X, y = data
+    fingerprint = data_fingerprint(X, y)
+    key = ForestCheckpoint(PARAMS, fingerprint, tmp_path).key
+
+    assert ForestCheckpoint(dict(PARAMS), fingerprint, tmp_path).key == key
+    assert (
+        ForestCheckpoint({**PARAMS, "max_depth": 7}, fingerprint, tmp_path).key != key
+    )
+    assert ForestCheckpoint(PARAMS, data_fingerprint(X, 1 - y), tmp_path).key != key
@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+from scripts.compiled_forest import CompiledForest
+
+
+def test_compiled_forest_matches_sklearn(tmp_path):
+    X, y = make_classification(n_samples=800, n_features=10, random_state=1)
+    X = pd.DataFrame(X, columns=[f"f{i}" for i in range(10)])
+    model = RandomForestClassifier(n_estimators=30, random_state=0).fit(X, y)
+
+    compiled = CompiledForest.from_sklearn(model)
+    np.testing.assert_array_equal(compiled.predict_proba(X), model.predict_proba(X))
+    np.testing.assert_array_equal(compiled.predict(X), model.predict(X))
+
+    # Same predictions after a save/load round trip
+    loaded = CompiledForest.load(compiled.save(tmp_path / "forest.npz"))
+    np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from conftest import make_raw_data
+from scripts.data_io import (
+    PROCESSED_SCHEMA,
+    enforce_schema,
+    load_split,
+    save_split,
+)
+from scripts.preprocessing import AirlinePreprocessor
+
+
+@pytest.fixture
+def processed() -> pd.DataFrame:
+    return AirlinePreprocessor().fit_transform(make_raw_data(500))
+
+
+def test_processed_frames_have_the_schema_dtypes(processed):
+    assert list(processed.columns) == PROCESSED_SCHEMA.names
+    for field in PROCESSED_SCHEMA:
+        assert processed[field.name].dtype == np.dtype(field.type.to_pandas_dtype())
+
+
+def test_enforce_schema_leaves_processed_data_unchanged(processed):
+    assert enforce_schema(processed, copy=False) is processed
+    copied = enforce_schema(processed)
+    assert copied is not processed
+    pd.testing.assert_frame_equal(copied, processed)
+
+
+def test_enforce_schema_casts_wide_dtypes(processed):
+    wide = processed.astype("int64").astype({"Arrival Delay": "float64"})
+    pd.testing.assert_frame_equal(enforce_schema(wide), processed)
+
+
+def test_enforce_schema_rejects_raw_data():
+    raw = make_raw_data(100)
+    with pytest.raises((pa.ArrowInvalid, pa.ArrowTypeError)):
+        enforce_schema(raw)
+
+
+def test_enforce_schema_rejects_values_out_of_range(processed):
+    processed = processed.astype({"Age": "int64"})
+    processed.loc[processed.index[0], "Age"] = 300
+    with pytest.raises(pa.ArrowInvalid):
+        enforce_schema(processed)
+
+
+def test_enforce_schema_rejects_missing_integers(processed):
+    processed = processed.astype({"Age": "float64"})
+    processed.loc[processed.index[0], "Age"] = np.nan
+    with pytest.raises(ValueError, match="Age"):
+        enforce_schema(processed)
+
+
+def test_split_round_trip(processed, tmp_path):
+    save_split(processed, "golden_set", tmp_path)
+    pd.testing.assert_frame_equal(
+        load_split("golden_set", data_dir=tmp_path), processed.reset_index(drop=True)
+    )
+    columns = ["ID", "Age"]
+    loaded = load_split("golden_set", columns=columns, data_dir=tmp_path)
+    assert list(loaded.columns) == columns
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from data_manager import AirlineDataManager, GOLDEN_FRACTION, GOLDEN_TEST_SIZE
+from scripts.data_io import load_split
+
+
+def run_splits(raw_csv, output_dir, chunksize=None) -> dict:
+    AirlineDataManager(raw_csv, output_dir=output_dir, chunksize=chunksize).run_all()
+    return {
+        name: load_split(name, data_dir=output_dir)
+        for name in ("golden_train", "golden_test", "golden_set", "current_set")
+    }
+
+
+@pytest.mark.parametrize("chunksize", [None, 700])
+def test_splits_are_disjoint_and_complete(raw_csv, tmp_path, chunksize):
+    splits = run_splits(raw_csv, tmp_path / "processed", chunksize)
+    golden, current = set(splits["golden_set"]["ID"]), set(splits["current_set"]["ID"])
+    train, test = set(splits["golden_train"]["ID"]), set(splits["golden_test"]["ID"])
+
+    assert not golden & current
+    assert len(golden | current) == 5000
+    assert not train & test
+    assert train | test == golden
+
+
+def test_streaming_matches_in_memory_sizes(raw_csv, tmp_path):
+    in_memory = run_splits(raw_csv, tmp_path / "in_memory")
+    streamed = run_splits(raw_csv, tmp_path / "streamed", chunksize=700)
+
+    # Same edge cases and the same golden quota in both modes
+    for name in ("golden_set", "current_set"):
+        assert len(streamed[name]) == len(in_memory[name])
+    assert len(streamed["golden_set"]) >= int(5000 * GOLDEN_FRACTION)
+    n_test = len(streamed["golden_test"])
+    assert n_test == pytest.approx(
+        len(streamed["golden_set"]) * GOLDEN_TEST_SIZE, abs=1
+    )
+
+    # Both modes encode the categories with the same codes and dtypes
+    assert streamed["golden_set"].dtypes.equals(in_memory["golden_set"].dtypes)
+    for col in ("Gender", "Class"):
+        assert set(streamed["current_set"][col]) == set(in_memory["current_set"][col])
+
+
+def test_quotas_are_proportional_and_exact():
+    counts = np.array([50, 30, 20, 0])
+    quotas = AirlineDataManager._allocate_quotas(counts, 11)
+    assert quotas.sum() == 11
+    assert np.all(quotas <= counts)
+    np.testing.assert_array_equal(quotas, [6, 3, 2, 0])
+
+
+def test_quotas_without_regular_rows_are_zero():
+    quotas = AirlineDataManager._allocate_quotas(np.zeros(4, dtype=np.int64), 0)
+    np.testing.assert_array_equal(quotas, np.zeros(4))
@@ -0,0 +1,65 @@
+import os
+import pytest
+import scripts.dataset_registry as dataset_registry
+from conftest import make_raw_data
+from scripts.data_io import save_split, split_path
+from scripts.dataset_registry import (
+    load_registry,
+    register_splits,
+    split_fingerprint,
+    splits_fingerprint,
+)
+from scripts.preprocessing import AirlinePreprocessor
+
+
+@pytest.fixture
+def processed():
+    return AirlinePreprocessor().fit_transform(make_raw_data(1000))
+
+
+@pytest.fixture
+def data_dir(tmp_path, processed):
+    save_split(processed, "golden_set", tmp_path)
+    save_split(processed.iloc[:500], "current_set", tmp_path)
+    register_splits(["golden_set", "current_set"], tmp_path)
+    return tmp_path
+
+
+def test_registry_entries(data_dir):
+    entry = load_registry(data_dir)["golden_set"]
+    assert entry["num_rows"] == 1000
+    assert entry["schema"]["Age"] == "int8"
+    assert entry["size"] == split_path("golden_set", data_dir).stat().st_size
+
+
+def test_fingerprint_survives_a_touch(data_dir):
+    fingerprint = split_fingerprint("golden_set", data_dir)
+    path = split_path("golden_set", data_dir)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    # Re-hashed because the mtime changed, but the content and so the fingerprint didn't
+    assert split_fingerprint("golden_set", data_dir) == fingerprint
+    assert load_registry(data_dir)["golden_set"]["mtime_ns"] == path.stat().st_mtime_ns
+
+
+def test_fingerprint_changes_with_the_content(data_dir, processed):
+    fingerprint = split_fingerprint("golden_set", data_dir)
+    combined = splits_fingerprint(["golden_set", "current_set"], data_dir)
+
+    changed = processed.copy()
+    changed.loc[changed.index[0], "Age"] += 1
+    save_split(changed, "golden_set", data_dir)
+
+    assert split_fingerprint("golden_set", data_dir) != fingerprint
+    assert splits_fingerprint(["golden_set", "current_set"], data_dir) != combined
+
+
+def test_unchanged_files_are_not_rehashed(data_dir, monkeypatch):
+    fingerprint = split_fingerprint("golden_set", data_dir)
+
+    def fail(path):
+        raise AssertionError(f"{path} was re-hashed")
+
+    monkeypatch.setattr(dataset_registry, "_file_hash", fail)
+    assert split_fingerprint("golden_set", data_dir) == fingerprint
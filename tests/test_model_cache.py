@@ -0,0 +1,79 @@
+import mlflow
+import mlflow.artifacts
+import mlflow.pyfunc
+import pytest
+from types import SimpleNamespace
+import scripts.mlflow_utils as mlflow_utils
+from scripts.mlflow_utils import ModelCache, model_run_id, split_model_uri
+
+# Model sizes on disk, per run id
+SIZES = {"a": 400, "b": 300, "c": 200}
+
+
+@pytest.fixture
+def loads(tmp_path, monkeypatch) -> list[str]:
+    """Fake artifact store: a run's model is a directory holding SIZES[run] bytes."""
+    loaded = []
+
+    def download_artifacts(model_uri):
+        run_id, _ = split_model_uri(model_uri)
+        path = tmp_path / run_id
+        path.mkdir(exist_ok=True)
+        (path / "model.pkl").write_bytes(b"\0" * SIZES[run_id])
+        return str(path)
+
+    def load_model(local_path):
+        loaded.append(local_path.rsplit("/", 1)[-1])
+        return SimpleNamespace(path=local_path)
+
+    monkeypatch.setattr(mlflow.artifacts, "download_artifacts", download_artifacts)
+    monkeypatch.setattr(mlflow.pyfunc, "load_model", load_model)
+    return loaded
+
+
+def test_cached_models_are_loaded_once(loads):
+    cache = ModelCache(max_bytes=1000)
+    first = cache.load("runs:/a/model")
+    assert cache.load("runs:/a/model") is first
+    assert loads == ["a"]
+    assert cache.total_bytes == SIZES["a"]
+
+
+def test_least_recently_used_models_are_evicted_by_size(loads):
+    cache = ModelCache(max_bytes=750)
+    cache.load("runs:/a/model")
+    cache.load("runs:/b/model")
+    cache.load("runs:/a/model")  # a is now the most recently used
+    cache.load("runs:/c/model")  # 900 bytes: b goes
+
+    assert cache.total_bytes == SIZES["a"] + SIZES["c"]
+    cache.load("runs:/a/model")
+    assert loads == ["a", "b", "c"]
+    cache.load("runs:/b/model")  # reloaded, c is now the least recently used and goes
+    assert loads == ["a", "b", "c", "b"]
+    assert cache.total_bytes == SIZES["a"] + SIZES["b"]
+
+
+def test_a_model_larger_than_the_cache_is_kept_alone(loads):
+    cache = ModelCache(max_bytes=100)
+    cache.load("runs:/b/model")
+    cache.load("runs:/a/model")
+    assert cache.total_bytes == SIZES["a"]
+    cache.load("runs:/a/model")
+    assert loads == ["b", "a"]
+
+
+def test_registry_uris_share_the_run_entry(loads, monkeypatch):
+    version = SimpleNamespace(source="runs:/a/model", run_id="a")
+    monkeypatch.setattr(mlflow_utils, "_model_version", lambda name, v: version)
+    cache = ModelCache()
+    cache.load("runs:/a/model")
+    cache.load("models:/RandomForestClassifier_v1/3")
+    assert loads == ["a"]
+    assert model_run_id("models:/RandomForestClassifier_v1/3") == "a"
+
+
+def test_model_run_id_of_unknown_uris():
+    assert split_model_uri("runs:/abc/compiled_model") == ("abc", "compiled_model")
+    with pytest.raises(ValueError):
+        model_run_id("models:/m-0123456789")
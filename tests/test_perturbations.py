@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import make_raw_data
+from scripts.data_io import FEATURE_COLUMNS, SATISFACTION_COLUMNS, TARGET_COLUMN
+from scripts.perturbations import (
+    MAX_RATING,
+    SCENARIOS,
+    SEVERITIES,
+    build_perturbed_batch,
+    degradation_curve,
+)
+from scripts.preprocessing import AirlinePreprocessor
+
+
+@pytest.fixture
+def processed() -> pd.DataFrame:
+    return AirlinePreprocessor().fit_transform(make_raw_data(1000))
+
+
+def test_stacked_batch_shape_and_dtypes(processed):
+    X = processed[FEATURE_COLUMNS]
+    stacked, grid = build_perturbed_batch(X)
+
+    assert len(grid) == len(SCENARIOS) * len(SEVERITIES)
+    assert stacked.shape == (len(grid) * len(X), X.shape[1])
+    assert stacked.dtypes.equals(X.dtypes)
+    assert not stacked.isna().any().any()
+    assert list(grid.columns) == ["scenario", "severity"]
+
+
+def test_rating_flip_keeps_ratings_in_range(processed):
+    X = processed[FEATURE_COLUMNS]
+    stacked, grid = build_perturbed_batch(X, ["rating_flip"], [1.0])
+    before = X[SATISFACTION_COLUMNS].to_numpy()
+    after = stacked[SATISFACTION_COLUMNS].to_numpy()
+
+    # At severity 1 every 1-5 rating is mirrored, 0 ("not applicable") is kept
+    np.testing.assert_array_equal(
+        after, np.where(before == 0, 0, 1 + MAX_RATING - before)
+    )
+    assert after.min() >= 0 and after.max() <= MAX_RATING
+    # The other features are left as they are
+    others = [col for col in FEATURE_COLUMNS if col not in SATISFACTION_COLUMNS]
+    pd.testing.assert_frame_equal(stacked[others], X[others].reset_index(drop=True))
+
+
+def test_perturbed_integers_stay_within_their_dtype(processed):
+    X = processed[FEATURE_COLUMNS]
+    stacked, _ = build_perturbed_batch(X, ["gaussian_noise", "delay_inflation"])
+    for col, dtype in X.dtypes.items():
+        if pd.api.types.is_integer_dtype(dtype):
+            assert stacked[col].min() >= 0
+            assert stacked[col].max() <= np.iinfo(dtype).max
+
+
+def test_batch_depends_on_the_seed(processed):
+    X = processed[FEATURE_COLUMNS]
+    first, _ = build_perturbed_batch(X, ["gaussian_noise"], [0.5], random_state=1)
+    again, _ = build_perturbed_batch(X, ["gaussian_noise"], [0.5], random_state=1)
+    other, _ = build_perturbed_batch(X, ["gaussian_noise"], [0.5], random_state=2)
+    pd.testing.assert_frame_equal(first, again)
+    assert not first.equals(other)
+
+
+def test_degradation_curve(processed):
+    y = processed[TARGET_COLUMN].to_numpy()
+    grid = pd.DataFrame({"scenario": ["s", "s"], "severity": [0.5, 1.0]})
+    predictions = np.concatenate([y, 1 - y])
+    curve = degradation_curve(predictions, y, grid)
+    np.testing.assert_allclose(curve["accuracy"], [1.0, 0.0])
+    np.testing.assert_allclose(curve["f1_score"], [1.0, 0.0])
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import make_raw_data
+from scripts.data_io import FEATURE_COLUMNS
+from scripts.preprocessing import AirlinePreprocessor
+from scripts.reference_profile import (
+    DRIFT_THRESHOLD,
+    approximate_dataset_drift,
+    build_reference_profile,
+    dataset_drift,
+    merge_reference_profiles,
+)
+
+
+@pytest.fixture
+def features():
+    return AirlinePreprocessor().fit_transform(make_raw_data(20_000))[FEATURE_COLUMNS]
+
+
+def test_merged_profile_matches_the_profile_of_all_rows(features):
+    first, batch = features.iloc[:14_000], features.iloc[14_000:]
+    merged = merge_reference_profiles(build_reference_profile(first), batch)
+    full = build_reference_profile(features)
+
+    assert merged["n_rows"] == len(features)
+    for col, expected in full["columns"].items():
+        column = merged["columns"][col]
+        assert column["type"] == expected["type"]
+        if expected["type"] == "numerical":
+            assert column["std"] == pytest.approx(expected["std"], rel=1e-3)
+            distance = np.abs(
+                np.subtract(column["quantiles"], expected["quantiles"])
+            ).mean()
+            assert distance / expected["std"] < 0.01
+        else:
+            for key, share in expected["frequencies"].items():
+                assert column["frequencies"][key] == pytest.approx(share)
+    assert dataset_drift(merged, features)["n_drifted"] == 0
+
+
+def test_merged_profile_includes_a_shifted_batch(features):
+    first, batch = features.iloc[:10_000], features.iloc[10_000:].copy()
+    batch["Flight Distance"] += 3000
+    profile = build_reference_profile(first)
+    merged = merge_reference_profiles(profile, batch)
+
+    # Data like the whole history drifts from the old reference, not from the extended one
+    history = pd.concat([first, batch])
+    assert dataset_drift(profile, history)["features"]["Flight Distance"]["detected"]
+    assert not dataset_drift(merged, history)["features"]["Flight Distance"]["detected"]
+
+
+def test_identical_data_has_no_drift(features):
+    drift = dataset_drift(build_reference_profile(features), features)
+    assert drift["n_drifted"] == 0
+    for result in drift["features"].values():
+        assert result["score"] == pytest.approx(0, abs=1e-3)
+    assert all(test["status"] == "SUCCESS" for test in drift["tests"])
+
+
+def test_shifted_column_drifts(features):
+    profile = build_reference_profile(features)
+    shifted = features.assign(**{"Flight Distance": features["Flight Distance"] + 2000})
+    one_gender = features.assign(Gender=1)
+
+    distance = dataset_drift(profile, shifted)["features"]["Flight Distance"]
+    # Wasserstein distance of a pure shift, normed by the std
+    assert distance["score"] == pytest.approx(
+        2000 / profile["columns"]["Flight Distance"]["std"], rel=1e-3
+    )
+    assert distance["detected"]
+
+    gender = dataset_drift(profile, one_gender)["features"]["Gender"]
+    assert gender["stattest"] == "jensenshannon"
+    assert gender["detected"]
+
+
+def test_approximate_drift_falls_back_to_exact_on_borderline_columns(features):
+    profile = build_reference_profile(features)
+    std = profile["columns"]["Flight Distance"]["std"]
+    # Shifted by the drift threshold: the sampled score is too close to call
+    current = features.assign(
+        **{"Flight Distance": features["Flight Distance"] + DRIFT_THRESHOLD * std}
+    )
+
+    drift = approximate_dataset_drift(profile, current, sample_size=2000)
+    exact = dataset_drift(profile, current)
+
+    assert drift["sample_size"] == 2000
+    borderline = drift["features"]["Flight Distance"]
+    assert borderline["exact"]
+    assert borderline["score"] == exact["features"]["Flight Distance"]["score"]
+    assert drift["n_exact_fallbacks"] >= 1
+
+    # Clear-cut columns keep their sampled score and its bootstrap error
+    clear = drift["features"]["Seat Comfort"]
+    assert not clear["exact"] and not clear["detected"]
+    assert clear["standard_error"] > 0
+    low, high = clear["confidence_interval"]
+    assert low < clear["score"] < high < DRIFT_THRESHOLD
+
+
+def test_approximate_drift_on_small_data_is_exact(features):
+    profile = build_reference_profile(features)
+    small = features.iloc[:500]
+    assert approximate_dataset_drift(profile, small, sample_size=1000) == (
+        dataset_drift(profile, small)
+    )
+
+
+def test_approximate_drift_agrees_with_exact_decisions(features):
+    profile = build_reference_profile(features)
+    shifted = features.assign(**{"Flight Distance": features["Flight Distance"] + 2000})
+    drift = approximate_dataset_drift(
+        profile, shifted, sample_size=2000, stratify_by=["Class"]
+    )
+    exact = dataset_drift(profile, shifted)
+    for col, result in exact["features"].items():
+        assert drift["features"][col]["detected"] == result["detected"]
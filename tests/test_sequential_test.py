@@ -0,0 +1,37 @@
+from conftest import make_arm
+from scripts.sequential_test import SequentialABTest
+
+
+def run_sequential(accuracy_a: float, accuracy_b: float, n_looks: int = 50):
+    test = SequentialABTest(alpha=0.05, mde=0.05, min_samples=500)
+    for look in range(n_looks):
+        test.update(
+            *make_arm(500, accuracy_a, 2 * look),
+            *make_arm(500, accuracy_b, 2 * look + 1)
+        )
+        if test.decision is not None:
+            break
+    return test
+
+
+def test_sequential_test_stops_on_the_better_arm():
+    test = run_sequential(0.7, 0.85)
+    assert test.decision == "B"
+    assert test.p_value <= 0.05
+    assert test.ci[0] > 0
+    # A large effect is detected long before the data runs out
+    assert len(test.trail) < 10
+
+    assert run_sequential(0.85, 0.7).decision == "A"
+
+
+def test_sequential_test_equal_arms_never_pick_a_winner():
+    test = run_sequential(0.8, 0.8)
+    assert test.decision in (None, "futility")
+    assert test.p_value > 0.05
+
+
+def test_sequential_test_waits_for_min_samples():
+    test = SequentialABTest(alpha=0.05, mde=0.05, min_samples=1000)
+    test.update(*make_arm(500, 0.5, 0), *make_arm(500, 1.0, 1))
+    assert test.decision is None
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import make_raw_data
+from scripts.preprocessing import AirlinePreprocessor
+from scripts.validation import VALUE_RANGES, profile_dataset, run_checks
+
+
+@pytest.fixture
+def reference() -> pd.DataFrame:
+    return AirlinePreprocessor().fit_transform(make_raw_data(2000, seed=0))
+
+
+@pytest.fixture
+def current(reference) -> pd.DataFrame:
+    """A current set with missing values, duplicates, a constant column and out-of-range values."""
+    df = AirlinePreprocessor().fit_transform(make_raw_data(2000, seed=1))
+    df = df.astype({"Arrival Delay": "float64", "Age": "int64"})
+    df.loc[df.index[:300], "Arrival Delay"] = np.nan
+    df.loc[df.index[300:310], "Arrival Delay"] = np.inf
+    df = pd.concat([df, df.iloc[:50]], ignore_index=True)
+    df["Gender"] = 1
+    df.loc[df.index[:5], "Age"] = 150
+    df["Copy of Age"] = df["Age"]
+    return df
+
+
+def test_profile_matches_pandas(current):
+    profile = profile_dataset(current)
+    missing = current.isna() | current.isin([np.inf, -np.inf])
+
+    assert (profile["n_rows"], profile["n_columns"]) == current.shape
+    assert profile["n_missing"] == missing.sum().sum()
+    assert profile["n_columns_with_missing"] == missing.any().sum()
+    assert profile["n_rows_with_missing"] == missing.any(axis=1).sum()
+    assert profile["n_different_missing"] == 2
+    assert profile["n_constant_columns"] == (current.nunique() == 1).sum()
+    assert profile["n_duplicated_rows"] == current.duplicated().sum()
+    assert profile["n_duplicated_columns"] == current.T.duplicated().sum()
+    for col, left, right in VALUE_RANGES:
+        outside = (current[col] < left) | (current[col] > right)
+        assert profile["out_of_range"][col] == outside.sum()
+    assert profile["out_of_range"]["Age"] >= 5
+
+
+def test_checks_pass_on_similar_data(reference):
+    other = AirlinePreprocessor().fit_transform(make_raw_data(2000, seed=1))
+    # The synthetic data has ages under 18 and short flights, the range checks are left out
+    results = run_checks(profile_dataset(reference, []), profile_dataset(other, []))
+    assert [r for r in results if r["status"] != "SUCCESS"] == []
+
+
+def test_checks_fail_on_broken_data(reference, current):
+    results = run_checks(profile_dataset(reference), profile_dataset(current))
+    failed = {r["name"] for r in results if r["status"] != "SUCCESS"}
+    for name in (
+        "Number of Columns",
+        "Number of Missing Values",
+        "Number of Different Missing Values",
+        "Number of Constant Columns",
+        "Number of Duplicated Rows",
+        "Number of Duplicated Columns",
+        "Columns Type",
+        "Value Range: Age",
+    ):
+        assert name in failed
+
+
+@pytest.mark.parametrize("broken", [False, True])
+def test_fused_checks_match_evidently(reference, current, broken):
+    test_suite = pytest.importorskip("evidently.test_suite")
+    tests = pytest.importorskip("evidently.tests")
+    if not broken:
+        current = AirlinePreprocessor().fit_transform(make_raw_data(2000, seed=1))
+
+    fused = run_checks(profile_dataset(reference), profile_dataset(current))
+
+    # Same integrity tests, in the same order, as the evidently backend of data_validation_step
+    integrity = test_suite.TestSuite(
+        tests=[
+            tests.TestNumberOfColumns(),
+            tests.TestNumberOfMissingValues(),
+            tests.TestShareOfMissingValues(),
+            tests.TestNumberOfColumnsWithMissingValues(),
+            tests.TestNumberOfRowsWithMissingValues(),
+            tests.TestShareOfColumnsWithMissingValues(),
+            tests.TestShareOfRowsWithMissingValues(),
+            tests.TestNumberOfDifferentMissingValues(),
+            tests.TestNumberOfConstantColumns(),
+            tests.TestNumberOfEmptyRows(),
+            tests.TestNumberOfEmptyColumns(),
+            tests.TestNumberOfDuplicatedRows(),
+            tests.TestNumberOfDuplicatedColumns(),
+            tests.TestColumnsType(),
+        ]
+    )
+    integrity.run(reference_data=reference, current_data=current)
+    expected = [result["status"] for result in integrity.as_dict()["tests"]]
+
+    for col, left, right in VALUE_RANGES:
+        suite = test_suite.TestSuite(
+            tests=[tests.TestValueRange(column_name=col, left=left, right=right)]
+        )
+        suite.run(reference_data=reference, current_data=current)
+        expected.append(suite.as_dict()["tests"][0]["status"])
+
+    assert [result["status"] for result in fused] == expected